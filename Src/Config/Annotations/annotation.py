@@ -6,13 +6,28 @@ from typing import Callable
 class Annotation(ABC):
     BASE_WIDTH = 256
     field_id: str | int
+    # Названия аргументов функций dpg, которые уже были разобраны в allowed_kwargs
+    __allowed_kwargs: dict[Callable, frozenset[str]] = {}
+
+
+    @classmethod
+    def allowed_kwargs(cls, func: Callable) -> frozenset[str]:
+        '''
+        Названия аргументов, которые принимает функция (для контекстных менеджеров dpg - и обёрнутая функция).
+        Аннотации разбираются один раз для каждой функции.
+        '''
+        allowed = cls.__allowed_kwargs.get(func)
+        if allowed is None:
+            annotations = func.__annotations__ | getattr(getattr(func, '__wrapped__', None), '__annotations__', {})
+            allowed = cls.__allowed_kwargs[func] = frozenset(annotations) - {'return'}
+
+        return allowed
 
 
     @classmethod
     def check_kwargs(cls, func: Callable, kwargs: dict):
-        annotations = func.__annotations__ | getattr(getattr(func, '__wrapped__', None), '__annotations__', {})
-        union_annotations = dict([(key, kwargs[key]) for key in kwargs if key in annotations])
-        return union_annotations
+        allowed = cls.allowed_kwargs(func)
+        return {key: value for key, value in kwargs.items() if key in allowed}
     
 
     @staticmethod
@@ -28,4 +43,20 @@ class Annotation(ABC):
     @staticmethod
     @abstractmethod
     def set(input_id: str| int, value) -> bool: pass
+
+
+    @staticmethod
+    def dump(value):
+        '''
+        Преобразовать значение из get в значение, которое можно сохранить в JSON.
+        '''
+        return value
+
+
+    @staticmethod
+    def load(value):
+        '''
+        Преобразовать значение из JSON в значение, которое принимает set.
+        '''
+        return value
     
\ No newline at end of file
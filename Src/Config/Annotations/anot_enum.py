@@ -63,4 +63,8 @@ class AEnum(Annotation):
             return False
 
         dpg.set_value(input_id, value.value)
-        return True
\ No newline at end of file
+        return True
+
+
+    def load(self, value: str) -> enum.Enum:
+        return self.source(value)
\ No newline at end of file
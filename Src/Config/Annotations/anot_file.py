@@ -11,15 +11,17 @@ class AFile(Annotation):
 
     @staticmethod
     def build(*args, **kwargs):
+        callback = kwargs.get('callback') or (lambda: None)
         kwargs = Annotation.check_kwargs(dpg.node_attribute, kwargs)
         browser_id = dpg.generate_uuid()
         group_id = dpg.generate_uuid()
 
+        def select_files(_, appdata):
+            dpg.set_item_user_data(group_id, list(map(Path, appdata['selections'].values())))
+            callback()
+
         with dpg.file_dialog(directory_selector=False, show=False, modal=True, \
-                              width=1400 ,height=800, tag=browser_id, 
-                              callback=lambda _, appdata: 
-                                dpg.set_item_user_data(group_id, 
-                                        list(map(Path, appdata['selections'].values())))):
+                              width=1400 ,height=800, tag=browser_id, callback=select_files):
             dpg.add_file_extension(".*")
 
         with dpg.group(*args, **kwargs, tag=group_id, user_data=None) as item:
@@ -45,3 +47,13 @@ class AFile(Annotation):
         
         dpg.set_item_user_data(input_id, value)
         return True
+
+
+    @staticmethod
+    def dump(value: list[Path] | None) -> list[str] | None:
+        return [str(path) for path in value] if value else None
+
+
+    @staticmethod
+    def load(value: list[str] | None) -> list[Path] | None:
+        return [Path(path) for path in value] if value else None
@@ -5,6 +5,7 @@ import dearpygui.dearpygui as dpg
 from Src.Config.Annotations.annotation import Annotation
 from Src.Config.Annotations.single import Single
 from Src.Enums import DPGType
+from Src.Utils import ThemeRegistry
 
 
 
@@ -21,11 +22,16 @@ class ANode(Annotation):
 
 
     def build(self, parent: int | str, *args, **kwargs):
-        if DPGType(dpg.get_item_type(parent)) != DPGType.NODE_ATTRIBUTE:
-            raise Exception(f"Incompatable parent {dpg.get_item_type(parent)} must be mvAppItemType::mvNodeAttribute")
+        parent_type = DPGType(dpg.get_item_type(parent))
+        if parent_type == DPGType.NODE_ATTRIBUTE:
+            # Атрибут заменяется новым, с нужным типом (вход или выход)
+            new_parent = dpg.get_item_parent(parent)
+            dpg.delete_item(parent)
+        elif parent_type == DPGType.NODE:
+            new_parent = parent
+        else:
+            raise Exception(f"Incompatable parent {dpg.get_item_type(parent)} must be mvAppItemType::mvNodeAttribute or mvAppItemType::mvNode")
 
-        new_parent = dpg.get_item_parent(parent)
-        dpg.delete_item(parent)
         kwargs = Annotation.check_kwargs(dpg.node_attribute, kwargs)
         kwargs['parent']  = new_parent
         kwargs['user_data'] = []
@@ -36,19 +42,7 @@ class ANode(Annotation):
             input_id = dpg.add_text(kwargs.get('label'), label=kwargs.get('label'))
 
         if hasattr(self.node_type, 'color'):
-            with dpg.theme() as attr_theme:
-                with dpg.theme_component(dpg.mvNodeAttribute):
-                    dpg.add_theme_color(dpg.mvNodeCol_Pin, 
-                                        getattr(self.node_type, 'color'), 
-                                        category=dpg.mvThemeCat_Nodes)
-                    dpg.add_theme_color(dpg.mvNodeCol_PinHovered, 
-                                        [min(color * 1.2, 255) for color in getattr(self.node_type, 'color')],
-                                        category=dpg.mvThemeCat_Nodes)
-                    dpg.add_theme_color(dpg.mvNodeCol_Link, 
-                                        getattr(self.node_type, 'color'), 
-                                        category=dpg.mvThemeCat_Nodes)
-                    
-            dpg.bind_item_theme(attr, attr_theme)
+            dpg.bind_item_theme(attr, ThemeRegistry.port(getattr(self.node_type, 'color')))
 
         return input_id
     
@@ -27,6 +27,7 @@ class ASequence(Annotation):
         
 
     def build(self, *args, **kwargs):
+        callback = kwargs.get('callback')
         kwargs = Annotation.check_kwargs(dpg.group, kwargs)
         kwargs['width'] = self.__calc_width(kwargs.get('width', Annotation.BASE_WIDTH))
         with dpg.group(horizontal=True, *args, **kwargs) as item:
@@ -34,7 +35,7 @@ class ASequence(Annotation):
                 if hint not in (ABoolean, AFloat, AInteger, AString):
                     raise Exception("Sequence annotations must be only Boolean, Float, Intege or String!")
                 
-                hint.build(parent=item)
+                hint.build(parent=item, callback=callback)
 
             # Если отсутсвует label, то создаст пустой текст
             dpg.add_text(kwargs.get('label') or '')
@@ -64,4 +65,8 @@ class ASequence(Annotation):
                 return False
 
         return True
+
+
+    def load(self, value: list) -> tuple:
+        return tuple(value)
     
\ No newline at end of file
@@ -1,2 +1,3 @@
 from Src.Config.node_annotation import NodeAnnotation
-from Src.Config.parameter import Parameter
\ No newline at end of file
+from Src.Config.parameter import Parameter
+from Src.Config.node_index import NodeIndex
\ No newline at end of file
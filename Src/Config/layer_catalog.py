@@ -0,0 +1,210 @@
+import inspect
+import json
+import os
+from importlib.metadata import version
+from pathlib import Path
+
+import Src.Enums as enums
+from Src.Enums import AttrType
+from Src.Nodes import LayerNode
+from Src.Config.parameter import Parameter
+from Src.Config.node_annotation import NodeAnnotation
+from Src.Config.Annotations import Annotation, AInteger, AFloat, ABoolean, AString, AEnum, ASequence
+from Src.Utils import LazyModule
+
+
+layers = LazyModule("keras.layers")
+
+
+
+class LayerCatalog:
+    '''
+    Каталог слоёв Keras, собранный по конструкторам классов из keras.layers. Параметр конструктора
+    превращается в аннотацию по типу значения по умолчанию (int, float, bool, str, кортеж чисел),
+    по названию (activation, padding - AEnum), а обязательные параметры - по таблице REQUIRED.
+    Слой, у которого есть обязательный параметр неизвестного типа, в каталог не попадает.
+
+    Разобранные конструкторы сохраняются в JSON рядом с версией Keras, поэтому при следующих запусках
+    keras.layers не разбирается заново и даже не импортируется: версия берётся из метаданных пакета,
+    а ноды ссылаются на слои по названию.
+
+    Attributes:
+        directory: Path - папка с файлами каталога
+    '''
+    DIRECTORY = Path(".cache") / "catalog"
+    VERSION = 1
+    ANCHOR = "Keras layers"
+    HINTS: dict[str, Annotation] = {"int": AInteger, "float": AFloat, "bool": ABoolean, "str": AString}
+    ENUMS: dict[str, str] = {"activation": "Activations", "padding": "Padding"}
+    REQUIRED: dict[str, str] = {
+        "units": "int", "filters": "int", "kernel_size": "int", "pool_size": "int", "output_size": "int",
+        "height": "int", "width": "int", "n": "int", "input_dim": "int", "output_dim": "int",
+        "num_heads": "int", "key_dim": "int", "head_dim": "int", "num_query_heads": "int",
+        "num_key_value_heads": "int", "num_bins": "int", "axes": "int", "max_number": "int",
+        "rate": "float", "stddev": "float", "factor": "float", "scale": "float",
+        "height_factor": "float", "width_factor": "float",
+    }
+    # Обёртки, ячейки рекуррентных слоёв и служебные слои не являются самостоятельными слоями графа
+    EXCLUDE = {"Layer", "InputLayer", "Lambda", "Pipeline"}
+    directory: Path
+
+
+    def __init__(self, directory: str | Path = None):
+        self.directory = Path(directory or self.DIRECTORY)
+
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"layers-{version('keras')}-{self.VERSION}.json"
+
+
+    def metadata(self) -> list[dict]:
+        '''
+        Описание слоёв из файла каталога, если его нет - разобрать keras.layers и сохранить.
+
+        Returns:
+            list[dict] - слои: name, section, docs и parameters (name, kind, default, items или enum)
+        '''
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            pass
+
+        metadata = self.introspect()
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp, "w", encoding="utf-8") as file:
+                json.dump(metadata, file, ensure_ascii=False)
+            os.replace(temp, self.path)
+        except OSError:
+            # Без записи на диск каталог просто разберётся заново при следующем запуске
+            pass
+
+        return metadata
+
+
+    @classmethod
+    def introspect(cls) -> list[dict]:
+        '''
+        Разобрать конструкторы слоёв из keras.layers. Псевдонимы (AvgPool2D и т.п.) пропускаются.
+        '''
+        metadata = []
+
+        for name in sorted(dir(layers.module)):
+            layer = getattr(layers, name)
+            if not inspect.isclass(layer) or not issubclass(layer, layers.Layer) or \
+                layer.__name__ != name or name in cls.EXCLUDE or name.endswith("Cell"):
+                continue
+
+            # keras.src.layers.<раздел>.<модуль>
+            module = layer.__module__.split(".")
+            if len(module) < 5 or module[2] != "layers": continue
+
+            parameters = cls.parameters(layer)
+            if parameters is None: continue
+
+            docs = (inspect.getdoc(layer) or "").split("\n\n")[0]
+            metadata.append({"name": name,
+                             "section": module[-2].replace("_", " ").capitalize(),
+                             "docs": docs,
+                             "parameters": parameters})
+
+        return metadata
+
+
+    @classmethod
+    def parameters(cls, layer: type) -> list[dict] | None:
+        '''
+        Параметры конструктора слоя, которые можно задать в ноде.
+
+        Returns:
+            list[dict] | None - параметры, либо None, если обязательный параметр задать нельзя
+        '''
+        parameters = []
+
+        for parameter in list(inspect.signature(layer.__init__).parameters.values())[1:]:
+            if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD): continue
+
+            required = parameter.default is inspect.Parameter.empty
+            default = None if required else parameter.default
+            description = cls.describe(parameter.name, default)
+
+            if description is None and required:
+                if parameter.name not in cls.REQUIRED: return None
+                description = {"kind": cls.REQUIRED[parameter.name]}
+
+            if description is not None:
+                parameters.append({"name": parameter.name, "default": default} | description)
+
+        return parameters
+
+
+    @classmethod
+    def describe(cls, name: str, default: object) -> dict | None:
+        '''
+        Тип параметра по названию и значению по умолчанию, None - если параметр нельзя задать в ноде.
+        '''
+        if name in cls.ENUMS and (default is None or isinstance(default, str)):
+            enum = getattr(enums, cls.ENUMS[name])
+            if default is None or default in [member.value for member in enum]:
+                return {"kind": "enum", "enum": cls.ENUMS[name]}
+
+        if isinstance(default, (tuple, list)) and default and \
+            all(type(item) in (int, float, bool) for item in default):
+            return {"kind": "sequence", "items": [type(item).__name__ for item in default]}
+
+        if type(default).__name__ in cls.HINTS:
+            return {"kind": type(default).__name__}
+
+        return None
+
+
+    def node_list(self, exclude: set[str] = frozenset()) -> dict[str, list[NodeAnnotation]]:
+        '''
+        Ноды слоёв по разделам для node_list.
+
+        Args:
+            exclude: set[str] - названия слоёв, для которых уже есть ноды
+
+        Returns:
+            dict[str, list[NodeAnnotation]] - ноды по разделам
+        '''
+        sections = {}
+
+        for layer in self.metadata():
+            if layer["name"] in exclude: continue
+
+            annotations = {parameter["name"]: self.parameter(parameter) for parameter in layer["parameters"]}
+            sections.setdefault(layer["section"], []).append(
+                NodeAnnotation(
+                    label=layer["name"],
+                    node_type=LayerNode,
+                    logic=LayerNode.layer(layer["name"]),
+                    annotations=annotations,
+                    docs=layer["docs"],
+                    input=LayerNode
+                )
+            )
+
+        return dict(sorted(sections.items()))
+
+
+    @classmethod
+    def parameter(cls, parameter: dict) -> Parameter:
+        '''
+        Parameter ноды по описанию параметра из каталога.
+        '''
+        default = parameter.get("default")
+
+        match parameter["kind"]:
+            case "enum":
+                enum = getattr(enums, parameter["enum"])
+                return Parameter(AttrType.INPUT, AEnum[enum], enum(default) if default else None)
+            case "sequence":
+                hint = ASequence[tuple(cls.HINTS[item] for item in parameter["items"])]
+                return Parameter(AttrType.INPUT, hint, tuple(default))
+            case kind:
+                return Parameter(AttrType.INPUT, cls.HINTS[kind], default)
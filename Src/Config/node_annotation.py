@@ -5,6 +5,7 @@ import inspect
 from Src.Config.parameter import Parameter
 from Src.Config.Annotations import ANode
 from Src.Enums import AttrType
+from Src.Utils import LazyFunction
 
 
 class NodeAnnotation:
@@ -12,7 +13,6 @@ class NodeAnnotation:
     node_type: type
     logic: Callable
     annotations: dict[str, Parameter]
-    docs: str = None
     input: Parameter | bool
     output: Parameter | bool
 
@@ -25,8 +25,7 @@ class NodeAnnotation:
         self.logic = logic
         self.annotations = annotations
 
-        self.docs = docs
-        if not self.docs: self.docs = inspect.getdoc(self.logic)
+        self.__docs = docs
 
         self.input = input
         if self.input: 
@@ -38,6 +37,22 @@ class NodeAnnotation:
         if self.output: self.output = Parameter(AttrType.OUTPUT, ANode[self.output])
 
 
+    @property
+    def docs(self) -> str | None:
+        # Документация logic читается при первом обращении: для функций keras (LazyFunction)
+        # это импортирует keras, который не нужен, пока ноду не построят или не найдут в поиске
+        if not self.__docs: self.__docs = inspect.getdoc(self.logic)
+        return self.__docs
+
+
+    @property
+    def docs_ready(self) -> bool:
+        '''
+        Документацию можно прочитать, не импортируя модуль функции logic.
+        '''
+        return bool(self.__docs) or not isinstance(self.logic, LazyFunction) or self.logic.module.loaded
+
+
     @property
     def kwargs(self):
         return {'annotations': self.annotations,
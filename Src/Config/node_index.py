@@ -0,0 +1,148 @@
+from bisect import bisect_left
+import re
+
+from Src.Config.node_annotation import NodeAnnotation
+
+
+
+class NodeIndex:
+    '''
+    Поисковый индекс по нодам каталога: по названию, разделам и документации.
+    Слово из запроса ищется как префикс слов ноды, если ничего не нашлось - нечётко,
+    как подпоследовательность букв названия. Индекс строится при первом поиске.
+
+    Документация функций keras (LazyFunction) импортирует keras, поэтому, пока он не загружен,
+    такие ноды ищутся только по названию и разделам, а их документация добавляется в индекс
+    при первом поиске после загрузки keras.
+
+    Attributes:
+        nodes: list[NodeAnnotation] - ноды в порядке node_list
+        sections: list[tuple[str, str]] - раздел и подраздел каждой ноды
+    '''
+    # Совпадение в названии важнее совпадения в разделе, а раздел важнее документации
+    LABEL_WEIGHT = 4
+    SECTION_WEIGHT = 2
+    DOCS_WEIGHT = 1
+    nodes: list[NodeAnnotation]
+    sections: list[tuple[str, str]]
+    __words: list[str] = None
+    __postings: dict[str, dict[int, int]]
+    __pending: list[int]
+
+
+    def __init__(self, node_list: dict[str, dict[str, list[NodeAnnotation]]]):
+        self.nodes = []
+        self.sections = []
+
+        for anchor, subanchors in node_list.items():
+            for subanchor, nodes in subanchors.items():
+                self.nodes += nodes
+                self.sections += [(anchor, subanchor)] * len(nodes)
+
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+    @staticmethod
+    def tokenize(text: str | None) -> list[str]:
+        return re.findall(r"\w+", text.lower()) if text else []
+
+
+    def search(self, query: str, limit: int = None) -> list[NodeAnnotation]:
+        '''
+        Найти ноды по запросу.
+
+        Args:
+            query: str - запрос, слова через пробел (все слова должны найтись)
+            limit: int - максимальное колличество результатов
+
+        Returns:
+            list[NodeAnnotation] - ноды, от наиболее подходящей
+        '''
+        terms = self.tokenize(query)
+        if not terms: return []
+        if self.__words is None: self.__build()
+        elif self.__pending: self.__add_docs()
+
+        scores = None
+        for term in terms:
+            term_scores = self.__match(term)
+            scores = term_scores if scores is None else \
+                     {index: score + term_scores[index] for index, score in scores.items() if index in term_scores}
+
+        if not scores: scores = self.__fuzzy("".join(terms))
+
+        found = sorted(scores, key=lambda index: (-scores[index], self.nodes[index].label.lower()))
+        return [self.nodes[index] for index in found[:limit]]
+
+
+    def __build(self):
+        self.__postings = {}
+        self.__pending = []
+
+        for index, node in enumerate(self.nodes):
+            self.__add(index, self.LABEL_WEIGHT, node.label)
+            self.__add(index, self.SECTION_WEIGHT, " ".join(self.sections[index]))
+
+            if node.docs_ready: self.__add(index, self.DOCS_WEIGHT, node.docs)
+            else: self.__pending.append(index)
+
+        self.__words = sorted(self.__postings)
+
+
+    def __add_docs(self):
+        '''
+        Добавить документацию нод, которая стала доступна без импорта.
+        '''
+        ready = [index for index in self.__pending if self.nodes[index].docs_ready]
+        if not ready: return
+
+        for index in ready: self.__add(index, self.DOCS_WEIGHT, self.nodes[index].docs)
+        self.__pending = [index for index in self.__pending if index not in ready]
+        self.__words = sorted(self.__postings)
+
+
+    def __add(self, index: int, weight: int, text: str | None):
+        for word in self.tokenize(text):
+            postings = self.__postings.setdefault(word, {})
+            postings[index] = max(weight, postings.get(index, 0))
+
+
+    def __match(self, term: str) -> dict[int, int]:
+        '''
+        Ноды, в которых есть слово, начинающееся с term, с весом лучшего совпадения.
+        Полное совпадение слова весит больше, чем совпадение префикса.
+        '''
+        scores = {}
+        position = bisect_left(self.__words, term)
+
+        while position < len(self.__words) and self.__words[position].startswith(term):
+            word = self.__words[position]
+            for index, weight in self.__postings[word].items():
+                score = 2 * weight + (word == term)
+                if score > scores.get(index, 0): scores[index] = score
+            position += 1
+
+        return scores
+
+
+    def __fuzzy(self, term: str) -> dict[int, float]:
+        '''
+        Ноды, в названии которых буквы term идут по порядку. Чем ближе к началу названия
+        заканчивается совпадение, тем выше вес.
+        '''
+        scores = {}
+
+        for index, node in enumerate(self.nodes):
+            label = node.label.lower()
+            start = position = label.find(term[0])
+
+            for char in term[1:]:
+                if position < 0: break
+                position = label.find(char, position + 1)
+
+            if start >= 0 and position >= 0:
+                scores[index] = len(term) / (position + 1)
+
+        return scores
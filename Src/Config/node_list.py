@@ -1,16 +1,19 @@
 import numpy as np
 
-from keras import layers
-import keras
-
 from Src.Enums import *
 from Src.Nodes import *
 from Src.Config.parameter import Parameter
 from Src.Config.node_annotation import NodeAnnotation
+from Src.Config.layer_catalog import LayerCatalog
 from Src.Config.Annotations import *
+from Src.Utils import LazyModule
+
 
+# keras загружает TensorFlow, поэтому слои и функции указываются так, чтобы он импортировался при сборке
+keras = LazyModule("keras")
 
-# TODO Сделать сериализацию в JSON?
+
+# Ноды сохраняются в файл графа по label (см. GraphFile), поэтому label должен быть уникальным
 node_list = {
     "Data & Preprocessing":
     {
@@ -25,6 +28,7 @@ node_list = {
                         "delimiter": Parameter(AttrType.INPUT, AEnum[Delimiters]),
                         "skip_header": Parameter(AttrType.INPUT, ABoolean),
                         "skip_footer": Parameter(AttrType.INPUT, ABoolean),
+                        "dtype": Parameter(AttrType.INPUT, AEnum[DataTypes]),
                         "shape": Parameter(AttrType.OUTPUT, 
                                            ASequence[AInteger, AInteger, AInteger],
                                            backfield=ShapeNode.shape)  
@@ -38,7 +42,13 @@ node_list = {
                 logic = ImageDataNode.open_data,
                 annotations = {
                         "files": Parameter(AttrType.INPUT, AFile),
+                        "directory": Parameter(AttrType.INPUT, AString),
                         "color_mode": Parameter(AttrType.INPUT, AEnum[ColorMode]),
+                        "size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger]),
+                        "labels": Parameter(AttrType.INPUT, ABoolean),
+                        "stream": Parameter(AttrType.INPUT, ABoolean),
+                        "batch_size": Parameter(AttrType.INPUT, AInteger, default=32),
+                        "cache": Parameter(AttrType.INPUT, ABoolean),
                         "shape": Parameter(AttrType.OUTPUT, ASequence[AInteger, AInteger, AInteger])
                         },
                 input=False,
@@ -49,7 +59,7 @@ node_list = {
             NodeAnnotation(
                 label="to categorical",
                 node_type= DataNode,
-                logic = keras.utils.to_categorical,
+                logic = keras.function("utils.to_categorical"),
                 annotations = {
                         "num_classes": Parameter(AttrType.INPUT, AInteger)
                     },
@@ -64,7 +74,7 @@ node_list = {
             NodeAnnotation(
                 label= "Dense",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Dense),
+                logic = LayerNode.layer("Dense"),
                 annotations = {
                         "units": Parameter(AttrType.INPUT, AInteger),
                         "activation": Parameter(AttrType.INPUT, AEnum[Activations]),
@@ -78,7 +88,7 @@ node_list = {
             NodeAnnotation(
                 label= "Conv2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Conv2D),
+                logic = LayerNode.layer("Conv2D"),
                 annotations = {
                         "filters": Parameter(AttrType.INPUT, AInteger),
                         "kernel_size": Parameter(AttrType.INPUT, AInteger),
@@ -92,7 +102,7 @@ node_list = {
             NodeAnnotation(
                 label= "MaxPooling2D",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.MaxPooling2D),
+                logic = LayerNode.layer("MaxPooling2D"),
                 annotations = {
                         "pool_size": Parameter(AttrType.INPUT, ASequence[AInteger, AInteger]),
                         "strides": Parameter(AttrType.INPUT, AInteger),
@@ -105,19 +115,19 @@ node_list = {
             NodeAnnotation(
                 label="Concatenate",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Concatenate),
+                logic = LayerNode.layer("Concatenate"),
                 input=LayerNode
             ),
             NodeAnnotation(
                 label="Flatten",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Flatten),
+                logic = LayerNode.layer("Flatten"),
                 input=LayerNode
             ),
             NodeAnnotation(
                 label="Add",
                 node_type= LayerNode,
-                logic = LayerNode.layer(layers.Add),
+                logic = LayerNode.layer("Add"),
                 input=LayerNode
             )
         ]
@@ -131,6 +141,8 @@ node_list = {
                 annotations = {
                         "optimizer": Parameter(AttrType.INPUT, AEnum[Optimizers]),
                         "loss": Parameter(AttrType.INPUT, AEnum[Losses]),
+                        "transfer_weights": Parameter(AttrType.INPUT, ABoolean, default=True),
+                        "freeze_transferred": Parameter(AttrType.INPUT, ABoolean, default=False),
                         # "metrics": MetricNode
                     },
                 input=LayerNode
@@ -161,7 +173,7 @@ node_list = {
             NodeAnnotation(
                 label="Save model",
                 node_type= UtilsNode,
-                logic = keras.saving.save_model,
+                logic = keras.function("saving.save_model"),
                 annotations = {
                         "model": Parameter(AttrType.INPUT, ANode[Single[FitNode]]),
                         "filepath": Parameter(AttrType.INPUT, AString)
@@ -172,7 +184,7 @@ node_list = {
             NodeAnnotation(
                 label="Plot model",
                 node_type= UtilsNode,
-                logic = keras.utils.plot_model,
+                logic = keras.function("utils.plot_model"),
                 annotations = {
                         "model": Parameter(AttrType.INPUT, ANode[Single[CompileNode]]),
                         "to_file": Parameter(AttrType.INPUT, AString),
@@ -203,10 +215,13 @@ node_list = {
             NodeAnnotation(
                 label="Save data",
                 node_type = UtilsNode,
-                logic = np.savetxt,
+                logic = UtilsNode.save_data,
                 annotations = {
                     "X": Parameter(AttrType.INPUT, ANode[Single[DataNode]]),
-                    "fname": Parameter(AttrType.INPUT, AString, default='result.txt')
+                    "fname": Parameter(AttrType.INPUT, AString, default='result.txt'),
+                    "delimiter": Parameter(AttrType.INPUT, AEnum[Delimiters]),
+                    "compressed": Parameter(AttrType.INPUT, ABoolean),
+                    "background": Parameter(AttrType.INPUT, ABoolean)
                 },
                 input = False,
                 output = False
@@ -225,3 +240,8 @@ node_list = {
         ]
     }
 }
+
+# Остальные слои Keras собираются по их конструкторам, слои с ручными нодами пропускаются
+node_list[LayerCatalog.ANCHOR] = LayerCatalog().node_list(
+    {node.label for anchor in node_list.values() for nodes in anchor.values() for node in nodes}
+)
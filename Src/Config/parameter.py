@@ -25,16 +25,19 @@ class Parameter:
         attribute_type =  dpg.mvNode_Attr_Output if self.attr_type == AttrType.OUTPUT else dpg.mvNode_Attr_Static
         attribute_kwargs = Annotation.check_kwargs(dpg.node_attribute, kwargs)
 
-        with dpg.node_attribute(*args, **attribute_kwargs, attribute_type=attribute_type) as attr:
-            kwargs['parent'] = attr
-            kwargs['width'] = Annotation.BASE_WIDTH
-
-            if (isinstance(self.hint, ANode) or self.hint is ANode) and \
-                attribute_type == dpg.mvNode_Attr_Output: 
-                kwargs['attribute_type'] = dpg.mvNode_Attr_Output
-            if self.attr_type != AttrType.INPUT: kwargs['enabled'] = False
+        kwargs['width'] = Annotation.BASE_WIDTH
+        if self.attr_type != AttrType.INPUT: kwargs['enabled'] = False
 
+        if isinstance(self.hint, ANode) or self.hint is ANode:
+            # ANode сам создаёт атрибут-вход или выход прямо в ноде
+            if attribute_type == dpg.mvNode_Attr_Output: kwargs['attribute_type'] = dpg.mvNode_Attr_Output
             input_id = self.hint.build(*args, **kwargs)
+        else:
+            with dpg.node_attribute(*args, **attribute_kwargs, attribute_type=attribute_type) as attr:
+                kwargs['parent'] = attr
+                input_id = self.hint.build(*args, **kwargs)
+
+        attr = dpg.get_item_parent(input_id)
 
         if isinstance(self.backfield, Backfield): 
             self.backfield.callback = lambda x: self.hint.set(input_id, x)
@@ -0,0 +1,15 @@
+from Src.Data.table_loader import TableLoader
+from Src.Data.array_cache import ArrayCache
+from Src.Data.image_loader import ImageLoader
+from Src.Data.image_cache import ImageShardCache, ImageShards
+from Src.Data.number_format import NumberFormat
+from Src.Data.data_writer import DataWriter
+
+
+def __getattr__(name: str):
+    # ImageStream наследуется от keras.utils.PyDataset, поэтому импортируется только когда нужен
+    if name == "ImageStream":
+        from Src.Data.image_stream import ImageStream
+        return ImageStream
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import threading
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+
+
+class ArrayCache:
+    '''
+    Кэш прочитанных данных на диске. Массив сохраняется в .npy файл, имя которого зависит
+    от путей к исходным файлам, их размера, времени изменения и параметров чтения. При повторном
+    чтении массив открывается через np.load(mmap_mode='r'), поэтому ноды, читающие один и тот же
+    файл, делят одни и те же страницы памяти. Для одних и тех же файлов и параметров хранится только
+    последний массив: после изменения файла старая копия удаляется при сохранении новой.
+
+    Attributes:
+        directory: Path - папка, в которой хранятся .npy файлы
+    '''
+    DIRECTORY = Path(".cache") / "data"
+    VERSION = 1
+    directory: Path
+
+
+    def __init__(self, directory: str | Path = None):
+        self.directory = Path(directory or self.DIRECTORY)
+
+
+    def key(self, files: str | Path | Iterable[str | Path], **options) -> str | None:
+        '''
+        Ключ кэша для файлов и параметров их чтения: "<файлы и параметры>-<размер и время изменения>".
+
+        Returns:
+            str | None - ключ, либо None, если какого-то файла нет
+        '''
+        paths = [files] if isinstance(files, (str, Path)) else list(files)
+        source = hashlib.sha1(f"{self.VERSION}".encode())
+        state = hashlib.sha1()
+
+        for path in paths:
+            try: stat = os.stat(path)
+            except OSError: return None
+            source.update(f"{Path(path).resolve()}\n".encode())
+            state.update(f"{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+
+        source.update(repr(sorted(options.items(), key=lambda item: item[0])).encode())
+        return f"{source.hexdigest()}-{state.hexdigest()}"
+
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+
+
+    def get(self, key: str) -> np.ndarray | None:
+        '''
+        Открыть массив из кэша только для чтения.
+
+        Returns:
+            np.ndarray | None - отображённый в память массив, либо None, если его нет в кэше
+        '''
+        path = self.path(key)
+        if not path.exists(): return None
+
+        try: return np.load(path, mmap_mode="r")
+        except (OSError, ValueError): return None
+
+
+    def put(self, key: str, array: np.ndarray) -> np.ndarray:
+        '''
+        Сохранить массив в кэш. Файл сначала пишется во временный, а потом переименовывается,
+        чтобы параллельные чтения никогда не видели недописанный файл. Массивы тех же файлов
+        с теми же параметрами, но прошлых версий файлов, удаляются.
+
+        Returns:
+            np.ndarray - сохранённый массив, открытый из кэша, либо исходный объект, если его нельзя сохранить
+        '''
+        if not isinstance(array, np.ndarray) or array.dtype.hasobject or not array.size: return array
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        temp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with open(temp, "wb") as file:
+            np.save(file, array)
+        os.replace(temp, path)
+
+        source = key.split("-")[0]
+        for old in self.directory.glob(f"{source}-*.npy"):
+            if old == path: continue
+            # Открытый другой нодой файл на Windows не удалить, он удалится при следующем сохранении
+            try: old.unlink()
+            except OSError: pass
+
+        return np.load(path, mmap_mode="r")
+
+
+    def cached(self, loader: Callable) -> Callable:
+        '''
+        Обернуть функцию чтения данных (open_data) кэшем. Первый аргумент функции - файлы,
+        остальные аргументы становятся частью ключа.
+        '''
+        @wraps(loader)
+        def wrapper(files=None, *args, **kwargs):
+            key = self.loader_key(loader, files, *args, **kwargs)
+            if key is None: return loader(files, *args, **kwargs)
+
+            array = self.get(key)
+            if array is None: array = self.put(key, loader(files, *args, **kwargs))
+            return array
+
+        return wrapper
+
+
+    def loader_key(self, loader: Callable, files=None, *args, **kwargs) -> str | None:
+        '''
+        Ключ, под которым cached сохраняет результат loader(files, *args, **kwargs).
+        '''
+        if not files: return None
+        return self.key(files, loader=f"{loader.__module__}.{loader.__qualname__}", args=args, **kwargs)
+
+
+    def lookup(self, loader: Callable, files=None, *args, **kwargs) -> np.ndarray | None:
+        '''
+        Массив, который cached уже сохранил для этого вызова loader, без чтения исходных файлов.
+
+        Returns:
+            np.ndarray | None - отображённый в память массив, либо None, если его нет в кэше
+        '''
+        key = self.loader_key(loader, files, *args, **kwargs)
+        return self.get(key) if key is not None else None
+
+
+    def clear(self):
+        '''
+        Удалить все сохранённые массивы.
+        '''
+        for path in self.directory.glob("*.npy"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,121 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+
+import numpy as np
+
+from Src.Data.number_format import NumberFormat
+
+
+class DataWriter:
+    '''
+    Запись массивов в файл. Формат выбирается по расширению: .npy, .npz (можно сжатый),
+    остальные расширения - текстовый csv, который форматируется блоками по block_rows строк
+    средствами numpy (NumberFormat), без форматирования каждого числа в Python, как в np.savetxt.
+    Файл пишется во временный и переименовывается, поэтому недописанный файл никогда не будет прочитан.
+
+    Attributes:
+        delimiter: str - разделитель столбцов в csv
+        compressed: bool - сжимать .npz
+        fmt: str | None - формат одного числа в csv (форматируется в Python), по умолчанию
+            точная для типа данных запись NumberFormat
+        block_rows: int - колличество строк csv, которые форматируются за раз
+    '''
+    BLOCK_ROWS = 65536
+    # Ограничение памяти на форматирование одного блока широкой таблицы
+    BLOCK_BYTES = 64 * 2**20
+    # Запись в фоне идёт в одном потоке, чтобы файлы писались в порядке вызовов
+    _executor: ThreadPoolExecutor = None
+    delimiter: str
+    compressed: bool
+    fmt: str | None
+    block_rows: int
+
+
+    def __init__(self, delimiter: str = ",", compressed: bool = False, fmt: str = None,
+                 block_rows: int = BLOCK_ROWS):
+        self.delimiter = delimiter or ","
+        self.compressed = compressed
+        self.fmt = fmt
+        self.block_rows = block_rows
+
+
+    def write(self, data: np.ndarray, path: str | Path) -> Path:
+        '''
+        Записать массив в файл.
+
+        Returns:
+            Path - путь к записанному файлу
+        '''
+        if not path: raise AttributeError("Не указан файл, в который нужно сохранить данные!")
+
+        data = np.asanyarray(data)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Ноды сохранения собираются в пуле потоков, поэтому у каждого потока свой временный файл
+        temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+            with open(temp, "wb") as file:
+                match path.suffix.lower():
+                    case ".npy": np.save(file, data)
+                    case ".npz" if self.compressed: np.savez_compressed(file, data=data)
+                    case ".npz": np.savez(file, data=data)
+                    case _: self.write_csv(data, file)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+
+        os.replace(temp, path)
+        return path
+
+
+    def write_async(self, data: np.ndarray, path: str | Path) -> Future:
+        '''
+        Записать массив в файл в фоновом потоке.
+
+        Returns:
+            Future - результат записи (путь к файлу или ошибка)
+        '''
+        if DataWriter._executor is None:
+            DataWriter._executor = ThreadPoolExecutor(1, "writer")
+
+        # Массив копируется, чтобы его изменения после вызова не попали в файл
+        return DataWriter._executor.submit(self.write, np.array(data), path)
+
+
+    def write_csv(self, data: np.ndarray, file):
+        '''
+        Записать массив в csv. Одномерный массив пишется столбцом, многомерный - по первой оси.
+        '''
+        if data.ndim < 2: data = data.reshape(-1, 1)
+        elif data.ndim > 2: data = data.reshape(len(data), -1)
+        if not data.size: return
+
+        delimiter = self.delimiter.encode()
+        rows = max(1, min(self.block_rows, self.BLOCK_BYTES // (64 * data.shape[1])))
+
+        for start in range(0, len(data), rows):
+            file.write(self.format_block(data[start:start + rows], delimiter))
+
+
+    def format_block(self, block: np.ndarray, delimiter: bytes) -> bytes:
+        '''
+        Строки csv для блока (строки, столбцы).
+        '''
+        if self.fmt:
+            row = delimiter.decode().join([self.fmt] * block.shape[1]) + "\n"
+            return ((row * len(block)) % tuple(block.ravel().tolist())).encode()
+
+        text = NumberFormat.cells(block)
+        width = text.shape[-1]
+
+        # Число занимает width байт, дополненных нулями, за ним разделитель или конец строки, нули выбрасываются
+        cells = np.zeros((*block.shape, width + len(delimiter)), dtype=np.uint8)
+        cells[..., :width] = text
+        cells[:, :-1, width:] = np.frombuffer(delimiter, dtype=np.uint8)
+        cells[:, -1, width] = ord("\n")
+
+        cells = cells.ravel()
+        return cells[cells != 0].tobytes()
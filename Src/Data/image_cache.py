@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from Src.Data.image_loader import ImageLoader
+
+
+
+class ImageShards:
+    '''
+    Декодированные изображения, сохранённые в шарды фиксированного размера.
+    Шарды открываются через np.load(mmap_mode='r'), поэтому в память читаются только нужные батчи.
+    Одним массивом набор не отдаётся: из шардов читает только ImageStream.
+
+    Attributes:
+        directory: Path - папка с шардами и index.json
+        shape: tuple[int, ...] - размерность всего набора (изображения, высота, ширина, каналы)
+        shard_size: int - колличество изображений в одном шарде
+    '''
+    directory: Path
+    shape: tuple[int, ...]
+    shard_size: int
+    __shards: list[np.ndarray]
+
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        with open(self.directory / ImageShardCache.INDEX) as file:
+            index = json.load(file)
+
+        self.shape = (index["count"], *index["shape"])
+        self.shard_size = index["shard_size"]
+        self.__shards = [np.load(self.directory / name, mmap_mode="r") for name in index["shards"]]
+
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        '''
+        Собрать изображения с указанными номерами в один uint8 массив.
+        '''
+        indices = np.asarray(indices)
+        out = np.empty((len(indices), *self.shape[1:]), dtype=np.uint8)
+        shards, offsets = np.divmod(indices, self.shard_size)
+
+        for shard in np.unique(shards):
+            mask = shards == shard
+            out[mask] = self.__shards[shard][offsets[mask]]
+
+        return out
+
+
+
+class ImageShardCache:
+    '''
+    Кэш декодированных изображений на диске. Изображения после декодирования и изменения размера
+    записываются в uint8 шарды по SHARD_SIZE изображений и индекс index.json. Ключ зависит от путей
+    к изображениям, их размера, времени изменения, размера результата и режима цвета.
+
+    Attributes:
+        directory: Path - папка, в которой хранятся наборы шардов
+    '''
+    DIRECTORY = Path(".cache") / "images"
+    INDEX = "index.json"
+    SHARD_SIZE = 1024
+    VERSION = 1
+    directory: Path
+
+
+    def __init__(self, directory: str | Path = None):
+        self.directory = Path(directory or self.DIRECTORY)
+
+
+    def key(self, loader: ImageLoader, files: list[Path]) -> str:
+        digest = hashlib.sha1(f"{self.VERSION}|{loader.size}|{loader.color_mode}\n".encode())
+        for path in files:
+            stat = os.stat(path)
+            digest.update(f"{Path(path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+
+        return digest.hexdigest()
+
+
+    def open(self, loader: ImageLoader, files: list[Path]) -> ImageShards:
+        '''
+        Открыть шарды для изображений, если их нет, то сначала декодировать изображения и записать шарды.
+        '''
+        path = self.directory / self.key(loader, files)
+        if not (path / self.INDEX).exists(): self.write(loader, files, path)
+        return ImageShards(path)
+
+
+    def write(self, loader: ImageLoader, files: list[Path], path: Path):
+        '''
+        Декодировать изображения прямо в файлы шардов. Набор пишется во временную папку и переименовывается
+        целиком, поэтому недописанные шарды никогда не будут прочитаны. У каждой записи своя временная папка,
+        поэтому ноды с одинаковым набором, собираемые в разных потоках, не пишут в одни и те же шарды.
+        '''
+        if not files: raise AttributeError("Вы не выбрали изображения, которые нужно открыть!")
+
+        shape = loader.shape(files)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = Path(tempfile.mkdtemp(prefix=f"{path.name}.", suffix=".tmp", dir=path.parent))
+
+        try:
+            shards = []
+            for number, start in enumerate(range(0, len(files), self.SHARD_SIZE)):
+                chunk = files[start:start + self.SHARD_SIZE]
+                name = f"shard_{number:05d}.npy"
+                shard = np.lib.format.open_memmap(temp / name, mode="w+", dtype=np.uint8, shape=(len(chunk), *shape))
+                loader.load_into(chunk, shard)
+                shard.flush()
+                del shard
+                shards.append(name)
+
+            index = dict(version=self.VERSION, count=len(files), shape=shape, shard_size=self.SHARD_SIZE,
+                         shards=shards, files=[str(file) for file in files])
+            with open(temp / self.INDEX, "w") as file:
+                json.dump(index, file)
+        except BaseException:
+            # Недописанный набор не нужен, ошибку покажет нода
+            shutil.rmtree(temp, ignore_errors=True)
+            raise
+
+        try: os.rename(temp, path)
+        except OSError: shutil.rmtree(temp, ignore_errors=True)
+
+
+    def clear(self):
+        '''
+        Удалить все сохранённые наборы.
+        '''
+        shutil.rmtree(self.directory, ignore_errors=True)
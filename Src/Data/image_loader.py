@@ -0,0 +1,159 @@
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor, Executor
+from pathlib import Path
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+from PIL import Image
+
+if TYPE_CHECKING: from Src.Data.image_stream import ImageStream
+
+
+
+class ImageLoader:
+    '''
+    Загрузчик изображений. Изображения декодируются и приводятся к одному размеру в пуле потоков
+    (PIL отпускает GIL во время декодирования) и сразу записываются в заранее выделенный
+    uint8 массив, без промежуточного списка изображений.
+
+    Attributes:
+        size: tuple[int, int] | None - (высота, ширина) изображений, None - размер первого изображения
+        color_mode: str - grayscale, rgb или rgba
+        max_workers: int - колличество потоков, декодирующих изображения
+    '''
+    EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp"}
+    MODES = {"grayscale": "L", "rgb": "RGB", "rgba": "RGBA"}
+    CHUNK_SIZE = 64
+    size: tuple[int, int] | None
+    color_mode: str
+    max_workers: int
+
+
+    def __init__(self, size: tuple[int, int] = None, color_mode: str = "rgb", max_workers: int = None):
+        '''
+        Args:
+            size: tuple[int, int] - (высота, ширина) изображений, None или нули - размер первого изображения
+            color_mode: str - grayscale, rgb или rgba
+            max_workers: int - колличество потоков, по умолчанию по числу ядер
+        '''
+        if color_mode not in self.MODES:
+            raise AttributeError(f"Неизвестный режим цвета {color_mode}!")
+
+        self.size = tuple(size) if size and all(size) else None
+        self.color_mode = color_mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+
+    @property
+    def channels(self) -> int:
+        return len(self.MODES[self.color_mode])
+
+
+    @classmethod
+    def files(cls, inputs: str | Path | Iterable[str | Path]) -> list[Path]:
+        '''
+        Собрать список изображений. Каждый вход - файл, папка (изображения ищутся во всех
+        вложенных папках) или glob шаблон.
+        '''
+        if isinstance(inputs, (str, Path)): inputs = [inputs]
+
+        files = []
+        for source in inputs:
+            source = str(source)
+            if glob.has_magic(source):
+                paths = map(Path, glob.glob(source, recursive=True))
+            elif os.path.isdir(source):
+                paths = Path(source).rglob("*")
+            else:
+                paths = [Path(source)]
+
+            files += sorted(path for path in paths if path.suffix.lower() in cls.EXTENSIONS and path.is_file())
+
+        return files
+
+
+    @staticmethod
+    def labels(files: list[Path]) -> tuple[np.ndarray, list[str]]:
+        '''
+        Метки изображений по названию папки, в которой они лежат.
+
+        Returns:
+            tuple[np.ndarray, list[str]] - номер класса для каждого изображения и названия классов
+        '''
+        classes = sorted({path.parent.name for path in files})
+        index = {name: number for number, name in enumerate(classes)}
+        return np.array([index[path.parent.name] for path in files], dtype=np.int64), classes
+
+
+    def shape(self, files: list[Path]) -> tuple[int, int, int]:
+        '''
+        Размер одного изображения (высота, ширина, каналы). Если размер не задан, то
+        у первого изображения читается только заголовок.
+        '''
+        if self.size: return (*self.size, self.channels)
+        if not files: raise AttributeError("Вы не выбрали изображения, которые нужно открыть!")
+
+        with Image.open(files[0]) as image:
+            width, height = image.size
+        return (height, width, self.channels)
+
+
+    def decode(self, path: str | Path, size: tuple[int, int]) -> np.ndarray:
+        '''
+        Прочитать одно изображение.
+
+        Args:
+            path: str | Path - путь к изображению
+            size: tuple[int, int] - (высота, ширина) результата
+
+        Returns:
+            np.ndarray - uint8 массив (высота, ширина, каналы)
+        '''
+        height, width = size
+        mode = self.MODES[self.color_mode]
+
+        with Image.open(path) as image:
+            # JPEG можно сразу декодировать в уменьшенном размере
+            image.draft(mode, (width, height))
+            image = image.convert(mode)
+            if image.size != (width, height): image = image.resize((width, height), Image.Resampling.BILINEAR)
+            array = np.asarray(image)
+
+        return array.reshape(height, width, self.channels)
+
+
+    def load_into(self, files: list[Path], out: np.ndarray, pool: Executor = None) -> np.ndarray:
+        '''
+        Декодировать изображения в уже выделенный массив out[len(files), высота, ширина, каналы].
+        '''
+        if pool is None:
+            with ThreadPoolExecutor(self.max_workers, "image") as pool:
+                return self.load_into(files, out, pool)
+
+        def load_chunk(start: int):
+            for index in range(start, min(start + self.CHUNK_SIZE, len(files))):
+                out[index] = self.decode(files[index], out.shape[1:3])
+
+        for future in [pool.submit(load_chunk, start) for start in range(0, len(files), self.CHUNK_SIZE)]:
+            future.result()
+
+        return out
+
+
+    def load(self, files: list[Path]) -> np.ndarray:
+        '''
+        Прочитать все изображения в один uint8 массив (изображения, высота, ширина, каналы).
+        '''
+        out = np.empty((len(files), *self.shape(files)), dtype=np.uint8)
+        return self.load_into(files, out)
+
+
+    def stream(self, files: list[Path], labels: np.ndarray = None, batch_size: int = 32,
+               shuffle: bool = False, **kwargs) -> "ImageStream":
+        '''
+        Набор данных, который читает изображения по батчам во время обучения.
+        '''
+        # ImageStream наследуется от keras.utils.PyDataset, keras импортируется только здесь
+        from Src.Data.image_stream import ImageStream
+        return ImageStream(self, files, labels, batch_size, shuffle, **kwargs)
@@ -0,0 +1,90 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import keras
+
+from Src.Data.image_loader import ImageLoader
+
+if TYPE_CHECKING: from Src.Data.image_cache import ImageShards
+
+
+
+class ImageStream(keras.utils.PyDataset):
+    '''
+    Набор изображений, который никогда не загружается целиком: каждый батч декодируется
+    (или берётся из шардов ImageShards) при обращении и только тогда приводится к dtype.
+    Передаётся в model.fit / model.predict вместо массива.
+
+    Attributes:
+        loader: ImageLoader - загрузчик изображений
+        files: list[Path] - изображения
+        labels: np.ndarray | None - метки изображений, если есть, то батч - это пара (x, y)
+        batch_size: int - размер батча
+        shuffle: bool - перемешивать изображения после каждой эпохи
+        dtype: str | None - тип данных батча, None - uint8 как есть
+        shards: ImageShards | None - уже декодированные изображения, из которых берутся батчи
+    '''
+    loader: ImageLoader
+    files: list[Path]
+    labels: np.ndarray | None
+    batch_size: int
+    shuffle: bool
+    dtype: str | None
+    shards: "ImageShards | None"
+
+
+    def __init__(self, loader: ImageLoader, files: list[Path], labels: np.ndarray = None,
+                 batch_size: int = 32, shuffle: bool = False, dtype: str = "float32",
+                 shards: "ImageShards" = None, **kwargs):
+        super().__init__(**kwargs)
+        if not files: raise AttributeError("Вы не выбрали изображения, которые нужно открыть!")
+        if batch_size <= 0: raise AttributeError("Размер батча должен быть больше нуля!")
+
+        self.loader = loader
+        self.files = list(files)
+        self.labels = labels
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.dtype = dtype
+        self.shards = shards
+        self.__image_shape = shards.shape[1:] if shards is not None else loader.shape(self.files)
+        self.__order = np.arange(len(self.files))
+        self.__pool = ThreadPoolExecutor(loader.max_workers, "image")
+
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        '''
+        Размерность всего набора, как у массива (изображения, высота, ширина, каналы).
+        '''
+        return (len(self.files), *self.__image_shape)
+
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.files) / self.batch_size)
+
+
+    def __getitem__(self, index: int):
+        batch = self.__order[index * self.batch_size:(index + 1) * self.batch_size]
+        if self.shards is not None:
+            x = self.shards.take(batch)
+        else:
+            x = np.empty((len(batch), *self.__image_shape), dtype=np.uint8)
+            self.loader.load_into([self.files[number] for number in batch], x, self.__pool)
+
+        if self.dtype: x = x.astype(self.dtype)
+
+        if self.labels is None: return x
+        return x, self.labels[batch]
+
+
+    def on_epoch_end(self):
+        if self.shuffle: np.random.shuffle(self.__order)
+
+
+    def __del__(self):
+        pool = getattr(self, "_ImageStream__pool", None)
+        if pool is not None: pool.shutdown(wait=False)
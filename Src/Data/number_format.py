@@ -0,0 +1,214 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+
+
+
+class NumberFormat:
+    '''
+    Форматирование массива чисел в текст целиком средствами numpy, без перевода каждого числа
+    в строку в Python. Результат - uint8 массив (..., width): запись числа, дополненная нулевыми байтами,
+    которые выбрасываются при записи.
+
+    Дробные числа пишутся как d.ddde±XX с колличеством значащих цифр, при котором число читается обратно
+    в тот же тип без потерь (9 для float32, 17 для float64), нули в конце дробной части отбрасываются.
+    Значащие цифры считаются точно: число умножается на степень десяти с точностью двойного double
+    (произведение Деккера), поэтому округление совпадает с округлением printf.
+    '''
+    # Вне этого диапазона произведение Деккера переполняется, такие числа форматирует Python
+    MIN_FAST = 1e-280
+    MAX_FAST = 1e280
+    POWERS = 300
+    # 2**27 + 1, делит double на две половины по 26 бит
+    SPLIT = 134217729.0
+    __powers: tuple[np.ndarray, np.ndarray] = None
+
+
+    @classmethod
+    def cells(cls, values: np.ndarray) -> np.ndarray:
+        '''
+        Записи чисел массива.
+
+        Returns:
+            np.ndarray - uint8 массив (*values.shape, width), запись числа дополнена нулями
+        '''
+        if values.dtype == bool: values = values.astype(np.uint8)
+
+        if np.issubdtype(values.dtype, np.integer): return cls.integers(values)
+        if np.issubdtype(values.dtype, np.floating) and values.dtype.itemsize <= 8: return cls.floats(values)
+
+        # Остальные типы (long double, комплексные числа) numpy переводит в строки сам
+        text = values.astype("S")
+        return text.view(np.uint8).reshape(*values.shape, text.dtype.itemsize)
+
+
+    @staticmethod
+    def precision(dtype: np.dtype) -> int:
+        '''
+        Колличество значащих цифр, при котором число читается обратно без потерь.
+        '''
+        return math.ceil(1 + (np.finfo(dtype).nmant + 1) * math.log10(2))
+
+
+    @classmethod
+    def integers(cls, values: np.ndarray) -> np.ndarray:
+        # abs самого маленького int64 остаётся отрицательным, но в uint64 превращается в верное значение
+        magnitude = values.astype(np.uint64) if values.dtype.kind == "u" else \
+                    np.abs(values.astype(np.int64)).astype(np.uint64)
+        length = len(str(int(magnitude.max()))) if magnitude.size else 1
+
+        cells = np.zeros((*values.shape, length + 1), dtype=np.uint8)
+        if values.dtype.kind == "i": cells[..., 0] = np.where(values < 0, ord("-"), 0)
+
+        for position in range(length):
+            digit = (magnitude % 10).astype(np.uint8) + ord("0")
+            # Ведущие нули не пишутся, но сам ноль - пишется
+            if position: digit[magnitude == 0] = 0
+            cells[..., length - position] = digit
+            magnitude //= 10
+
+        return cells
+
+
+    @classmethod
+    def floats(cls, values: np.ndarray) -> np.ndarray:
+        precision = cls.precision(values.dtype)
+        width = precision + 7
+        # float16 и float32 переводятся в float64 без потерь
+        values = values.astype(np.float64)
+        absolute = np.abs(values)
+        fast = (absolute >= cls.MIN_FAST) & (absolute <= cls.MAX_FAST)
+
+        significand, exponent = cls.digits(np.where(fast, absolute, 1.0), precision)
+
+        # Знак, первая цифра, точка, остальные цифры, e, знак и три цифры порядка
+        cells = np.zeros((*values.shape, width), dtype=np.uint8)
+        cells[..., 0] = np.where(np.signbit(values), ord("-"), 0)
+
+        trailing = np.ones(values.shape, dtype=bool)
+        for position in range(precision + 1, 2, -1):
+            digit = (significand % 10).astype(np.uint8)
+            trailing &= digit == 0
+            cells[..., position] = np.where(trailing, 0, digit + ord("0"))
+            significand //= 10
+
+        cells[..., 1] = significand.astype(np.uint8) + ord("0")
+        cells[..., 2] = np.where(trailing, 0, ord("."))
+        cells[..., precision + 2] = ord("e")
+        cells[..., precision + 3] = np.where(exponent < 0, ord("-"), ord("+"))
+
+        exponent = np.abs(exponent)
+        cells[..., precision + 4] = np.where(exponent >= 100, exponent // 100 + ord("0"), 0)
+        cells[..., precision + 5] = exponent // 10 % 10 + ord("0")
+        cells[..., precision + 6] = exponent % 10 + ord("0")
+
+        if not fast.all(): cls.__special(values, ~fast, cells, precision)
+        return cells
+
+
+    @classmethod
+    def digits(cls, values: np.ndarray, precision: int) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Значащие цифры положительных чисел: values ≈ significand * 10**(exponent - precision + 1).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] - significand из precision цифр и порядок, оба int64
+        '''
+        exponent = np.floor(np.log10(values)).astype(np.int64)
+        significand = cls.__scale(values, precision - 1 - exponent)
+
+        # log10 около степеней десяти и округление вверх (9.99... -> 10.0) дают порядок на единицу не тот
+        wrong = (significand >= 10**precision) | (significand < 10**(precision - 1))
+        if wrong.any():
+            exponent[wrong] += np.where(significand[wrong] >= 10**precision, 1, -1)
+            significand[wrong] = cls.__scale(values[wrong], precision - 1 - exponent[wrong])
+
+        # 10**(precision - 1) мог получиться округлением вверх числа с меньшим порядком, тогда потеряна цифра
+        lowest = significand == 10**(precision - 1)
+        if lowest.any():
+            lower = cls.__scale(values[lowest], precision - exponent[lowest])
+            better = lower < 10**precision
+            significand[np.flatnonzero(lowest)[better]] = lower[better]
+            exponent[np.flatnonzero(lowest)[better]] -= 1
+
+        return significand, exponent
+
+
+    @classmethod
+    def __scale(cls, values: np.ndarray, power: np.ndarray) -> np.ndarray:
+        '''
+        Округлённое до целого values * 10**power.
+        '''
+        high, low = cls.__power_table()
+        product, error = cls.__product(values, high[power + cls.POWERS], low[power + cls.POWERS])
+
+        # product - whole точное. Половины rint округляет к чётному, как printf: whole при этом всегда чётное
+        # (либо выбрано rint, либо больше 2**53 и шаг double не меньше 2)
+        whole = np.rint(product)
+        remainder = (product - whole) + error
+        return whole.astype(np.int64) + np.rint(remainder).astype(np.int64)
+
+
+    @classmethod
+    def __product(cls, value: np.ndarray, high: np.ndarray, low: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        value * (high + low) как сумма двух double (произведение Деккера без FMA).
+        '''
+        product = value * high
+        value_high, value_low = cls.__split(value)
+        power_high, power_low = cls.__split(high)
+
+        error = ((value_high * power_high - product) + value_high * power_low + value_low * power_high) + \
+                value_low * power_low
+        return product, error + value * low
+
+
+    @classmethod
+    def __split(cls, value: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        scaled = cls.SPLIT * value
+        high = scaled - (scaled - value)
+        return high, value - high
+
+
+    @classmethod
+    def __power_table(cls) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Степени десяти от -POWERS до POWERS как сумма двух double, считается при первом вызове.
+        '''
+        if cls.__powers is None:
+            high, low = [], []
+            for power in range(-cls.POWERS, cls.POWERS + 1):
+                exact = Fraction(10) ** power
+                high.append(float(exact))
+                low.append(float(exact - Fraction(high[-1])))
+
+            cls.__powers = (np.array(high), np.array(low))
+
+        return cls.__powers
+
+
+    @staticmethod
+    def __special(values: np.ndarray, mask: np.ndarray, cells: np.ndarray, precision: int):
+        '''
+        Записать ноль, nan, бесконечности и числа вне диапазона MIN_FAST - MAX_FAST.
+        '''
+        width = cells.shape[-1]
+
+        def pad(text: str) -> np.ndarray:
+            return np.frombuffer(text.encode().ljust(width, b"\0"), dtype=np.uint8)
+
+        done = np.zeros(values.shape, dtype=bool)
+        for selected, text in ((values == 0, "0"), (np.isnan(values), "nan"), (values == np.inf, "inf"),
+                               (values == -np.inf, "-inf")):
+            if selected.any(): cells[selected] = pad(text)
+            done |= selected
+
+        # Знак отрицательного нуля
+        negative_zero = (values == 0) & np.signbit(values)
+        if negative_zero.any(): cells[negative_zero] = pad("-0")
+
+        for index in zip(*np.nonzero(mask & ~done)):
+            mantissa, exponent = f"{values[index]:.{precision - 1}e}".split("e")
+            mantissa = mantissa.rstrip("0").rstrip(".")
+            cells[index] = pad(f"{mantissa}e{exponent}")
@@ -0,0 +1,233 @@
+import os
+import threading
+import warnings
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+
+
+class TableLoader:
+    '''
+    Загрузчик табличных данных (csv, txt). Файл читается блоками, выровненными по концу строки,
+    а блоки разбираются одновременно в пуле потоков. Числовые блоки, во всех строках которых
+    одинаковое колличество столбцов, разбираются в C через np.fromstring, остальные блоки
+    (пропуски, комментарии, текст, строки разной длины) - через np.genfromtxt,
+    поэтому результат совпадает с np.genfromtxt(..., ndmin=2).
+
+    Attributes:
+        delimiter: str - разделитель столбцов
+        skip_header: int - сколько строк пропустить в начале файла
+        skip_footer: int - сколько строк пропустить в конце файла
+        dtype: np.dtype - тип данных результата
+        block_size: int - размер блока в байтах, который разбирается одним потоком
+        max_workers: int - колличество потоков, разбирающих блоки
+    '''
+    BLOCK_SIZE = 16 * 2**20
+    FROMSTRING_WARNING = "string or file could not be read to its end"
+    __quiet_lock = threading.Lock()
+    __quiet_count = 0
+    __quiet_filter: tuple = None
+    delimiter: str
+    skip_header: int
+    skip_footer: int
+    dtype: np.dtype
+    block_size: int
+    max_workers: int
+
+
+    def __init__(self, delimiter: str = ",", skip_header: int = 0, skip_footer: int = 0,
+                 dtype: np.dtype = np.float64, block_size: int = BLOCK_SIZE, max_workers: int = None):
+        '''
+        Args:
+            delimiter: str - разделитель столбцов, пробел означает любые пробельные символы
+            skip_header: int | bool - сколько строк пропустить в начале файла
+            skip_footer: int | bool - сколько непустых строк пропустить в конце файла
+            dtype: np.dtype - тип данных результата
+            block_size: int - размер блока в байтах
+            max_workers: int - колличество потоков, по умолчанию по числу ядер
+        '''
+        self.delimiter = delimiter or " "
+        self.skip_header = int(skip_header)
+        self.skip_footer = int(skip_footer)
+        self.dtype = np.dtype(dtype)
+        self.block_size = block_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+
+    def load(self, path: str | Path) -> np.ndarray:
+        '''
+        Прочитать таблицу из файла.
+
+        Returns:
+            np.ndarray - таблица размерности (строки, столбцы)
+        '''
+        parts = []
+        with self.__quiet(), open(path, "rb") as file, ThreadPoolExecutor(self.max_workers, "table") as pool:
+            # Одновременно в памяти держится не больше двух блоков на поток
+            futures: deque[Future] = deque()
+            for block in self.blocks(file):
+                if len(futures) >= 2 * self.max_workers: parts.append(futures.popleft().result())
+                futures.append(pool.submit(self.parse, block))
+
+            parts += [future.result() for future in futures]
+
+        parts = [part for part in parts if part.size]
+        if not parts: return np.empty((0, 0), dtype=self.dtype)
+        if len(parts) == 1: return parts[0]
+
+        if len({part.shape[1] for part in parts}) != 1:
+            raise AttributeError(f"В файле {path} разное колличество столбцов в строках!")
+
+        return np.concatenate(parts)
+
+
+    def shape(self, path: str | Path) -> tuple[None, int]:
+        '''
+        Размерность таблицы без её чтения: файл читается только до первой строки данных,
+        по ней считаются столбцы. Колличество строк без чтения всего файла неизвестно.
+
+        Returns:
+            tuple[None, int] - (None, столбцы)
+        '''
+        with open(path, "rb") as file:
+            for number, line in enumerate(file):
+                if number < self.skip_header or not line.strip() or line.lstrip().startswith(b"#"): continue
+                return None, self.columns(line)
+
+        return None, 0
+
+
+    def columns(self, line: bytes) -> int:
+        '''
+        Колличество столбцов в строке таблицы.
+        '''
+        line = line.split(b"#")[0]
+        if self.delimiter == " ": return len(line.split())
+        return line.count(self.delimiter.encode()) + 1
+
+
+    def line_columns(self, block: bytes) -> np.ndarray:
+        '''
+        Колличество столбцов в каждой строке блока, без разбора строк в Python.
+        '''
+        data = np.frombuffer(block, dtype=np.uint8)
+        if self.delimiter == " ":
+            # Столбец начинается с непробельного символа после пробельного (пробел и управляющие символы)
+            space = data <= ord(" ")
+            marks = ~space
+            marks[1:] &= space[:-1]
+        else:
+            marks = data == ord(self.delimiter)
+
+        starts = np.concatenate(([0], np.flatnonzero(data == ord("\n")) + 1))
+        counts = np.add.reduceat(marks, starts[starts < len(data)], dtype=np.intp)
+        return counts if self.delimiter == " " else counts + 1
+
+
+    @classmethod
+    @contextmanager
+    def __quiet(cls):
+        '''
+        Не показывать предупреждение np.fromstring о строке, которую не удалось разобрать до конца:
+        такие блоки и так перечитываются через np.genfromtxt.
+
+        Блоки разбираются в других потоках, а warnings.catch_warnings не потокобезопасен, поэтому фильтр
+        добавляется первой загрузкой и убирается последней из идущих одновременно.
+        '''
+        with cls.__quiet_lock:
+            if not cls.__quiet_count:
+                warnings.filterwarnings("ignore", message=cls.FROMSTRING_WARNING, category=DeprecationWarning)
+                cls.__quiet_filter = warnings.filters[0]
+            cls.__quiet_count += 1
+
+        try:
+            yield
+        finally:
+            with cls.__quiet_lock:
+                cls.__quiet_count -= 1
+                if not cls.__quiet_count and cls.__quiet_filter in warnings.filters:
+                    warnings.filters.remove(cls.__quiet_filter)
+                    # Как в warnings.catch_warnings, иначе предупреждение останется скрытым в реестрах модулей
+                    warnings._filters_mutated()
+
+
+    def blocks(self, file: BinaryIO) -> Iterator[bytes]:
+        '''
+        Разбить файл на блоки по block_size байт, которые заканчиваются концом строки.
+        Заголовок и подвал файла в блоки не попадают.
+        '''
+        header = self.skip_header
+        rest = b""
+        pending = None
+
+        while chunk := file.read(self.block_size):
+            chunk = rest + chunk
+            end = chunk.rfind(b"\n") + 1
+            block, rest = chunk[:end], chunk[end:]
+
+            if header: block, header = self.__skip_header(block, header)
+            if not block: continue
+
+            # Последний блок отдаём только в конце, из него ещё может понадобиться убрать подвал
+            if pending is not None: yield pending
+            pending = block
+
+        block = (pending or b"") + rest
+        if header: block, header = self.__skip_header(block, header)
+        for _ in range(self.skip_footer):
+            block = block.rstrip()
+            block = block[:block.rfind(b"\n") + 1]
+
+        if block.strip(): yield block
+
+
+    @staticmethod
+    def __skip_header(block: bytes, lines: int) -> tuple[bytes, int]:
+        '''
+        Убрать из начала блока до lines строк.
+
+        Returns:
+            tuple[bytes, int] - остаток блока и сколько строк ещё нужно пропустить
+        '''
+        start = 0
+        while lines and start < len(block):
+            start = block.find(b"\n", start) + 1 or len(block)
+            lines -= 1
+
+        return block[start:], lines
+
+
+    def parse(self, block: bytes) -> np.ndarray:
+        '''
+        Разобрать блок строк в массив (строки, столбцы).
+        '''
+        if self.__is_fast():
+            columns = self.line_columns(block)
+            rows = len(columns)
+
+            try:
+                values = np.fromstring(block.replace(b"\n", self.delimiter.encode()),
+                                       dtype=self.dtype, sep=self.delimiter)
+            except ValueError:
+                values = None
+
+            # Если разобраны не все значения, то в блоке пропуски или текст, а если в строках разное
+            # колличество столбцов, то np.genfromtxt сообщит, в какой строке ошибка
+            if values is not None and rows and columns[0] and (columns == columns[0]).all() and \
+                values.size == rows * columns[0]:
+                return values.reshape(rows, columns[0])
+
+        return np.genfromtxt(block.decode().splitlines(), delimiter=None if self.delimiter == " " else self.delimiter,
+                             dtype=self.dtype, ndmin=2)
+
+
+    def __is_fast(self) -> bool:
+        '''
+        Можно ли разбирать блоки через np.fromstring. Разделитель не должен быть частью записи числа.
+        '''
+        return len(self.delimiter) == 1 and self.delimiter not in "0123456789.+-eEinfaINFA#"
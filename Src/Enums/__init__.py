@@ -6,4 +6,7 @@ from Src.Enums.losses import Losses
 from Src.Enums.optimizers import Optimizers
 from Src.Enums.delimiters import Delimiters
 from Src.Enums.dpg_types import DPGType
-from Src.Enums.metrics import Metrics
\ No newline at end of file
+from Src.Enums.metrics import Metrics
+from Src.Enums.executor_type import ExecutorType
+from Src.Enums.data_types import DataTypes
+from Src.Enums.node_state import NodeState
\ No newline at end of file
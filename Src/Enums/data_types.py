@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class DataTypes(Enum):
+    """
+    Enum для типов данных, в которые читаются таблицы
+    """
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+    FLOAT16 = "float16"
+    INT64 = "int64"
+    INT32 = "int32"
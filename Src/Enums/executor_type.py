@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ExecutorType(Enum):
+    """
+    Enum для режимов выполнения графа
+    """
+    SERIAL = "serial"
+    THREAD = "thread"
\ No newline at end of file
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class NodeState(Enum):
+    """
+    Enum для состояний ноды, у каждого состояния своя тема
+    """
+    DEFAULT = "default"
+    ERROR = "error"
@@ -0,0 +1,107 @@
+import time
+
+import dearpygui.dearpygui as dpg
+
+from Src.Events.callbacks import DPGCallback
+from Src.Events.event_manager import Event_manager
+from Src.Logging import Logger_factory, Logger
+
+
+
+
+class CallbackWatcher:
+    """
+    Общий опрос всех DPGCallback не чаще раза за кадр (или раз в interval секунд).
+
+    Значения всех элементов получаются одним вызовом dpg.get_values, состояние - только
+    у элементов со state callback, а события вызываются только при реальных изменениях,
+    одной пачкой после опроса всех элементов (Event_manager.flush).
+    Кадры отсчитываются обработчиком видимости окна, к которому подключён наблюдатель (attach).
+
+    Class Attributes:
+        interval: float - минимальный промежуток между опросами в секундах, 0 - каждый кадр
+        _callbacks: list[DPGCallback] - опрашиваемые обработчики
+        _handlers: dict[str | int, int | str] - окна, к которым подключён наблюдатель, и их item_handler_registry
+    """
+
+    interval: float = 0.0
+    _callbacks: list[DPGCallback] = []
+    _handlers: dict[str | int, int | str] = {}
+    _last_poll: float = 0.0
+    logger: Logger = Logger_factory.from_instance()('events')
+
+
+    @classmethod
+    def register(cls, callback: DPGCallback) -> None:
+        """
+        Добавить обработчик в опрос.
+
+        Args:
+            callback: DPGCallback - обработчик элемента
+        """
+        if callback not in cls._callbacks:
+            cls._callbacks.append(callback)
+
+
+    @classmethod
+    def unregister(cls, callback: DPGCallback) -> None:
+        if callback in cls._callbacks:
+            cls._callbacks.remove(callback)
+
+
+    @classmethod
+    def attach(cls, window: str | int, interval: float = None) -> None:
+        """
+        Опрашивать обработчики в каждом кадре, в котором видно окно window.
+
+        Args:
+            window: str | int - окно, обычно основное окно приложения
+            interval: float, optional - минимальный промежуток между опросами в секундах
+        """
+        if interval is not None:
+            cls.interval = interval
+
+        # Реестр мог удалиться вместе с контекстом dpg
+        if window in cls._handlers and dpg.does_item_exist(cls._handlers[window]):
+            return
+
+        with dpg.item_handler_registry() as handlers:
+            dpg.add_item_visible_handler(callback=lambda: cls.poll())
+        dpg.bind_item_handler_registry(window, handlers)
+        cls._handlers[window] = handlers
+
+
+    @classmethod
+    def poll(cls, force: bool = False) -> int:
+        """
+        Проверить изменения у всех обработчиков.
+
+        Args:
+            force: bool - опросить, даже если interval ещё не прошёл
+
+        Returns:
+            int - колличество опрошенных обработчиков
+        """
+        now = time.perf_counter()
+        if not force and now - cls._last_poll < cls.interval:
+            return 0
+        cls._last_poll = now
+
+        alive = []
+        for callback in cls._callbacks:
+            if dpg.does_item_exist(callback.item_id): alive.append(callback)
+            else:
+                callback.remove()
+                cls.logger.debug("Элемент %s удалён, он больше не опрашивается", callback.item_id)
+        cls._callbacks[:] = alive
+
+        watching = [callback for callback in alive if callback.watches_value]
+        values = dict(zip(watching, dpg.get_values([callback.item_id for callback in watching]))) \
+                 if watching else {}
+
+        for callback in alive:
+            item_state = dpg.get_item_state(callback.item_id) if callback.watches_state else {}
+            callback.update(values.get(callback), item_state)
+
+        Event_manager.flush()
+        return len(alive)
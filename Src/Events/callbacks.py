@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 from dataclasses import dataclass
 
 import dearpygui.dearpygui as dpg
@@ -12,6 +12,7 @@ from Src.Logging import Logger_factory,Logger
 @dataclass
 class CallbackInfo:
     """Информация о callback-функции и условии её вызова."""
+    # Ссылки (Event_manager.reference), чтобы не держать объекты обработчиков
     callbacks: list[Callable]
     trigger_value: Any = None
 
@@ -39,86 +40,86 @@ class DPGCallback:
             CallbackType.STATE: {}
         }
         self.__callbacks = {}
+        # Ключи событий считаются при регистрации, а не при каждой проверке
+        self.__value_event = None
+        self.__state_events = {}
         
         if not dpg.does_item_exist(self.__item_id):
-            self.logger.warning(f"Элемент {item_id} не существует. Регистрация события прервана.")
+            self.logger.warning("Элемент %s не существует. Регистрация события прервана.", item_id)
             return
 
-        self.logger.info(f"DPGCallback инициализирован для элемента {item_id}")
+        self.logger.info("DPGCallback инициализирован для элемента %s", item_id)
 
 
-    def __check_value_changes(self) -> None:
-        """Проверяет изменения значения элемента с учетом trigger_value."""
-        event_name = self._create_event_name(CallbackType.VALUE)
-        
-        if event_name not in self.__callbacks:
-            return
+    @property
+    def item_id(self) -> str | int:
+        return self.__item_id
 
-        current_value = self._get_current_value(CallbackType.VALUE)
-        
-        if current_value is None:
+
+    @property
+    def watches_value(self) -> bool:
+        """Есть ли callback на изменение значения."""
+        return self.__value_event is not None
+
+
+    @property
+    def watches_state(self) -> bool:
+        """Есть ли callback на изменение состояния."""
+        return bool(self.__state_events)
+
+
+    def __check_value_changes(self, current_value: Any) -> None:
+        """Проверяет изменения значения элемента с учетом trigger_value."""
+        if self.__value_event is None or current_value is None:
             return
 
-        callback_info = self.__callbacks[event_name]
+        callback_info = self.__callbacks[self.__value_event]
         
         if callback_info.trigger_value is not None:
                 if current_value == callback_info.trigger_value:
-                    Event_manager.trigger_custom_event(
-                        f"{self.__item_id}_value_change"
-                    )
+                    Event_manager.post(self.__value_event)
             
         else:
             if current_value != self.__prev_values[CallbackType.VALUE]:
-                Event_manager.trigger_custom_event(
-                    f"{self.__item_id}_value_change"
-                )
+                Event_manager.post(self.__value_event)
         self.__prev_values[CallbackType.VALUE] = current_value
 
 
-    def __check_state_changes(self) -> None:
+    def __check_state_changes(self, item_state: dict) -> None:
         """Проверяет изменения состояний элемента с учетом trigger_value."""
-        for state, prev_state_value in list(self.__prev_values[CallbackType.STATE].items()):
-            event_name = self._create_event_name(CallbackType.STATE, state)
-            
-            if event_name not in self.__callbacks:
-                continue
-
-            current_state = self._get_current_value(CallbackType.STATE, state)
+        for state, event_name in self.__state_events.items():
+            current_state = item_state.get(state)
             
             if current_state is None:
                 continue
 
             callback_info = self.__callbacks[event_name]
+            prev_state_value = self.__prev_values[CallbackType.STATE].get(state)
 
             if callback_info.trigger_value is not None:
                 if current_state == callback_info.trigger_value:
-                    Event_manager.trigger_custom_event(
-                        f"{self.__item_id}_state_{state}_change"
-                    )
+                    Event_manager.post(event_name)
             
             else:
                 if current_state != prev_state_value:
-                    Event_manager.trigger_custom_event(
-                        f"{self.__item_id}_state_{state}_change"
-                    )
+                    Event_manager.post(event_name)
             self.__prev_values[CallbackType.STATE][state] = current_state
 
 
-    def _create_event_name(self, callback_type: CallbackType, state: str = "") -> str:
-        """Создает уникальное имя события для callback."""
-        base_name = f"{self.__item_id}_{callback_type.value}"
-        return f"{base_name}_{state}_change" if state else f"{base_name}_change"
+    def _create_event_name(self, callback_type: CallbackType, state: str = "") -> Hashable:
+        """Создает уникальный ключ события для callback."""
+        return Event_manager.topic(self.__item_id, callback_type.value, state)
 
 
     def _register_callback(
         self, 
-        event_name: str, 
+        event_name: Hashable, 
         callback: Callable, 
         trigger_value: Any = None
     ) -> bool:
         """Регистрирует новый callback."""
         if not callable(callback):
-            self.logger.warning(f"Некорректный callback для события {event_name}")
+            self.logger.warning("Некорректный callback для события %s", event_name)
             return False
 
         if event_name not in self.__callbacks:
@@ -127,10 +128,11 @@ class DPGCallback:
                 trigger_value=trigger_value
             )
         
-        if callback not in self.__callbacks[event_name].callbacks:
-            self.__callbacks[event_name].callbacks.append(callback)
-            Event_manager.add_custom_event(event_name, [callback])
-            self.logger.debug(f"Callback зарегистрирован для события {event_name}")
+        reference = Event_manager.reference(callback)
+        if reference not in self.__callbacks[event_name].callbacks:
+            self.__callbacks[event_name].callbacks.append(reference)
+            Event_manager.add_custom_event(event_name, [callback], item=self.__item_id)
+            self.logger.debug("Callback зарегистрирован для события %s", event_name)
             return True
         
         return False
@@ -145,7 +147,7 @@ class DPGCallback:
     ) -> None:
         """Универсальный метод добавления callback."""
         if not dpg.does_item_exist(self.__item_id):
-            self.logger.warning(f"Невозможно добавить callback. Элемент {self.__item_id} не существует.")
+            self.logger.warning("Невозможно добавить callback. Элемент %s не существует.", self.__item_id)
             return
 
         if callback_type == CallbackType.STATE and not state:
@@ -158,6 +160,8 @@ class DPGCallback:
         )
         
         if self._register_callback(event_name, callback, trigger_value):
+            if callback_type == CallbackType.STATE: self.__state_events[state] = event_name
+            else: self.__value_event = event_name
             self._update_previous_value(callback_type, state)
             log_msg = (
                 f"Callback состояния добавлен для элемента {self.__item_id}, состояние {state}"
@@ -174,7 +178,7 @@ class DPGCallback:
     ) -> Any:
         """Получает текущее значение или состояние элемента."""
         if not dpg.does_item_exist(self.__item_id):
-            self.logger.warning(f"Элемент {self.__item_id} не существует")
+            self.logger.warning("Элемент %s не существует", self.__item_id)
             return None
 
         if callback_type == CallbackType.VALUE:
@@ -196,7 +200,7 @@ class DPGCallback:
         current_value = self._get_current_value(callback_type, state)
         
         if current_value is None:
-            self.logger.warning(f"Не удалось получить текущее значение для элемента {self.__item_id}")
+            self.logger.warning("Не удалось получить текущее значение для элемента %s", self.__item_id)
             return
 
         if callback_type == CallbackType.VALUE:
@@ -204,13 +208,6 @@ class DPGCallback:
         else:
             self.__prev_values[callback_type][state] = current_value
 
-        
-    def _check_changes(self, callback_type: CallbackType) -> None:
-        """Универсальный метод проверки изменений."""
-        if callback_type == CallbackType.VALUE:
-            self.__check_value_changes()
-        else:
-            self.__check_state_changes()
 
 
     def add_value_callback(self, callback: Callable, trigger_value: Any = None) -> None:
@@ -254,8 +251,35 @@ class DPGCallback:
         соответствующие callbacks при обнаружении изменений.
         """
         if not dpg.does_item_exist(self.__item_id):
-            self.logger.warning(f"Элемент {self.__item_id} не существует во время проверки")
+            self.logger.warning("Элемент %s не существует во время проверки", self.__item_id)
             return
 
-        self._check_changes(CallbackType.VALUE)
-        self._check_changes(CallbackType.STATE)
+        self.update(
+            dpg.get_value(self.__item_id) if self.watches_value else None,
+            dpg.get_item_state(self.__item_id) if self.watches_state else {}
+        )
+        Event_manager.flush()
+
+
+    def update(self, value: Any, item_state: dict) -> None:
+        """
+        Сравнивает уже полученные значение и состояние элемента с предыдущими
+        и вызывает callbacks при изменениях. Используется CallbackWatcher,
+        который получает значения всех элементов за один раз.
+
+        События откладываются (Event_manager.post), их вызывает тот, кто опрашивает элемент.
+
+        Args:
+            value (Any): Текущее значение элемента.
+            item_state (dict): Текущее состояние элемента (dpg.get_item_state).
+        """
+        self.__check_value_changes(value)
+        self.__check_state_changes(item_state)
+
+
+    def remove(self) -> None:
+        """Отписывает все callbacks элемента."""
+        Event_manager.remove_item(self.__item_id)
+        self.__callbacks.clear()
+        self.__value_event = None
+        self.__state_events.clear()
@@ -1,83 +1,233 @@
-from typing import Callable
+from collections import deque
+from typing import Callable, Hashable
+import weakref
+
+import dearpygui.dearpygui as dpg
 
 from Src.Logging import Logger_factory,Logger
 
 
 
 
+class StrongRef:
+    """
+    Ссылка на функцию с тем же интерфейсом, что и weakref.WeakMethod.
+    Функции и lambda держатся сильной ссылкой, иначе они удалились бы сразу после подписки.
+    """
+
+    def __init__(self, handler: Callable) -> None:
+        self.handler = handler
+
+
+    def __call__(self) -> Callable:
+        return self.handler
+
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, StrongRef) and self.handler == other.handler
+
+
+    def __hash__(self) -> int:
+        return hash(self.handler)
+
+
+
+
 class Event_manager:
     """
     Класс-наблюдатель для управления пользовательскими событиями.
 
+    Событие - любой хешируемый ключ: строка или заранее посчитанный topic (см. Event_manager.topic).
+    Обработчики-методы хранятся слабыми ссылками, поэтому подписка не продлевает жизнь объекту,
+    а обработчики удалённых объектов убираются при следующем вызове события.
+    Событие можно привязать к элементу dpg - оно удалится вместе с элементом (remove_item, collect).
+
     Class Attributes:
-        _events: dict[str, list[Callable]] - словарь событий и их обработчиков
+        _events: dict[Hashable, list[weakref.WeakMethod | StrongRef]] - словарь событий и ссылок на их обработчики
+        _items: dict[str | int, set[Hashable]] - события, привязанные к элементам dpg
+        _deferred: deque - отложенные события (post), вызываются в flush
         logger: Logger - экземпляр логгера
     """
 
-    _events: dict[str, list[Callable]] = {}
+    _events: dict[Hashable, list[weakref.WeakMethod | StrongRef]] = {}
+    _items: dict[str | int, set[Hashable]] = {}
+    _deferred: deque = deque()
     logger: Logger = Logger_factory.from_instance()('events')
 
 
+    @staticmethod
+    def topic(item_id: str | int, kind: str, state: str = "") -> tuple:
+        """
+        Ключ события элемента. Считается один раз при подписке, а не при каждом вызове.
+
+        Args:
+            item_id: str | int - элемент dpg
+            kind: str - вид события (например, значение или состояние)
+            state: str, optional - состояние элемента
+        """
+        return (item_id, kind, state)
+
+
+    @staticmethod
+    def reference(handler: Callable) -> weakref.WeakMethod | StrongRef:
+        """
+        Ссылка на обработчик: слабая для методов объектов, сильная для остальных функций.
+        """
+        if hasattr(handler, "__self__") and hasattr(handler, "__func__"):
+            return weakref.WeakMethod(handler)
+
+        return StrongRef(handler)
+
+
     @classmethod
-    def add_custom_event(cls, event_name: str, handlers: list[Callable]) -> None:
+    def add_custom_event(cls, event_name: Hashable, handlers: list[Callable], item: str | int = None) -> None:
         """
         Добавление пользовательского события и его обработчиков.
 
         Args:
-            event_name: str - название события
+            event_name: Hashable - название события
             handlers: list[Callable] - список функций-обработчиков события
+            item: str | int, optional - элемент dpg, вместе с которым удаляется событие
         """
         if event_name not in cls._events:
             cls._events[event_name] = []
 
-        cls._events[event_name]+=handlers
+        cls._events[event_name] += [cls.reference(handler) for handler in handlers]
+
+        if item is not None:
+            cls._items.setdefault(item, set()).add(event_name)
 
 
     @classmethod
-    def remove_custom_event(cls, event_name: str = None, handler: Callable = None) -> None:
+    def remove_custom_event(cls, event_name: Hashable = None, handler: Callable = None) -> None:
         """
         Отписка от события, или очистка обработчика события или всех событий.
-        
+
         Args:
-            event_name: str, optional - название события. Если None, очищаются все события
+            event_name: Hashable, optional - название события. Если None, очищаются все события
             handler: Callable, optional - функция-обработчик для удаления
         """
         # Если не указано имя события, очищаем все события
         if not event_name:
             cls._events.clear()
+            cls._items.clear()
+            cls._deferred.clear()
             return
         # Если указан конкретный обработчик, удаляем только его
-        if handler and handler in cls._events[event_name]:
-            cls._events[event_name].remove(handler)
+        if handler and cls.reference(handler) in cls._events[event_name]:
+            cls._events[event_name].remove(cls.reference(handler))
         else:
             # Иначе удаляем все обработчики события
             del cls._events[event_name]
 
 
     @classmethod
-    def trigger_custom_event(cls, event_name: str,*args,**kwargs) -> None:
+    def remove_item(cls, item: str | int) -> None:
+        """
+        Удалить все события, привязанные к элементу dpg.
+
+        Args:
+            item: str | int - элемент dpg
+        """
+        for event_name in cls._items.pop(item, ()):
+            cls._events.pop(event_name, None)
+
+
+    @classmethod
+    def collect(cls) -> int:
+        """
+        Удалить события элементов, которых больше нет, и обработчики удалённых объектов.
+
+        Returns:
+            int - колличество удалённых событий
+        """
+        removed = 0
+
+        for item in [item for item in cls._items if not dpg.does_item_exist(item)]:
+            removed += len(cls._items[item])
+            cls.remove_item(item)
+
+        for event_name, references in list(cls._events.items()):
+            references[:] = [reference for reference in references if reference() is not None]
+            if not references:
+                del cls._events[event_name]
+                removed += 1
+
+        return removed
+
+
+    @classmethod
+    def trigger_custom_event(cls, event_name: Hashable,*args,**kwargs) -> None:
         """
         Вызов пользовательского события.
 
         Args:
-            event_name: str - название события
+            event_name: Hashable - название события
             *args, **kwargs - аргументы, передаваемые обработчикам
         """
         if event_name not in cls._events:
-            cls.logger.error(f"Событие '{event_name}' не определено")
+            cls.logger.error("Событие '%s' не определено", event_name)
             return
 
-        for handler in cls._events[event_name]:
+        references = cls._events[event_name]
+        for reference in list(references):
+            handler = reference()
+            if handler is None:
+                references.remove(reference)
+                continue
+
             handler(*args,**kwargs)
 
 
+    @classmethod
+    def post(cls, event_name: Hashable, *args, **kwargs) -> None:
+        """
+        Отложить вызов события до flush. Можно вызывать из любого потока.
+
+        Args:
+            event_name: Hashable - название события
+            *args, **kwargs - аргументы, передаваемые обработчикам
+        """
+        cls._deferred.append((event_name, args, kwargs))
+
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Вызвать отложенные события в порядке post. Событие без аргументов,
+        отложенное несколько раз, вызывается один раз.
+
+        Returns:
+            int - колличество вызванных событий
+        """
+        triggered = set()
+        count = 0
+
+        while cls._deferred:
+            event_name, args, kwargs = cls._deferred.popleft()
+
+            if not args and not kwargs:
+                if event_name in triggered: continue
+                triggered.add(event_name)
+
+            cls.trigger_custom_event(event_name, *args, **kwargs)
+            count += 1
+
+        return count
+
+
 
     @classmethod
-    def get_events(cls) -> dict[str, list[Callable]]:
+    def get_events(cls) -> dict[Hashable, list[Callable]]:
         """
         Метод для доступа к словарю событий.
 
         Returns:
-            dict[str, list[Callable]] - словарь событий и их обработчиков
+            dict[Hashable, list[Callable]] - словарь событий и их обработчиков
         """
-        return cls._events
+        events = {}
+        for event_name, references in cls._events.items():
+            handlers = [reference() for reference in references]
+            events[event_name] = [handler for handler in handlers if handler is not None]
+
+        return events
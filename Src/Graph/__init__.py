@@ -0,0 +1,5 @@
+from Src.Graph.graph import Graph, Port
+from Src.Graph.scheduler import Scheduler, ExecutionPlan, ExecutionReport
+from Src.Graph.graph_file import GraphFile, NodeRecord
+from Src.Graph.shape_rules import ShapeRules, ShapeError
+from Src.Graph.preflight import Preflight, PreflightReport
\ No newline at end of file
@@ -0,0 +1,284 @@
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from Src.Nodes import AbstractNode, node_link
+from Src.Config.Annotations import ANode
+from Src.Utils import OrderedSet
+
+
+
+@dataclass
+class Port:
+    '''
+    Атрибут узла (dpg.node_attribute), через который узлы связываются.
+    '''
+    node: AbstractNode
+    label: str
+
+
+
+class Graph:
+    '''
+    Граф нодов, хранящийся в памяти независимо от DearPyGUI. Редактор отражает в нём
+    все изменения, а обход, проверки и удаление работают через словари и множества.
+
+    Attributes:
+        nodes: dict[str | int, AbstractNode] - ноды по их индетификатору (dpg.node)
+        ports: dict[str | int, Port] - атрибуты нодов по их индетификатору (dpg.node_attribute)
+        links: dict[str | int, node_link] - связи по их индетификатору (dpg.add_node_link)
+        start_nodes: OrderedSet - ноды без входящих связей, с них начинается компиляция
+        dirty: set[AbstractNode] - ноды, которые изменились с последней компиляции и должны быть пересобраны
+    '''
+    nodes: dict[str | int, AbstractNode]
+    ports: dict[str | int, Port]
+    links: dict[str | int, node_link]
+    start_nodes: OrderedSet
+    dirty: set[AbstractNode]
+    __node_ports: dict[AbstractNode, list[str | int]]
+    __link_ids: dict[tuple[str | int, str | int], str | int]
+    __predecessors: dict[AbstractNode, Counter]
+    __successors: dict[AbstractNode, Counter]
+
+
+    def __init__(self):
+        self.nodes = {}
+        self.ports = {}
+        self.links = {}
+        self.start_nodes = OrderedSet()
+        self.dirty = set()
+        self.__node_ports = {}
+        self.__link_ids = {}
+        self.__predecessors = {}
+        self.__successors = {}
+
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+    def __contains__(self, node: AbstractNode) -> bool:
+        return node in self.__successors
+
+
+    def __iter__(self) -> Iterator[AbstractNode]:
+        return iter(self.nodes.values())
+
+
+    def add_node(self, node: AbstractNode, ports: dict[str | int, str] = None) -> AbstractNode:
+        '''
+        Добавить ноду в граф. Новая нода не имеет связей, поэтому становится начальной.
+
+        Args:
+            node: AbstractNode - нода, которую добавить
+            ports: dict[str | int, str] - атрибуты ноды и их названия
+        '''
+        self.nodes[node.node_tag] = node
+        self.__node_ports[node] = []
+        self.__predecessors[node] = Counter()
+        self.__successors[node] = Counter()
+        self.start_nodes.add(node)
+        self.dirty.add(node)
+
+        for attr_id, label in (ports or {}).items():
+            self.add_port(node, attr_id, label)
+
+        return node
+
+
+    def add_nodes(self, nodes: dict[AbstractNode, dict[str | int, str]]):
+        '''
+        Добавить сразу много нод вместе с их атрибутами.
+
+        Args:
+            nodes: dict[AbstractNode, dict[str | int, str]] - ноды и их атрибуты с названиями
+        '''
+        self.nodes |= {node.node_tag: node for node in nodes}
+        self.start_nodes += nodes
+        self.dirty.update(nodes)
+
+        for node, ports in nodes.items():
+            self.__predecessors[node] = Counter()
+            self.__successors[node] = Counter()
+            self.__node_ports[node] = list(ports)
+            self.ports |= {attr_id: Port(node, label) for attr_id, label in ports.items()}
+
+
+    def add_port(self, node: AbstractNode, attr_id: str | int, label: str) -> Port:
+        '''
+        Зарегистрировать атрибут ноды.
+        '''
+        port = Port(node, label)
+        self.ports[attr_id] = port
+        self.__node_ports[node].append(attr_id)
+        return port
+
+
+    def remove_node(self, node: AbstractNode) -> dict[str | int, node_link]:
+        '''
+        Удалить ноду вместе со всеми её связями.
+
+        Returns:
+            dict[str | int, node_link] - удалённые связи по их индетификаторам
+        '''
+        pairs = [(attr_out, attr_in) for attr_in, attrs_out in node.incoming.items() for attr_out in attrs_out]
+        pairs += [(attr_out, attr_in) for attr_out, attrs_in in node.outgoing.items() for attr_in in attrs_in]
+
+        removed = {}
+        for attr_out, attr_in in pairs:
+            link_id = self.__link_ids.get((attr_out, attr_in))
+            removed[link_id] = self.links.get(link_id)
+            self.unlink(attr_out, attr_in)
+
+        for attr_id in self.__node_ports.pop(node):
+            del self.ports[attr_id]
+
+        del self.nodes[node.node_tag]
+        del self.__predecessors[node]
+        del self.__successors[node]
+        self.start_nodes.discard(node)
+        self.dirty.discard(node)
+
+        return removed
+
+
+    def ports_of(self, node: AbstractNode) -> dict[str, str | int]:
+        '''
+        Атрибуты ноды по их названиям.
+        '''
+        return {self.ports[attr_id].label: attr_id for attr_id in self.__node_ports[node]}
+
+
+    def node_of(self, attr_id: str | int) -> AbstractNode:
+        '''
+        Нода, которой принадлежит атрибут.
+        '''
+        return self.ports[attr_id].node
+
+
+    def check_link(self, attr_out: str | int, attr_in: str | int) -> str | None:
+        '''
+        Проверить, можно ли связать атрибуты.
+
+        Returns:
+            str | None - описание причины, по которой связь невозможна, либо None
+        '''
+        node_out = self.node_of(attr_out)
+        node_in = self.node_of(attr_in)
+        label = self.ports[attr_in].label
+
+        parameter = node_in.annotations.get(label)
+        if not parameter or not isinstance(parameter.hint, ANode):
+            return f"{node_out} -> {node_in}({label}) атрибут не принимает связи"
+
+        accaptable: ANode = parameter.hint
+        if not isinstance(node_out, accaptable.node_type):
+            return f"{node_out} -> {node_in}({label}) должно быть {accaptable.node_type}"
+
+        if accaptable.single and node_in.incoming.get(attr_in):
+            return f"{node_out} -> {node_in}({label}) связей не может быть больше 1!"
+
+        return None
+
+
+    def link(self, attr_out: str | int, attr_in: str | int, link_id: str | int = None) -> node_link:
+        '''
+        Связать исходящий атрибут одной ноды с входящим атрибутом другой.
+
+        Args:
+            attr_out: str | int - исходящий атрибут
+            attr_in: str | int - входящий атрибут
+            link_id: str | int - индетификатор связи, по умолчанию пара атрибутов
+        '''
+        node_out = self.node_of(attr_out)
+        node_in = self.node_of(attr_in)
+
+        node_out.outgoing.setdefault(attr_out, []).append(attr_in)
+        node_in.incoming.setdefault(attr_in, []).append(attr_out)
+
+        self.__successors[node_out][node_in] += 1
+        self.__predecessors[node_in][node_out] += 1
+        self.start_nodes.discard(node_in)
+        self.dirty.add(node_in)
+
+        if link_id is None: link_id = (attr_out, attr_in)
+        link = node_link(attr_out, attr_in)
+        self.links[link_id] = link
+        self.__link_ids[(attr_out, attr_in)] = link_id
+
+        return link
+
+
+    def unlink(self, attr_out: str | int, attr_in: str | int):
+        '''
+        Убрать связь между атрибутами.
+        '''
+        node_out = self.node_of(attr_out)
+        node_in = self.node_of(attr_in)
+
+        node_out.outgoing[attr_out].remove(attr_in)
+        node_in.incoming[attr_in].remove(attr_out)
+
+        if not node_out.outgoing[attr_out]: del node_out.outgoing[attr_out]
+        if not node_in.incoming[attr_in]: del node_in.incoming[attr_in]
+
+        for counters, key, value in ((self.__successors, node_out, node_in),
+                                     (self.__predecessors, node_in, node_out)):
+            counters[key][value] -= 1
+            if not counters[key][value]: del counters[key][value]
+
+        if not self.__predecessors[node_in]: self.start_nodes.add(node_in)
+        self.dirty.add(node_in)
+
+        link_id = self.__link_ids.pop((attr_out, attr_in), None)
+        self.links.pop(link_id, None)
+
+
+    def successors(self, node: AbstractNode) -> Iterator[AbstractNode]:
+        '''
+        Ноды, к которым подключена эта нода (без повторов).
+        '''
+        return iter(self.__successors[node])
+
+
+    def predecessors(self, node: AbstractNode) -> Iterator[AbstractNode]:
+        '''
+        Ноды, которые подключены к этой ноде (без повторов).
+        '''
+        return iter(self.__predecessors[node])
+
+
+    def in_degree(self, node: AbstractNode) -> int:
+        '''
+        Колличество различных нод, подключенных к этой ноде.
+        '''
+        return len(self.__predecessors[node])
+
+
+    def mark_dirty(self, *nodes: AbstractNode):
+        '''
+        Отметить ноды изменёнными, при следующей компиляции они и всё, что от них зависит, будут пересобраны.
+        '''
+        self.dirty.update(node for node in nodes if node in self)
+
+
+    def mark_clean(self, *nodes: AbstractNode):
+        '''
+        Отметить ноды собранными, их OUTPUT можно переиспользовать.
+        '''
+        self.dirty.difference_update(nodes)
+
+
+    def downstream(self, nodes: Iterable[AbstractNode]) -> set[AbstractNode]:
+        '''
+        Ноды вместе со всеми нодами, которые от них зависят.
+        '''
+        closure = set(nodes)
+        queue = deque(closure)
+        while queue:
+            for successor in self.__successors[queue.popleft()]:
+                if successor not in closure:
+                    closure.add(successor)
+                    queue.append(successor)
+
+        return closure
@@ -0,0 +1,71 @@
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+
+
+
+@dataclass
+class NodeRecord:
+    '''
+    Сохранённая нода.
+
+    Attributes:
+        label: str - название ноды в каталоге (NodeAnnotation.label)
+        position: list[int] - позиция ноды в редакторе
+        parameters: dict[str, object] - значения входных параметров (Parameter) по их названиям
+    '''
+    label: str
+    position: list[int] = field(default_factory=lambda: [0, 0])
+    parameters: dict[str, object] = field(default_factory=dict)
+
+
+
+@dataclass
+class GraphFile:
+    '''
+    Граф редактора в виде, который сохраняется в JSON. Ноды ссылаются друг на друга по номеру в списке,
+    а связь записывается как [номер ноды, атрибут, номер ноды, атрибут].
+
+    Attributes:
+        version: int - версия формата
+        nodes: list[NodeRecord] - ноды
+        links: list[list] - связи между атрибутами нод
+    '''
+    VERSION = 1
+    version: int = VERSION
+    nodes: list[NodeRecord] = field(default_factory=list)
+    links: list[list[int | str]] = field(default_factory=list)
+
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GraphFile":
+        '''
+        Прочитать граф из словаря, проверив версию формата.
+        '''
+        version = data.get("version")
+        if not isinstance(version, int) or version > cls.VERSION:
+            raise ValueError(f"Неподдерживаемая версия файла графа - {version}")
+
+        nodes = [NodeRecord(**node) for node in data.get("nodes", [])]
+        links = [list(link) for link in data.get("links", [])]
+
+        for link in links:
+            if len(link) != 4 or not all(0 <= link[index] < len(nodes) for index in (0, 2)):
+                raise ValueError(f"Некорректная связь в файле графа - {link}")
+
+        return cls(version, nodes, links)
+
+
+    def save(self, path: str | Path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, separators=(",", ":"))
+
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GraphFile":
+        with open(path, encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
@@ -0,0 +1,180 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+from Src.Nodes import AbstractNode, DataNode, ShapeNode, LayerNode, InputLayerNode, FitNode, MetricNode
+from Src.Config.Annotations import ANode
+from Src.Enums import AttrType
+from Src.Graph.graph import Graph
+from Src.Graph.shape_rules import ShapeRules, ShapeError
+
+
+
+@dataclass
+class PreflightReport:
+    '''
+    Результат предварительной проверки графа.
+
+    Attributes:
+        errors: dict[AbstractNode, list[str]] - ошибки по нодам
+        shapes: dict[AbstractNode, tuple] - выведенные размерности: у данных - всего массива,
+            у слоёв - выхода с осью батча
+        rows: dict[AbstractNode, int] - колличество строк (примеров) у нод с данными
+    '''
+    errors: dict[AbstractNode, list[str]] = field(default_factory=dict)
+    shapes: dict[AbstractNode, tuple] = field(default_factory=dict)
+    rows: dict[AbstractNode, int] = field(default_factory=dict)
+
+
+    def add(self, node: AbstractNode, message: str):
+        self.errors.setdefault(node, []).append(message)
+
+
+    @property
+    def failed(self) -> set[AbstractNode]:
+        return set(self.errors)
+
+
+
+class Preflight:
+    '''
+    Проверка графа перед компиляцией, пока не прочитаны данные и не созданы слои.
+    Для каждой ноды проверяются типы подключённых нод и обязательные входы, размерности
+    передаются от ShapeNode (кэш или estimate_shape) через вход InputLayerNode по слоям (ShapeRules),
+    а у Fit и метрик сверяется колличество строк X и Y, если оно известно без чтения данных
+    (таблица уже прочитана или лежит в ArrayCache).
+
+    Ноды обходятся в топологическом порядке, каждая нода и каждая связь рассматриваются
+    один раз, поэтому проверка занимает O(V+E).
+
+    Attributes:
+        graph: Graph - граф, который проверяется
+    '''
+    # Входы, колличество строк в которых должно совпадать
+    PAIRED: dict[type, tuple[str, str]] = {FitNode: ("x", "y"), MetricNode: ("y_true", "y_pred")}
+    graph: Graph
+
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+
+
+    def check(self, order: Iterable[AbstractNode]) -> PreflightReport:
+        '''
+        Проверить ноды.
+
+        Args:
+            order: Iterable[AbstractNode] - ноды в топологическом порядке (ExecutionPlan.order)
+
+        Returns:
+            PreflightReport - ошибки и выведенные размерности
+        '''
+        report = PreflightReport()
+
+        for node in order:
+            ports = self.graph.ports_of(node)
+            sources = self.sources(node, ports, report)
+
+            if isinstance(node, ShapeNode): self.__data_shape(node, ports, report)
+            elif isinstance(node, InputLayerNode): self.__input_shape(node, sources, report)
+            elif isinstance(node, LayerNode): self.__layer_shape(node, ports, sources, report)
+            elif isinstance(node, DataNode) and not isinstance(node, MetricNode):
+                # Предобработка и предсказание сохраняют колличество строк своих данных
+                rows = [report.rows[source] for links in sources.values() for source, _ in links
+                        if source in report.rows]
+                if rows: report.rows[node] = rows[0]
+
+            for node_type, (first, second) in self.PAIRED.items():
+                if isinstance(node, node_type): self.__check_rows(node, sources, first, second, report)
+
+        return report
+
+
+    def sources(self, node: AbstractNode, ports: dict[str, str | int],
+                report: PreflightReport) -> dict[str, list[tuple[AbstractNode, str]]]:
+        '''
+        Ноды, подключённые к входам ноды, с проверкой их типа и колличества связей.
+
+        Returns:
+            dict[str, list[tuple[AbstractNode, str]]] - по названию входа: нода и её атрибут
+        '''
+        sources = {}
+
+        for label, parameter in node.annotations.items():
+            if parameter.attr_type != AttrType.INPUT or label not in ports: continue
+            if not (isinstance(parameter.hint, ANode) or parameter.hint is ANode): continue
+
+            attrs = node.incoming.get(ports[label], [])
+            sources[label] = [(self.graph.node_of(attr), self.graph.ports[attr].label) for attr in attrs]
+
+            if not attrs and label not in node.optional_inputs:
+                report.add(node, f"Вход {label} не подключён!")
+
+            if not isinstance(parameter.hint, ANode): continue
+            for source, _ in sources[label]:
+                if not isinstance(source, parameter.hint.node_type):
+                    report.add(node, f"К входу {label} подключена {source.__class__.__name__}, "
+                                     f"а должна быть {parameter.hint.node_type.__name__}!")
+            if parameter.hint.single and len(attrs) > 1:
+                report.add(node, f"К входу {label} подключено {len(attrs)} связей, а может быть только 1!")
+
+        return sources
+
+
+    @staticmethod
+    def kwargs(node: AbstractNode, ports: dict[str, str | int]) -> dict:
+        '''
+        Значения параметров ноды так же, как их передаст AbstractNode.compile.
+        '''
+        return {label: parameter.get_value(ports[label]) for label, parameter in node.annotations.items()
+                if parameter.attr_type == AttrType.INPUT and label in ports and
+                not (isinstance(parameter.hint, ANode) or parameter.hint is ANode)}
+
+
+    def __data_shape(self, node: ShapeNode, ports: dict[str, str | int], report: PreflightReport):
+        '''
+        Размерность данных: уже прочитанных, если нода не изменилась, иначе без чтения (ShapeNode.infer_shape).
+        '''
+        if node not in self.graph.dirty and isinstance(node.OUTPUT, np.ndarray):
+            shape = node.OUTPUT.shape
+        else:
+            shape = node.infer_shape(self.kwargs(node, ports))
+
+        if not shape: return
+        report.shapes[node] = tuple(shape)
+        if shape[0] is not None: report.rows[node] = shape[0]
+
+
+    def __input_shape(self, node: InputLayerNode, sources: dict[str, list[tuple[AbstractNode, str]]],
+                      report: PreflightReport):
+        '''
+        Вход модели получает размерность одного примера данных, подключённых к shape.
+        '''
+        for source, label in sources.get("shape", []):
+            if label == "shape" and isinstance(source, ShapeNode) and source in report.shapes:
+                report.shapes[node] = (None, *report.shapes[source][1:])
+
+
+    def __layer_shape(self, node: LayerNode, ports: dict[str, str | int],
+                      sources: dict[str, list[tuple[AbstractNode, str]]], report: PreflightReport):
+        if node.layer_name is None: return
+
+        inputs = [report.shapes.get(source) for source, _ in sources.get("INPUT", [])]
+        if not inputs or None in inputs: return
+
+        try:
+            shape = ShapeRules.infer(node.layer_name, inputs, self.kwargs(node, ports))
+        except ShapeError as ex:
+            report.add(node, str(ex))
+            return
+
+        if shape is not None: report.shapes[node] = shape
+
+
+    @staticmethod
+    def __check_rows(node: AbstractNode, sources: dict[str, list[tuple[AbstractNode, str]]],
+                     first: str, second: str, report: PreflightReport):
+        rows = [report.rows.get(source) for label in (first, second) for source, _ in sources.get(label, [])]
+        if len(rows) == 2 and None not in rows and rows[0] != rows[1]:
+            report.add(node, f"Колличество строк {first} ({rows[0]}) и {second} ({rows[1]}) не совпадает!")
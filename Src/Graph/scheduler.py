@@ -0,0 +1,229 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from Src.Nodes import AbstractNode
+from Src.Enums import ExecutorType
+from Src.Graph.graph import Graph
+
+
+
+@dataclass
+class ExecutionPlan:
+    '''
+    Порядок выполнения нодов, полученный топологической сортировкой.
+
+    Attributes:
+        order: list[AbstractNode] - ноды в порядке выполнения
+        cyclic: set[AbstractNode] - ноды, которые находятся в цикле
+        blocked: set[AbstractNode] - ноды, которые никогда не будут готовы (за циклом или ждут недостижимые ноды)
+        unreachable: set[AbstractNode] - ноды, до которых нельзя дойти от начальных
+    '''
+    order: list[AbstractNode] = field(default_factory=list)
+    cyclic: set[AbstractNode] = field(default_factory=set)
+    blocked: set[AbstractNode] = field(default_factory=set)
+    unreachable: set[AbstractNode] = field(default_factory=set)
+
+
+
+@dataclass
+class ExecutionReport:
+    '''
+    Результат выполнения плана.
+
+    Attributes:
+        executed: list[AbstractNode] - успешно выполненные ноды в порядке выполнения
+        failed: list[AbstractNode] - ноды, выполнение которых завершилось ошибкой
+        skipped: list[AbstractNode] - ноды, которые не выполнялись, потому что ошибка была выше по графу
+    '''
+    executed: list[AbstractNode] = field(default_factory=list)
+    failed: list[AbstractNode] = field(default_factory=list)
+    skipped: list[AbstractNode] = field(default_factory=list)
+
+
+
+class Scheduler:
+    '''
+    Планировщик выполнения графа по алгоритму Кана. Каждая нода и каждая связь
+    рассматриваются ровно один раз, поэтому построение плана занимает O(V+E).
+
+    Attributes:
+        graph: Graph - граф, который выполняется
+        executor: ExecutorType - последовательное выполнение или пул потоков
+        max_workers: int | None - размер пула потоков, по умолчанию как в ThreadPoolExecutor
+    '''
+    graph: Graph
+    executor: ExecutorType
+    max_workers: int | None
+
+
+    def __init__(self, graph: Graph, executor: ExecutorType = ExecutorType.SERIAL, max_workers: int = None):
+        self.graph = graph
+        self.executor = executor
+        self.max_workers = max_workers
+
+
+    def plan(self, start_nodes: Iterable[AbstractNode] = None, 
+             dirty: Iterable[AbstractNode] = None) -> ExecutionPlan:
+        '''
+        Построить порядок выполнения нодов, достижимых от начальных.
+
+        Args:
+            start_nodes: Iterable[AbstractNode] - ноды, с которых начать. По умолчанию начальные ноды графа.
+            dirty: Iterable[AbstractNode] - если передано, то в план попадают только эти ноды и те, 
+                что от них зависят. Остальные ноды переиспользуют свой OUTPUT.
+
+        Returns:
+            ExecutionPlan - порядок выполнения и ноды, которые выполнить нельзя
+        '''
+        if start_nodes is None: start_nodes = self.graph.start_nodes
+        start_nodes = list(dict.fromkeys(start_nodes))
+
+        reachable = set(start_nodes)
+        queue = deque(start_nodes)
+        while queue:
+            for successor in self.graph.successors(queue.popleft()):
+                if successor not in reachable:
+                    reachable.add(successor)
+                    queue.append(successor)
+
+        in_degree = {node: self.graph.in_degree(node) for node in reachable}
+        plan = ExecutionPlan(unreachable=set(self.graph) - reachable)
+
+        queue = deque(node for node in start_nodes if not in_degree[node])
+        while queue:
+            node = queue.popleft()
+            plan.order.append(node)
+
+            for successor in self.graph.successors(node):
+                in_degree[successor] -= 1
+                if not in_degree[successor]: queue.append(successor)
+
+        if dirty is not None:
+            closure = self.graph.downstream(dirty)
+            plan.order = [node for node in plan.order if node in closure]
+
+        leftover = {node for node, degree in in_degree.items() if degree}
+        plan.cyclic = self.__cycles(leftover)
+        plan.blocked = leftover - plan.cyclic
+
+        return plan
+
+
+    def __cycles(self, nodes: set[AbstractNode]) -> set[AbstractNode]:
+        '''
+        Из нод, которые не удалось упорядочить, оставить только те, что лежат на циклах.
+        Ноды без исходящих связей внутри множества последовательно отбрасываются.
+        '''
+        out_degree = {node: sum(successor in nodes for successor in self.graph.successors(node))
+                      for node in nodes}
+        queue = deque(node for node, degree in out_degree.items() if not degree)
+        cyclic = set(nodes)
+
+        while queue:
+            node = queue.popleft()
+            cyclic.discard(node)
+
+            for predecessor in self.graph.predecessors(node):
+                if predecessor not in cyclic: continue
+                out_degree[predecessor] -= 1
+                if not out_degree[predecessor]: queue.append(predecessor)
+
+        return cyclic
+
+
+    def run(self, plan: ExecutionPlan, execute: Callable[[AbstractNode], bool]) -> ExecutionReport:
+        '''
+        Выполнить ноды в порядке плана. Если нода завершилась ошибкой, то ноды, которые от неё
+        зависят, пропускаются, а независимые ветки продолжают выполняться.
+
+        В режиме ExecutorType.THREAD ноды, все зависимости которых уже выполнены, запускаются 
+        одновременно. Порядок в отчёте всё равно совпадает с порядком плана.
+
+        Args:
+            plan: ExecutionPlan - план выполнения
+            execute: Callable[[AbstractNode], bool] - выполнение одной ноды, возвращает статус
+
+        Returns:
+            ExecutionReport - какие ноды выполнены, завершились ошибкой или пропущены
+        '''
+        if self.executor == ExecutorType.THREAD and self.max_workers != 1:
+            return self.__run_parallel(plan, execute)
+
+        report = ExecutionReport()
+        broken = set()
+
+        for node in plan.order:
+            if any(predecessor in broken for predecessor in self.graph.predecessors(node)):
+                report.skipped.append(node)
+                broken.add(node)
+                continue
+
+            if execute(node):
+                report.executed.append(node)
+            else:
+                report.failed.append(node)
+                broken.add(node)
+
+        return report
+
+
+    def __run_parallel(self, plan: ExecutionPlan, execute: Callable[[AbstractNode], bool]) -> ExecutionReport:
+        '''
+        Выполнение плана в пуле потоков. Нода отправляется в пул, как только завершились
+        все её зависимости из плана.
+        '''
+        position = {node: index for index, node in enumerate(plan.order)}
+        waiting = {node: sum(predecessor in position for predecessor in self.graph.predecessors(node))
+                   for node in plan.order}
+        statuses: dict[AbstractNode, bool | None] = {}
+        futures: dict[Future, AbstractNode] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="graph") as pool:
+
+            def release(ready: Iterable[AbstractNode]):
+                queue = deque(ready)
+                while queue:
+                    node = queue.popleft()
+                    if any(statuses.get(predecessor) is not True for predecessor in self.graph.predecessors(node) 
+                           if predecessor in position):
+                        # Выше по графу ошибка, ноду не выполняем
+                        statuses[node] = None
+                        queue.extend(self.__finish(node, waiting))
+                    else:
+                        futures[pool.submit(execute, node)] = node
+
+            release(node for node in plan.order if not waiting[node])
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                ready = []
+                for future in sorted(done, key=lambda future: position[futures[future]]):
+                    node = futures.pop(future)
+                    statuses[node] = bool(future.exception() is None and future.result())
+                    ready += self.__finish(node, waiting)
+
+                release(ready)
+
+        report = ExecutionReport()
+        for node in plan.order:
+            status = statuses[node]
+            if status is None: report.skipped.append(node)
+            elif status: report.executed.append(node)
+            else: report.failed.append(node)
+
+        return report
+
+
+    def __finish(self, node: AbstractNode, waiting: dict[AbstractNode, int]) -> list[AbstractNode]:
+        '''
+        Отметить ноду завершённой и вернуть ноды, которые после этого стали готовы.
+        '''
+        ready = []
+        for successor in self.graph.successors(node):
+            if successor not in waiting: continue
+            waiting[successor] -= 1
+            if not waiting[successor]: ready.append(successor)
+
+        return ready
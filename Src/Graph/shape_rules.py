@@ -0,0 +1,299 @@
+from functools import partial
+from math import ceil, prod
+import re
+from typing import Callable
+
+
+
+class ShapeError(AttributeError):
+    '''
+    Размерности входов слоя несовместимы между собой или с параметрами слоя.
+    '''
+
+
+
+class ShapeRules:
+    '''
+    Дешёвые правила вывода размерности выхода слоя Keras по размерностям входов и параметрам слоя,
+    без импорта keras и создания самого слоя. Размерность - кортеж, первая ось которого батч,
+    None - ось, размер которой заранее неизвестен.
+
+    Для слоя без правила, а также если параметры слоя некорректны, размерность считается неизвестной
+    (None), тогда ошибку покажет уже сборка слоя. ShapeError бросается только если входы точно не подходят.
+    '''
+    # Слои, которые не меняют размерность входа
+    IDENTITY = {
+        "Activation", "ActivityRegularization", "AlphaDropout", "BatchNormalization", "Dropout", "ELU",
+        "GaussianDropout", "GaussianNoise", "GroupNormalization", "Identity", "LayerNormalization",
+        "LeakyReLU", "Masking", "PReLU", "ReLU", "Softmax", "SpatialDropout1D", "SpatialDropout2D",
+        "SpatialDropout3D", "UnitNormalization",
+    }
+    # Поэлементные слои слияния входов
+    MERGE = {"Add", "Subtract", "Multiply", "Average", "Maximum", "Minimum"}
+    RECURRENT = {"LSTM", "GRU", "SimpleRNN"}
+    CONV = re.compile(r"(Separable|Depthwise)?Conv([123])D")
+    POOLING = re.compile(r"(Max|Average)Pooling([123])D")
+    GLOBAL_POOLING = re.compile(r"Global(Max|Average)Pooling([123])D")
+
+
+    @classmethod
+    def infer(cls, layer_name: str, inputs: list[tuple | None], kwargs: dict) -> tuple | None:
+        '''
+        Размерность выхода слоя.
+
+        Args:
+            layer_name: str - название слоя из keras.layers
+            inputs: list[tuple | None] - размерности входов в порядке подключения
+            kwargs: dict - параметры слоя
+
+        Returns:
+            tuple | None - размерность выхода, либо None, если её нельзя вывести
+
+        Raises:
+            ShapeError - входы не подходят слою
+        '''
+        rule = cls.rule(layer_name)
+        if rule is None or not inputs or any(shape is None for shape in inputs): return None
+
+        try:
+            return rule(layer_name, [tuple(shape) for shape in inputs], kwargs)
+        except ShapeError:
+            raise
+        except Exception:
+            return None
+
+
+    @classmethod
+    def rule(cls, layer_name: str) -> Callable | None:
+        '''
+        Правило для слоя, либо None, если правила нет.
+        '''
+        if layer_name in cls.IDENTITY: return cls.identity
+        if layer_name in cls.MERGE: return cls.merge
+        if layer_name in cls.RECURRENT: return cls.recurrent
+
+        simple = {"Dense": cls.dense, "Flatten": cls.flatten, "Reshape": cls.reshape,
+                  "Concatenate": cls.concatenate, "Embedding": cls.embedding}
+        if layer_name in simple: return simple[layer_name]
+
+        for pattern, rule in ((cls.CONV, cls.conv), (cls.POOLING, cls.pooling),
+                              (cls.GLOBAL_POOLING, cls.global_pooling)):
+            match = pattern.fullmatch(layer_name)
+            if match: return partial(rule, rank=int(match.group(2)))
+
+        return None
+
+
+    @staticmethod
+    def single(layer_name: str, inputs: list[tuple], rank: int = None, min_rank: int = None) -> tuple:
+        '''
+        Единственный вход слоя с проверкой его размерности.
+        '''
+        if len(inputs) != 1:
+            raise ShapeError(f"Слой {layer_name} принимает один вход, подключено {len(inputs)}!")
+
+        shape = inputs[0]
+        if rank is not None and len(shape) != rank:
+            raise ShapeError(f"Слой {layer_name} ожидает вход размерности {rank} (с осью батча), "
+                             f"получен {ShapeRules.format(shape)}!")
+        if min_rank is not None and len(shape) < min_rank:
+            raise ShapeError(f"Слой {layer_name} ожидает вход размерности не меньше {min_rank} (с осью батча), "
+                             f"получен {ShapeRules.format(shape)}!")
+
+        return shape
+
+
+    @staticmethod
+    def format(shape: tuple) -> str:
+        return "(" + ", ".join("None" if axis is None else str(axis) for axis in shape) + ")"
+
+
+    @staticmethod
+    def sizes(value: int | tuple | list | None, rank: int, default: int | tuple = 1) -> tuple[int, ...]:
+        '''
+        Параметр слоя (kernel_size, strides, ...) в виде кортежа по всем пространственным осям.
+        None заменяется на default, а нули и отрицательные значения не принимаются, как и в Keras.
+        '''
+        if value is None: value = default
+        sizes = (value,) * rank if isinstance(value, int) else tuple(int(item) for item in value)
+        if len(sizes) != rank or any(size <= 0 for size in sizes): raise TypeError(value)
+        return sizes
+
+
+    @staticmethod
+    def positive(value: int) -> int:
+        if not isinstance(value, int) or value <= 0: raise TypeError(value)
+        return value
+
+
+    @staticmethod
+    def window(size: int | None, kernel: int, stride: int, padding: str, dilation: int = 1) -> int | None:
+        '''
+        Размер оси после свёртки или пулинга.
+        '''
+        if size is None: return None
+        if padding in ("same", "causal"): return ceil(size / stride)
+        if padding != "valid": raise TypeError(padding)
+
+        return (size - (kernel - 1) * dilation - 1) // stride + 1
+
+
+    @staticmethod
+    def spatial(shape: tuple, kwargs: dict) -> tuple[tuple, int | None]:
+        '''
+        Пространственные оси и число каналов с учётом data_format.
+        '''
+        if kwargs.get("data_format") == "channels_first": return shape[2:], shape[1]
+        return shape[1:-1], shape[-1]
+
+
+    @staticmethod
+    def join(shape: tuple, spatial: tuple, channels: int | None, kwargs: dict) -> tuple:
+        if kwargs.get("data_format") == "channels_first": return (shape[0], channels, *spatial)
+        return (shape[0], *spatial, channels)
+
+
+    @classmethod
+    def identity(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        return cls.single(layer_name, inputs)
+
+
+    @classmethod
+    def dense(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        shape = cls.single(layer_name, inputs, min_rank=2)
+        return (*shape[:-1], cls.positive(kwargs["units"]))
+
+
+    @classmethod
+    def flatten(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        shape = cls.single(layer_name, inputs, min_rank=1)
+        features = shape[1:]
+        return (shape[0], None if None in features else prod(features))
+
+
+    @classmethod
+    def reshape(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        shape = cls.single(layer_name, inputs, min_rank=1)
+        target = tuple(int(axis) for axis in kwargs["target_shape"])
+        if None in shape[1:]: return (shape[0], *(None if axis == -1 else axis for axis in target))
+
+        size, known = prod(shape[1:]), prod(axis for axis in target if axis != -1)
+        if -1 in target:
+            if not known or size % known:
+                raise ShapeError(f"Вход {cls.format(shape)} нельзя привести к {target}!")
+            target = tuple(size // known if axis == -1 else axis for axis in target)
+        elif size != known:
+            raise ShapeError(f"Вход {cls.format(shape)} нельзя привести к {target}: {size} != {known}!")
+
+        return (shape[0], *target)
+
+
+    @classmethod
+    def embedding(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        return (*cls.single(layer_name, inputs), cls.positive(kwargs["output_dim"]))
+
+
+    @classmethod
+    def recurrent(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple | None:
+        shape = cls.single(layer_name, inputs, rank=3)
+        # Вместе с состояниями слой возвращает список тензоров
+        if kwargs.get("return_state"): return None
+
+        units = cls.positive(kwargs["units"])
+        return (shape[0], shape[1], units) if kwargs.get("return_sequences") else (shape[0], units)
+
+
+    @classmethod
+    def conv(cls, layer_name: str, inputs: list[tuple], kwargs: dict, rank: int) -> tuple:
+        shape = cls.single(layer_name, inputs, rank=rank + 2)
+        spatial, channels = cls.spatial(shape, kwargs)
+
+        kernel = cls.sizes(kwargs["kernel_size"], rank)
+        strides = cls.sizes(kwargs.get("strides"), rank)
+        dilation = cls.sizes(kwargs.get("dilation_rate"), rank)
+        padding = kwargs.get("padding") or "valid"
+
+        spatial = tuple(cls.window(size, size_kernel, stride, padding, rate) 
+                        for size, size_kernel, stride, rate in zip(spatial, kernel, strides, dilation))
+        if any(axis is not None and axis <= 0 for axis in spatial):
+            raise ShapeError(f"Ядро {kernel} слоя {layer_name} больше входа {cls.format(shape)}!")
+
+        if layer_name.startswith("Depthwise"):
+            multiplier = kwargs.get("depth_multiplier") or 1
+            filters = None if channels is None else channels * multiplier
+        else:
+            filters = cls.positive(kwargs["filters"])
+
+        return cls.join(shape, spatial, filters, kwargs)
+
+
+    @classmethod
+    def pooling(cls, layer_name: str, inputs: list[tuple], kwargs: dict, rank: int) -> tuple:
+        shape = cls.single(layer_name, inputs, rank=rank + 2)
+        spatial, channels = cls.spatial(shape, kwargs)
+
+        pool = cls.sizes(kwargs.get("pool_size"), rank, default=2)
+        strides = cls.sizes(kwargs.get("strides"), rank, default=pool)
+        padding = kwargs.get("padding") or "valid"
+
+        spatial = tuple(cls.window(size, kernel, stride, padding) for size, kernel, stride in zip(spatial, pool, strides))
+        if any(axis is not None and axis <= 0 for axis in spatial):
+            raise ShapeError(f"Окно {pool} слоя {layer_name} больше входа {cls.format(shape)}!")
+
+        return cls.join(shape, spatial, channels, kwargs)
+
+
+    @classmethod
+    def global_pooling(cls, layer_name: str, inputs: list[tuple], kwargs: dict, rank: int) -> tuple:
+        shape = cls.single(layer_name, inputs, rank=rank + 2)
+        spatial, channels = cls.spatial(shape, kwargs)
+
+        if kwargs.get("keepdims"): return cls.join(shape, (1,) * rank, channels, kwargs)
+        return (shape[0], channels)
+
+
+    @classmethod
+    def concatenate(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        ranks = {len(shape) for shape in inputs}
+        if len(ranks) != 1:
+            raise ShapeError(f"Слой {layer_name} объединяет входы одной размерности, "
+                             f"получены {', '.join(map(cls.format, inputs))}!")
+
+        rank = ranks.pop()
+        axis = kwargs.get("axis", -1)
+        axis = axis % rank if isinstance(axis, int) else -1
+
+        output = []
+        for index, sizes in enumerate(zip(*inputs)):
+            if index == axis:
+                output.append(None if None in sizes else sum(sizes))
+                continue
+
+            known = {size for size in sizes if size is not None}
+            if len(known) > 1:
+                raise ShapeError(f"Слой {layer_name}: входы {', '.join(map(cls.format, inputs))} "
+                                 f"различаются не только по оси {axis}!")
+            output.append(known.pop() if known else None)
+
+        return tuple(output)
+
+
+    @classmethod
+    def merge(cls, layer_name: str, inputs: list[tuple], kwargs: dict) -> tuple:
+        '''
+        Поэлементное слияние с выравниванием осей по правому краю, как в numpy.
+        '''
+        rank = max(len(shape) for shape in inputs)
+        aligned = [(1,) * (rank - len(shape)) + shape for shape in inputs]
+
+        output = []
+        for sizes in zip(*aligned):
+            known = {size for size in sizes if size is not None and size != 1}
+            if len(known) > 1:
+                raise ShapeError(f"Слой {layer_name}: размерности входов "
+                                 f"{', '.join(map(cls.format, inputs))} не совпадают!")
+
+            if known: output.append(known.pop())
+            else: output.append(1 if all(size == 1 for size in sizes) else None)
+
+        return tuple(output)
@@ -1,2 +1,4 @@
 from Src.Logging.my_logger import Logger
+from Src.Logging.queue_handler import LazyQueueHandler, LogDispatcher
+from Src.Logging.log_console import LogConsole
 from Src.Logging.logger_factory import Logger_factory
\ No newline at end of file
@@ -0,0 +1,150 @@
+from collections import deque
+import logging
+
+import dearpygui.dearpygui as dpg
+
+
+
+class LogConsole(logging.Handler):
+    '''
+    Консоль логов внутри приложения. Записи хранятся в кольцевом буфере фиксированного размера,
+    старые вытесняются новыми, поэтому ни память, ни колличество элементов dpg не растут
+    при долгой работе.
+
+    emit вызывается из потока QueueListener и только кладёт запись в буфер. Строки в окне
+    обновляются в update не чаще раза за кадр (пока консоль видна), а clipper рисует
+    только видимые строки.
+
+    Attributes:
+        capacity: int - сколько последних записей хранится
+        level_filter: int - минимальный уровень показываемых записей
+    '''
+    CAPACITY = 500
+    WIDTH = 512
+    HEIGHT = 200
+    LEVELS: dict[str, int] = {"DEBUG": logging.DEBUG, "INFO": logging.INFO, "WARNING": logging.WARNING,
+                              "ERROR": logging.ERROR, "CRITICAL": logging.CRITICAL}
+    COLORS: dict[int, tuple[int, int, int]] = {logging.DEBUG: (150, 150, 150), logging.INFO: (220, 220, 220),
+                                               logging.WARNING: (255, 200, 80), logging.ERROR: (255, 90, 90),
+                                               logging.CRITICAL: (255, 40, 40)}
+    capacity: int
+    level_filter: int
+    __records: deque[tuple[int, str]]
+    __dirty: bool
+    __lines: list[int]
+    __shown: list[tuple[int, str] | None]
+    __window: int | str = None
+    __clipper: int | str = None
+
+
+    def __init__(self, capacity: int = CAPACITY, level_filter: int = logging.DEBUG):
+        super().__init__()
+        self.capacity = capacity
+        self.level_filter = level_filter
+        self.__records = deque(maxlen=capacity)
+        self.__dirty = False
+        self.__lines = []
+        self.__shown = []
+
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.__records.append((record.levelno, self.format(record)))
+            self.__dirty = True
+        except Exception:
+            self.handleError(record)
+
+
+    def records(self) -> list[tuple[int, str]]:
+        '''
+        Записи из буфера, которые проходят фильтр по уровню.
+
+        Returns:
+            list[tuple[int, str]] - уровень и текст записи, от старой к новой
+        '''
+        # emit выполняется под self.lock, поэтому копия буфера всегда целая
+        with self.lock:
+            records = list(self.__records)
+
+        return [record for record in records if record[0] >= self.level_filter]
+
+
+    def set_level_filter(self, level: int | str):
+        '''
+        Показывать только записи с уровнем не ниже level.
+        '''
+        self.level_filter = self.LEVELS[level] if isinstance(level, str) else level
+        self.__dirty = True
+
+
+    def build(self, parent: int | str) -> int | str:
+        '''
+        Построить консоль в окне parent.
+
+        Returns:
+            int | str - индетификатор окна со строками логов
+        '''
+        level_name = logging.getLevelName(self.level_filter)
+        combo = dpg.add_combo(list(self.LEVELS), default_value=level_name, width=self.WIDTH // 4, parent=parent,
+                              callback=lambda sender, app_data: self.set_level_filter(app_data))
+
+        with dpg.child_window(width=self.WIDTH, height=self.HEIGHT, parent=parent) as self.__window:
+            self.__clipper = dpg.add_clipper()
+
+        # Обработчик видимости срабатывает каждый кадр, пока консоль видна - в нём и обновляем строки.
+        # У child_window такого обработчика нет, поэтому он висит на выборе уровня над строками
+        with dpg.item_handler_registry() as handlers:
+            dpg.add_item_visible_handler(callback=self.update)
+        dpg.bind_item_handler_registry(combo, handlers)
+
+        self.__lines = []
+        self.__shown = []
+        self.__dirty = True
+
+        return self.__window
+
+
+    def update(self) -> bool:
+        '''
+        Перенести новые записи из буфера в строки консоли.
+
+        Returns:
+            bool - были ли изменения
+        '''
+        if not self.__dirty or self.__clipper is None or not dpg.does_item_exist(self.__clipper): return False
+        # Сбрасываем до копирования буфера, чтоб запись, пришедшая во время обновления, не потерялась
+        self.__dirty = False
+        records = self.records()
+
+        bottom = dpg.get_y_scroll(self.__window) >= dpg.get_y_scroll_max(self.__window)
+
+        while len(self.__lines) < len(records):
+            self.__lines.append(dpg.add_text("", parent=self.__clipper, wrap=self.WIDTH))
+            self.__shown.append(None)
+
+        for index, line in enumerate(self.__lines):
+            record = records[index] if index < len(records) else None
+            shown = self.__shown[index]
+            if record == shown: continue
+
+            if record is None:
+                dpg.configure_item(line, show=False)
+            else:
+                if shown is None or shown[0] != record[0]:
+                    dpg.configure_item(line, show=True, color=self.COLORS.get(record[0], self.COLORS[logging.INFO]))
+                dpg.set_value(line, record[1])
+
+            self.__shown[index] = record
+
+        # Если консоль была прокручена до конца, остаёмся внизу, иначе не мешаем читать
+        if bottom: dpg.set_y_scroll(self.__window, -1.0)
+
+        return True
+
+
+    @property
+    def lines(self) -> tuple[int, ...]:
+        '''
+        Строки консоли (dpg.add_text), их не больше capacity.
+        '''
+        return tuple(self.__lines)
@@ -1,28 +1,44 @@
+import atexit
 import logging
 from datetime import datetime
 import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueListener
 from pathlib import Path
 
 import dearpygui.dearpygui as dpg
 
 from Src.Logging import Logger
+from Src.Logging.queue_handler import LazyQueueHandler, LogDispatcher
+from Src.Logging.log_console import LogConsole
 
 
 class Logger_factory(object):
     '''
     Класс для логирования, синглтон.
 
+    Логгеры не пишут в файл сами: запись кладётся в общую очередь, а в файл или консоль
+    её пишет фоновый поток (QueueListener), поэтому поток интерфейса не ждёт диск.
+
     Attributes:
         config: dict - конфигурация для создания логгеров.
+        console: LogConsole - консоль с последними записями всех логгеров
     '''
+    CONSOLE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     config: dict
+    console: LogConsole
     __console_tag: str | int
     __stage_tag: str | int
     __layout_tag: str | int
     _instance = None
     _loggers = {}
+    _queue: queue.Queue = None
+    _listener: QueueListener = None
+    _dispatcher: LogDispatcher = None
+    _queue_handler: LazyQueueHandler = None
+    _atexit_registered = False
 
 
     @classmethod
@@ -44,16 +60,25 @@ class Logger_factory(object):
 
         self.config = config
         logging.basicConfig(**self.config)
+        Logger_factory.start()
 
 
         self.__console_tag = dpg.generate_uuid()
         self.__stage_tag = dpg.generate_uuid()
 
+        self.console = LogConsole()
+        self.console.setFormatter(logging.Formatter(self.CONSOLE_FORMAT, config.get('datefmt')))
+
         with dpg.stage(tag=self.__stage_tag):
             with dpg.window(tag=self.__console_tag, autosize=True, \
                             pos=(dpg.get_viewport_width(), 0), \
                             no_background=True, no_collapse=True, no_move=True, no_resize=True, no_title_bar=True):
-                pass
+                self.console.build(self.__console_tag)
+
+        # Консоль прошлого экземпляра (после пересоздания контекста dpg) больше не показывается
+        if Logger_factory._instance is not None:
+            Logger_factory._dispatcher.remove_shared(Logger_factory._instance.console)
+        Logger_factory._dispatcher.add_shared(self.console)
 
         Logger_factory._instance = self
 
@@ -74,6 +99,7 @@ class Logger_factory(object):
             if not config: return logger
         else:
             logger = Logger(logger_name, layout_tag=self.__console_tag)
+            logger.addHandler(Logger_factory._queue_handler)
             Logger_factory._loggers[logger_name] = logger
 
         config = self.config | config
@@ -88,7 +114,8 @@ class Logger_factory(object):
         if 'format' in config and handler:
             handler.setFormatter(logging.Formatter(config['format']))
 
-        if handler: logger.addHandler(handler)
+        # Повторный вызов с конфигурацией заменяет обработчики логгера, а не добавляет ещё одни
+        Logger_factory._dispatcher.set_handlers(logger_name, [handler] if handler else [])
 
         if 'level' in config: 
             logger.setLevel(config['level'])
@@ -96,6 +123,49 @@ class Logger_factory(object):
         return logger        
     
 
+    @classmethod
+    def start(cls):
+        '''
+        Запустить фоновый поток записи логов, если он ещё не запущен.
+        '''
+        if cls._listener is not None: return
+
+        # Очередь и её обработчик живут дольше потока: логгеры держат ссылку на _queue_handler
+        if cls._queue is None:
+            cls._queue = queue.Queue()
+            cls._dispatcher = LogDispatcher()
+            cls._queue_handler = LazyQueueHandler(cls._queue)
+
+        cls._listener = QueueListener(cls._queue, cls._dispatcher)
+        cls._listener.start()
+        # При выходе дописываем всё, что осталось в очереди. stop сам проверяет, запущен ли поток,
+        # поэтому регистрируется один раз, а не при каждом перезапуске
+        if not cls._atexit_registered:
+            atexit.register(cls.stop)
+            cls._atexit_registered = True
+
+
+    @classmethod
+    def stop(cls):
+        '''
+        Дописать оставшиеся записи и остановить фоновый поток. Обработчики логгеров не закрываются,
+        а только сбрасываются на диск: после start логгеры пишут в них же, а закроет их logging.shutdown.
+        '''
+        if cls._listener is None: return
+
+        cls._listener.stop()
+        cls._dispatcher.flush()
+        cls._listener = None
+
+
+    @classmethod
+    def flush(cls):
+        '''
+        Дождаться, пока все записи из очереди будут записаны.
+        '''
+        if cls._listener is not None: cls._queue.join()
+
+
     def show(self, parent: str | int):
         '''
         Установить окно, в котором будет отображаться логи. (Справа сверху)
@@ -104,14 +174,16 @@ class Logger_factory(object):
             parent_window: str | int - индетификатор родительского окна
         '''
         from Src.Events.callbacks import DPGCallback
+        from Src.Events.callback_watcher import CallbackWatcher
 
         dpg.show_item(self.__console_tag)
 
         resize_callback = DPGCallback(parent)
         resize_callback.add_state_callback("rect_size", self.resize)
 
-        with dpg.handler_registry():
-            dpg.add_mouse_move_handler(callback=resize_callback.check)
+        # Размер окна проверяется раз за кадр, а не на каждое движение мыши
+        CallbackWatcher.register(resize_callback)
+        CallbackWatcher.attach(parent)
 
 
     def hide(self):
@@ -0,0 +1,82 @@
+import logging
+from logging.handlers import QueueHandler
+
+
+
+class LazyQueueHandler(QueueHandler):
+    '''
+    Кладёт запись в очередь как есть. В отличие от QueueHandler сообщение не форматируется
+    в потоке, который пишет лог: msg % args и traceback собираются уже в потоке QueueListener.
+    Поэтому аргументы, изменённые сразу после вызова логгера, могут попасть в лог уже изменёнными.
+    '''
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+
+class LogDispatcher(logging.Handler):
+    '''
+    Обработчик для QueueListener: передаёт запись обработчикам её логгера.
+    У каждого логгера свой набор обработчиков (свой файл или поток вывода),
+    а общие обработчики (консоль в приложении) получают записи всех логгеров.
+    '''
+    __handlers: dict[str, tuple[logging.Handler, ...]]
+    __shared: tuple[logging.Handler, ...]
+
+
+    def __init__(self):
+        super().__init__()
+        self.__handlers = {}
+        self.__shared = ()
+
+
+    def set_handlers(self, logger_name: str, handlers: list[logging.Handler]):
+        '''
+        Заменить обработчики логгера, старые обработчики закрываются.
+        '''
+        old = self.__handlers.get(logger_name, ())
+        self.__handlers[logger_name] = tuple(handlers)
+
+        for handler in old: handler.close()
+
+
+    def handlers(self, logger_name: str) -> tuple[logging.Handler, ...]:
+        return self.__handlers.get(logger_name, ())
+
+
+    def add_shared(self, handler: logging.Handler):
+        '''
+        Добавить обработчик, который получает записи всех логгеров.
+        '''
+        if handler not in self.__shared: self.__shared += (handler,)
+
+
+    def remove_shared(self, handler: logging.Handler):
+        self.__shared = tuple(shared for shared in self.__shared if shared is not handler)
+
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Кортежи заменяются целиком, поэтому их можно менять, пока поток QueueListener их обходит
+        for handler in self.__handlers.get(record.name, ()) + self.__shared:
+            if record.levelno >= handler.level: handler.handle(record)
+
+        return True
+
+
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
+
+    def flush(self):
+        for handler in [handler for handlers in self.__handlers.values() for handler in handlers] + \
+                list(self.__shared):
+            handler.flush()
+
+
+    def close(self):
+        for handlers in self.__handlers.values():
+            for handler in handlers: handler.close()
+
+        self.__handlers = {}
+        super().close()
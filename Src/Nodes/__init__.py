@@ -1,10 +1,11 @@
 from Src.Nodes.abstract_node import AbstractNode, node_link
-from Src.Nodes.layer_node import LayerNode, LayerResult
+from Src.Nodes.layer_node import LayerNode, LayerResult, LayerBuildError
 from Src.Nodes.input_layer_node import InputLayerNode
 from Src.Nodes.data_node import DataNode
 
 from Src.Nodes.shape_node import ShapeNode
 
+from Src.Nodes.model_cache import ModelCache
 from Src.Nodes.compile_node import CompileNode
 from Src.Nodes.utils_node import UtilsNode
 from Src.Nodes.metric_node import MetricNode
@@ -2,12 +2,15 @@ from dataclasses import dataclass
 from abc import ABC
 from typing import Callable
 import inspect
+import logging
 import traceback
 
 import dearpygui.dearpygui as dpg
 
 from Src.Logging import Logger_factory, Logger
 from Src.Config.parameter import Parameter, AttrType
+from Src.Enums import NodeState
+from Src.Utils import ThemeRegistry
 
 
 class AbstractNode(ABC):
@@ -21,6 +24,8 @@ class AbstractNode(ABC):
     '''
     __error_message: str = None
     _error_id: int | str = None
+    # Тема, которая сейчас привязана к ноде, чтобы не привязывать ту же тему повторно
+    _theme: int | str = None
 
     node_tag: str | int
     # Устанавливаем связи не между узлами, а между их аттрибутами
@@ -31,6 +36,8 @@ class AbstractNode(ABC):
     docs: str
     logger: Logger
     color: tuple[int, int, int, int] = (37, 37, 38, 255)
+    # Входы-связи, которые можно не подключать (по умолчанию обязательны все)
+    optional_inputs: frozenset[str] = frozenset()
 
 
     def __init__(self, node_tag: int | str, annotations: dict[str: type], \
@@ -77,8 +84,8 @@ class AbstractNode(ABC):
         args = []
         arguments = dpg.get_item_children(self.node_tag, slot=1)
 
-        self.logger.info(f"Компиляция ноды - {self.__class__.__name__}")
-        self.logger.debug(f"Аргументы ноды - {arguments}")
+        self.logger.info("Компиляция ноды - %s", self.__class__.__name__)
+        self.logger.debug("Аргументы ноды - %s", arguments)
 
         for argument in arguments:
             name = dpg.get_item_label(argument)
@@ -92,12 +99,14 @@ class AbstractNode(ABC):
                 if not isinstance(args, list): args = [args]
                 continue
 
-            self.logger.debug(f"Аннотация - {self.annotations[name]}")
+            self.logger.debug("Аннотация - %s", self.annotations[name])
 
             kwargs[name] = self.annotations[name].get_value(argument)
 
-            self.logger.debug(kwargs)
-            self.logger.debug(args)
+            # kwargs дополняется на следующих шагах, поэтому строку собираем сразу
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{kwargs}")
+                self.logger.debug(f"{args}")
 
         try: 
             self.OUTPUT = self.logic(*args, **kwargs)
@@ -115,49 +124,43 @@ class AbstractNode(ABC):
     
 
     def raise_error(self, error_message: str, error_message_type: str = "Неизвестная ошибка"):
-        with dpg.theme() as error_theme:
-            with dpg.theme_component(dpg.mvNode):
-                dpg.add_theme_color(dpg.mvNodeCol_NodeOutline, (175, 0, 0, 255), category=dpg.mvThemeCat_Nodes)
+        self.bind_theme(ThemeRegistry.node(self.color, NodeState.ERROR))
+        self.remove_error()
 
-            with dpg.theme_component(dpg.mvTooltip):
-                dpg.add_theme_color(dpg.mvThemeCol_Border, (175, 0, 0, 255), category=dpg.mvThemeCat_Core)
+        # Ноды собираются и в других потоках, а стек контейнеров dpg общий, поэтому родитель указывается явно
+        attr = dpg.add_node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static)
+        self._error_id = dpg.add_text("ОШИБКА!", parent=attr)
 
-        dpg.bind_item_theme(self.node_tag, error_theme)
-
-        self._error_id = dpg.generate_uuid()
-        with dpg.node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static):
-            dpg.add_text("ОШИБКА!", tag=self._error_id)
-            
-        with dpg.tooltip(parent=self._error_id):
-            dpg.add_text(f"{error_message_type}:")
-            dpg.add_text(error_message)
+        tooltip = dpg.add_tooltip(self._error_id)
+        dpg.add_text(f"{error_message_type}:", parent=tooltip)
+        dpg.add_text(error_message, parent=tooltip)
 
         self.logger.warning(f"Поймана ошибка ({error_message_type}): {error_message}")
-        self.logger.info(traceback.format_exc())
-
-        if dpg.does_item_exist("fit_window"):
-                dpg.delete_item("fit_window")
+        if self.logger.isEnabledFor(logging.INFO): self.logger.info(traceback.format_exc())
 
     def default_theme(self):
-        with dpg.theme() as default_theme:
-            with dpg.theme_component(dpg.mvNode):
-                dpg.add_theme_color(dpg.mvNodeCol_TitleBar, self.color, category=dpg.mvThemeCat_Nodes)
-                dpg.add_theme_color(dpg.mvNodeCol_TitleBarHovered, 
-                                    [min(color * 1.2, 255) for color in self.color],
-                                    category=dpg.mvThemeCat_Nodes)
-                dpg.add_theme_color(dpg.mvNodeCol_TitleBarSelected, 
-                                    [min(color * 1.25, 255) for color in self.color],
-                                    category=dpg.mvThemeCat_Nodes)
-                dpg.add_theme_color(dpg.mvNodeCol_NodeOutline, (100, 100, 100, 255), category=dpg.mvThemeCat_Nodes)
-            
-            with dpg.theme_component(dpg.mvTooltip):
-                dpg.add_theme_color(dpg.mvThemeCol_Border, (78, 78, 78, 255), category=dpg.mvThemeCat_Core)
-            
-        dpg.bind_item_theme(self.node_tag, default_theme)
+        self.bind_theme(ThemeRegistry.node(self.color, NodeState.DEFAULT))
+        self.remove_error()
+        self.__error_message = None
 
+
+    def bind_theme(self, theme: int | str):
+        '''
+        Привязать к ноде общую тему из ThemeRegistry, если она ещё не привязана.
+        '''
+        if theme == self._theme: return
+
+        dpg.bind_item_theme(self.node_tag, theme)
+        self._theme = theme
+
+
+    def remove_error(self):
+        '''
+        Удалить атрибут с сообщением о предыдущей ошибке.
+        '''
         if self._error_id and dpg.does_item_exist(self._error_id): 
             dpg.delete_item(dpg.get_item_parent(self._error_id))
-        self.__error_message = None
+        self._error_id = None
 
 
 @dataclass
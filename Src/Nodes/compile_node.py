@@ -1,21 +1,125 @@
-import keras
-
+from Src.Logging import Logger_factory
 from Src.Nodes import AbstractNode, LayerResult
+from Src.Nodes.layer_node import LayerBuildError
+from Src.Nodes.model_cache import ModelCache
+from Src.Utils import LazyModule
+
+
+keras = LazyModule("keras")
 
 
 
 class CompileNode(AbstractNode):
-    logic: keras.models.Model.compile
+    '''
+    Сборка и компиляция модели из выходов слоёв. Собранные модели хранятся в ModelCache,
+    поэтому повторная сборка с той же структурой слоёв и теми же параметрами возвращает ту же модель.
+    Если структура изменилась, слои, цепочка до которых осталась прежней, получают веса
+    предыдущей модели и могут быть заморожены - тогда после правки одного слоя модель
+    достаточно дообучить. Без переноса весов модель собирается из новых слоёв, даже если
+    ноды слоёв не пересобирались.
+
+    Attributes:
+        cache: ModelCache - собранные моделей этой ноды
+    '''
+    logic: "keras.models.Model.compile"
     color = (0, 150, 0, 255)
+    cache: ModelCache
+
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = ModelCache()
 
 
     # TODO: Настроить правильные аннотации от logic
     @staticmethod
-    def compile_model(*args: LayerResult, **kwargs):
-        inputs = tuple(set().union(*[arg.inputs for arg in args]))
-        outputs = tuple(arg.layer for arg in args)
-        if len(inputs) == 1: inputs = inputs[0]
-        if len(outputs) == 1: outputs = outputs[0]
-        model = keras.models.Model(inputs=inputs, outputs=outputs)
-        model.compile(**kwargs)
+    def compile_model(*args: LayerResult, cache: ModelCache = None, 
+                      transfer_weights: bool = True, freeze_transferred: bool = False, **kwargs):
+        options = (transfer_weights, freeze_transferred, sorted(kwargs.items(), key=lambda item: item[0]))
+        key = LayerResult.structure(*args) + repr(options)
+
+        def build(previous: dict = None) -> "tuple[keras.models.Model, dict]":
+            # Построенные слои нод, которые не пересобирались, несут обученные веса прошлой модели
+            results = args if transfer_weights else LayerResult.fresh(*args)
+            try:
+                outputs = tuple(result.layer for result in results)
+            except LayerBuildError as error:
+                # Ошибку показываем на ноде слоя, который не удалось построить
+                if error.result.owner is not None:
+                    error.result.owner.raise_error(str(error.error), "Некорректные данные для узла")
+                raise
+
+            inputs = []
+            for result in results:
+                inputs += [layer for layer in result.ordered_inputs() if layer not in inputs]
+
+            inputs = tuple(inputs)
+            if len(inputs) == 1: inputs = inputs[0]
+            if len(outputs) == 1: outputs = outputs[0]
+            model = keras.models.Model(inputs=inputs, outputs=outputs)
+
+            layers = {signature: [result.operation for result in same if result.operation is not None]
+                      for signature, same in LayerResult.signatures(*results).items()}
+            if transfer_weights and previous:
+                CompileNode.transfer_weights(previous, layers, freeze_transferred)
+
+            # trainable учитывается только при компиляции, поэтому веса переносятся до неё
+            model.compile(**kwargs)
+            return model, layers
+
+        if cache is None: return build()[0]
+        return cache.get_or_build(key, build)
+
+
+    @staticmethod
+    def transfer_weights(previous: "dict[str, list[keras.layers.Layer]]", 
+                         layers: "dict[str, list[keras.layers.Layer]]", freeze: bool = False) -> int:
+        '''
+        Перенести веса слоёв прошлой модели в слои новой с тем же хэшем (LayerResult.signatures).
+        Слой пропускается, если форма весов не совпала. Слой, который остался тем же объектом
+        (его нода не пересобиралась), уже делит веса с прошлой моделью, ему меняется только заморозка.
+
+        Args:
+            previous: dict[str, list[keras.layers.Layer]] - слои прошлой модели
+            layers: dict[str, list[keras.layers.Layer]] - слои новой модели
+            freeze: bool - заморозить слои с перенесёнными весами
+
+        Returns:
+            int - колличество слоёв, которым перенесли веса
+        '''
+        transferred = 0
+
+        for signature, new_layers in layers.items():
+            for new, old in zip(new_layers, previous.get(signature, [])):
+                if not new.weights: continue
+                if new is old:
+                    new.trainable = not freeze
+                    continue
+                if [weight.shape for weight in new.weights] != [weight.shape for weight in old.weights]: continue
+
+                new.set_weights(old.get_weights())
+                if freeze: new.trainable = False
+                transferred += 1
+
+        # Без фабрики логов (сборка вне редактора) просто не пишем в лог
+        log_factory = Logger_factory.from_instance()
+        if transferred and log_factory:
+            log_factory("nodes").info("Перенесены веса %d слоёв из прошлой модели", transferred)
+
+        return transferred
+
+
+    def compile(self, kwargs: dict = None) -> bool:
+        return super().compile({"cache": self.cache} | (kwargs or {}))
+
+
+    @staticmethod
+    def warm_up() -> "keras.models.Model":
+        '''
+        Собрать и скомпилировать маленькую модель, чтобы Keras и TensorFlow загрузились
+        и прогрелись до того, как пользователь соберёт свой граф.
+        '''
+        inputs = keras.Input((1,))
+        model = keras.models.Model(inputs=inputs, outputs=keras.layers.Dense(1)(inputs))
+        model.compile(optimizer="adam", loss="mse")
         return model
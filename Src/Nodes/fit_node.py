@@ -1,43 +1,123 @@
-import keras
 import dearpygui.dearpygui as dpg
 import numpy as np
 
 from Src.Nodes import AbstractNode
+from Src.Utils import LazyModule
+
+
+keras = LazyModule("keras")
+
+
+def __getattr__(name: str):
+    # TrainingProgress наследуется от keras.callbacks.Callback, поэтому импортируется только когда нужен
+    if name == "TrainingProgress":
+        from Src.Nodes.training_progress import TrainingProgress
+        return TrainingProgress
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
 class FitNode(AbstractNode):
     color = (151, 0, 191, 255)
+    # Набор изображений, который читается по батчам, сам отдаёт пары (x, y)
+    optional_inputs = frozenset({"y"})
+    # Создаётся при первой сборке, чтобы построение ноды не импортировало keras
+    training: "TrainingProgress" = None
+    _progress_id: int | str = None
+    _status_id: int | str = None
+    _pause_id: int | str = None
 
 
     @staticmethod
-    def fit(model: keras.models.Model, **kwargs):
+    def fit(model: "keras.models.Model", **kwargs):
         if kwargs['epochs']<=0:
             raise AttributeError("Колличество эпох должно быть больше нуля!")
-        
+
+        # Набор данных, который читается по батчам, сам отдаёт пары (x, y)
+        if isinstance(kwargs['x'], keras.utils.PyDataset):
+            kwargs.pop('y', None)
+            model.fit(**kwargs, verbose=False)
+            return model
+
         if not(kwargs['x'].shape[0] and kwargs['x'].shape[1]):
             raise AttributeError('Не верная размерность или пустуе данные X!')
-        
+
         if not(kwargs['y'].shape[0] and kwargs['y'].shape[1]) :
             raise AttributeError('Не верная размерность или пустуе данные Y!')
-        
+
         if kwargs['x'].shape[0]!=kwargs['y'].shape[0]:
             raise AttributeError('Размерности X и Y не совпадают!')
-        
-        if not np.issubdtype(kwargs['x'].dtype, np.floating) or np.isnan(kwargs['x']).any() :
+
+        # Целые X - изображения в uint8 (ImageDataNode без stream), keras приводит их к float по батчам
+        if not np.issubdtype(kwargs['x'].dtype, np.integer) and \
+            (not np.issubdtype(kwargs['x'].dtype, np.floating) or np.isnan(kwargs['x']).any()):
             raise AttributeError('Данные содержат неверный формат X!')
-        
+
         if not np.issubdtype(kwargs['y'].dtype, np.floating) or np.isnan(kwargs['y']).any():
             raise AttributeError('Данные содержат неверный формат Y!')
 
-        with dpg.window(label="Обучение", modal=True, no_close=True,tag="fit_window") as popup:
-            dpg.add_loading_indicator(width=100, height=100)
-        
         model.fit(**kwargs, verbose=False)
 
-        dpg.delete_item(popup)
-
         return model
-    
 
 
+    def compile(self) -> bool:
+        '''
+        Обучение модели. Прогресс, метрики и оставшееся время показываются в самой ноде,
+        там же обучение можно поставить на паузу или отменить.
+        '''
+        if self.training is None:
+            from Src.Nodes.training_progress import TrainingProgress
+            self.training = TrainingProgress(self.show_progress)
+
+        # Отмена, нажатая после этого, даже до начала обучения, его остановит
+        self.training.cancelled = False
+        self.build_progress()
+        self.training.resume()
+
+        status = super().compile({'callbacks': [self.training]})
+        if not status: return False
+
+        if self.training.cancelled:
+            self.raise_error("Обучение было отменено пользователем", "Обучение прервано")
+            return False
+
+        return status
+
+
+    def build_progress(self):
+        '''
+        Создать в ноде полосу прогресса и кнопки управления обучением, если их ещё нет.
+        Элементы создаются с явным parent, потому что компиляция может идти не в основном потоке.
+        '''
+        if self._progress_id and dpg.does_item_exist(self._progress_id):
+            dpg.set_item_label(self._pause_id, "Пауза")
+            return
+
+        attr = dpg.add_node_attribute(parent=self.node_tag, attribute_type=dpg.mvNode_Attr_Static)
+        self._progress_id = dpg.add_progress_bar(parent=attr, width=256, default_value=0.0, overlay="0%")
+        self._status_id = dpg.add_text("", parent=attr)
+        group = dpg.add_group(parent=attr, horizontal=True)
+        self._pause_id = dpg.add_button(label="Пауза", parent=group, callback=self.toggle_pause)
+        dpg.add_button(label="Отмена", parent=group, callback=lambda: self.training.cancel())
+
+
+    def toggle_pause(self):
+        if self.training.paused: self.training.resume()
+        else: self.training.pause()
+
+        if dpg.does_item_exist(self._pause_id):
+            dpg.set_item_label(self._pause_id, "Продолжить" if self.training.paused else "Пауза")
+
+
+    def show_progress(self, training: "TrainingProgress"):
+        if not (self._progress_id and dpg.does_item_exist(self._progress_id)): return
+
+        dpg.set_value(self._progress_id, training.progress)
+        dpg.configure_item(self._progress_id, overlay=f"{training.progress:.0%}")
+
+        metrics = ", ".join(f"{key}: {value:.4f}" for key, value in training.logs.items())
+        eta = f"осталось ~{training.eta:.0f} c" if training.eta else ""
+        epochs = training.params.get('epochs', 0) if training.params else 0
+        dpg.set_value(self._status_id, f"Эпоха {training.epoch + 1}/{epochs} {eta}\n{metrics}")
@@ -1,20 +1,64 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import numpy as np
-import keras
 
 from Src.Nodes import ShapeNode
+from Src.Data import ImageLoader, ImageShardCache
+
+if TYPE_CHECKING: from Src.Data.image_stream import ImageStream
 
 
 
 class ImageDataNode(ShapeNode):
     color = (255, 155, 0, 255)
+    # Изменения внутри вложенных папок не видны по размеру и времени изменения папки,
+    # поэтому общий ArrayCache для изображений не используется, у них свой кэш по каждому файлу
+    cache = None
+    shard_cache: ImageShardCache = ImageShardCache()
 
 
-    # TODO: 100% не работает, нужно будет починить
     @staticmethod
-    def open_data(files: dict, *args, **kwargs):
-        images = []
-        for image_path in files:
-            image = keras.utils.load_img(image_path, *args, **kwargs)
-            images.append(image)
+    def open_data(files: list[Path] = None, directory: str = "", color_mode: str = "rgb",
+                  size: tuple[int, int] = None, labels: bool = False, stream: bool = False,
+                  batch_size: int = 32, cache: bool = False) -> "np.ndarray | ImageStream":
+        '''
+        Прочитать изображения. Изображения декодируются в нескольких потоках сразу в uint8 массив
+        (изображения, высота, ширина, каналы).
+
+        Args:
+            files: list[Path] - выбранные файлы
+            directory: str - папка или glob шаблон, изображения ищутся во всех вложенных папках
+            color_mode: str - grayscale, rgb или rgba
+            size: tuple[int, int] - (высота, ширина), нули - размер первого изображения
+            labels: bool - метки классов по названию папок, набор будет отдавать пары (x, y)
+            stream: bool - не загружать изображения целиком, а читать по батчам во время обучения
+            batch_size: int - размер батча для stream, батчи приводятся к float32 только при чтении
+            cache: bool - сохранить декодированные изображения в uint8 шарды и в следующий раз читать их.
+                Из шардов набор всегда отдаётся по батчам, как при stream, иначе он собрался бы в памяти целиком
+        '''
+        paths = ImageLoader.files([*(files or []), *([directory] if directory else [])])
+        if not paths:
+            raise AttributeError("Вы не выбрали изображения, которые нужно открыть!")
+
+        if labels and not stream:
+            raise AttributeError("Метки по названию папок можно получить только вместе с stream!")
+
+        loader = ImageLoader(size, color_mode)
+        shards = ImageDataNode.shard_cache.open(loader, paths) if cache else None
 
-        return np.array(images)
+        if stream or shards is not None:
+            return loader.stream(paths, ImageLoader.labels(paths)[0] if labels else None, batch_size, shards=shards)
+
+        return loader.load(paths)
+
+
+    @staticmethod
+    def estimate_shape(files: list[Path] = None, directory: str = "", color_mode: str = "rgb",
+                       size: tuple[int, int] = None, **kwargs) -> tuple[int, int, int, int] | None:
+        '''
+        Размерность (изображения, высота, ширина, каналы) по списку файлов и заголовку первого изображения.
+        '''
+        paths = ImageLoader.files([*(files or []), *([directory] if directory else [])])
+        if not paths: return None
+        return (len(paths), *ImageLoader(size, color_mode).shape(paths))
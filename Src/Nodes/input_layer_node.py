@@ -1,6 +1,8 @@
-from keras import layers
-
 from Src.Nodes import LayerNode, LayerResult
+from Src.Utils import LazyModule
+
+
+layers = LazyModule("keras.layers")
 
 
 
@@ -14,6 +16,6 @@ class InputLayerNode(LayerNode):
 
     @staticmethod
     def create_input(*args, **kwargs) -> LayerResult:
-        input_layer = layers.Input(**kwargs)
-        return LayerResult(input_layer, set([input_layer]))
+        spec = ("Input", repr(sorted(kwargs.items(), key=lambda item: item[0])))
+        return LayerResult.lazy(spec, lambda: layers.Input(**kwargs), is_input=True)
         
\ No newline at end of file
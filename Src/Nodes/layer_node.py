@@ -1,16 +1,194 @@
 from itertools import chain
-from dataclasses import dataclass
+from typing import Callable
+import hashlib
 
-from keras import layers
 import dearpygui.dearpygui as dpg
 
 from Src.Nodes import AbstractNode
+from Src.Utils import LazyModule
+
+
+layers = LazyModule("keras.layers")
 
 
-@dataclass
 class LayerResult:
-    layer: layers.Layer
-    inputs: set[layers.InputLayer]
+    '''
+    Выход слоя. Если результат создан через LayerResult.lazy, тензор keras строится только
+    при первом обращении к layer, поэтому, когда модель с такой же структурой уже собрана
+    (см. ModelCache), слои не создаются заново.
+
+    Attributes:
+        spec: tuple | None - тип слоя и его параметры, None - у готового тензора
+        sources: tuple[LayerResult, ...] - выходы, которые подаются на вход слоя
+        owner: LayerNode | None - нода, которая создала выход, на ней показывается ошибка построения слоя
+        operation: keras.layers.Layer | None - построенный слой keras (у входа модели и готового тензора - None)
+    '''
+    spec: tuple | None
+    sources: "tuple[LayerResult, ...]"
+    owner: "LayerNode" = None
+    operation: "layers.Layer" = None
+    __layer: "layers.Layer" = None
+    __inputs: "set[layers.InputLayer]" = None
+    __build: Callable = None
+    __is_input: bool = False
+
+
+    def __init__(self, layer: "layers.Layer", inputs: "set[layers.InputLayer]"):
+        self.__layer = layer
+        self.__inputs = inputs
+        self.spec = None
+        self.sources = ()
+
+
+    @classmethod
+    def lazy(cls, spec: tuple, build: Callable, *sources: "LayerResult", is_input: bool = False) -> "LayerResult":
+        '''
+        Выход слоя, который построится при первом обращении к layer.
+
+        Args:
+            spec: tuple - тип слоя и его параметры
+            build: Callable - функция, которая создаёт слой keras (для входа модели - сразу тензор keras.Input)
+            sources: LayerResult - входы слоя
+            is_input: bool - слой является входом модели (keras.Input)
+        '''
+        result = cls(None, None)
+        result.spec = spec
+        result.sources = sources
+        result.__build = build
+        result.__is_input = is_input
+        return result
+
+
+    @property
+    def layer(self) -> "layers.Layer":
+        if self.__layer is None and self.__build is not None:
+            tensors = [source.layer for source in self.sources]
+            try:
+                if self.__is_input:
+                    self.__layer = self.__build()
+                else:
+                    operation = self.__build()
+                    self.__layer = operation(*tensors)
+                    self.operation = operation
+            except Exception as ex: raise LayerBuildError(self, ex) from ex
+
+        return self.__layer
+
+
+    @property
+    def inputs(self) -> "set[layers.InputLayer]":
+        if self.__inputs is None:
+            self.__inputs = {self.layer} if self.__is_input else \
+                            set().union(*[source.inputs for source in self.sources])
+
+        return self.__inputs
+
+
+    @property
+    def built(self) -> bool:
+        return self.__layer is not None
+
+
+    @staticmethod
+    def structure(*results: "LayerResult") -> str:
+        '''
+        Структурный хэш подграфа слоёв до results: типы слоёв, их параметры и связи.
+        Выходы нумеруются в порядке обхода, поэтому одинаковые графы из разных нод дают одинаковый хэш,
+        а два одинаковых входа не путаются с одним входом, использованным дважды.
+        Готовые тензоры (без spec) входят в хэш как есть, такой хэш совпадает только с самим собой.
+        '''
+        numbers = {}
+        nodes = []
+
+        def visit(result: LayerResult) -> int:
+            if id(result) in numbers: return numbers[id(result)]
+            sources = tuple(visit(source) for source in result.sources)
+            spec = result.spec if result.spec is not None else ("tensor", id(result.layer))
+            nodes.append((spec, sources, result.__is_input))
+            numbers[id(result)] = len(nodes) - 1
+            return numbers[id(result)]
+
+        outputs = tuple(visit(result) for result in results)
+        return hashlib.sha1(repr((nodes, outputs)).encode()).hexdigest()
+
+
+    @staticmethod
+    def signatures(*results: "LayerResult") -> "dict[str, list[LayerResult]]":
+        '''
+        Выходы подграфа по хэшу цепочки слоёв, которая к ним ведёт (тип, параметры и хэши входов).
+        Слой с тем же хэшем в следующей сборке получает те же входы, поэтому ему можно перенести веса.
+        Одинаковые ветки графа дают один хэш, их выходы идут в списке в порядке обхода.
+        '''
+        hashes = {}
+        signatures = {}
+
+        def visit(result: LayerResult) -> str:
+            if id(result) in hashes: return hashes[id(result)]
+            sources = tuple(visit(source) for source in result.sources)
+            spec = result.spec if result.spec is not None else ("tensor", id(result.layer))
+            hashes[id(result)] = hashlib.sha1(repr((spec, sources, result.__is_input)).encode()).hexdigest()
+            signatures.setdefault(hashes[id(result)], []).append(result)
+            return hashes[id(result)]
+
+        for result in results: visit(result)
+        return signatures
+
+
+    @staticmethod
+    def fresh(*results: "LayerResult") -> "tuple[LayerResult, ...]":
+        '''
+        Копии подграфа до results, которые ещё не построены: при обращении к layer слои создаются
+        заново по своим параметрам, а не берутся у ноды, которая не пересобиралась. 
+        Готовые тензоры (без spec) остаются как есть.
+        '''
+        copies = {}
+
+        def visit(result: LayerResult) -> LayerResult:
+            if id(result) in copies: return copies[id(result)]
+            if result.__build is None: copy = result
+            else:
+                copy = LayerResult.lazy(result.spec, result.__build, *[visit(source) for source in result.sources],
+                                        is_input=result.__is_input)
+                copy.owner = result.owner
+
+            copies[id(result)] = copy
+            return copy
+
+        return tuple(visit(result) for result in results)
+
+
+    def ordered_inputs(self) -> "list[layers.InputLayer]":
+        '''
+        Входы модели в порядке обхода, а не в порядке множества, чтоб порядок был одинаковым между сборками.
+        '''
+        if self.__is_input: return [self.layer]
+        if not self.sources: return list(self.inputs)
+
+        ordered = []
+        for source in self.sources:
+            ordered += [layer for layer in source.ordered_inputs() if layer not in ordered]
+
+        return ordered
+
+
+
+class LayerBuildError(AttributeError):
+    '''
+    Ошибка при построении слоя из LayerResult.
+
+    Attributes:
+        result: LayerResult - выход, слой которого не удалось построить
+        error: Exception - исходная ошибка
+    '''
+    result: LayerResult
+    error: Exception
+
+
+    def __init__(self, result: LayerResult, error: Exception):
+        super().__init__(str(error))
+        self.result = result
+        self.error = error
+
 
 
 class LayerNode(AbstractNode):
@@ -23,20 +201,46 @@ class LayerNode(AbstractNode):
 
 
     @staticmethod
-    def layer(layer: layers.Layer):
+    def layer(layer: "type[layers.Layer] | str"):
         '''
         Фабрика функций, для новых INPUT \ OUTPUT,
-        чтоб INPUT мог приходить как args
+        чтоб INPUT мог приходить как args.
+        Слой можно передать названием из keras.layers, тогда keras импортируется только при сборке.
+        Название слоя сохраняется в layer_name функции, по нему Preflight выводит форму выхода.
         '''
-        return lambda *args, **kwargs: LayerNode.compile_layer(layer, *args, **kwargs)
+        def logic(*args, **kwargs):
+            return LayerNode.compile_layer(layer, *args, **kwargs)
+
+        logic.layer_name = layer if isinstance(layer, str) else layer.__name__
+        return logic
     
 
     @staticmethod
-    def compile_layer(layer: layers.Layer, *args: LayerResult, **kwargs):
+    def compile_layer(layer: "type[layers.Layer] | str", *args: LayerResult, **kwargs):
         '''
         Компанует выход который должен быть у Layer,
-        чтоб не городить костыли с обработкой inputs
+        чтоб не городить костыли с обработкой inputs.
+        Сам слой создаётся только когда его тензор понадобится CompileNode.
         '''
-        
-        return LayerResult(layer=layer(**kwargs)(*[arg.layer for arg in args]), 
-                            inputs=set().union(*[arg.inputs for arg in args]))
+        name = layer if isinstance(layer, str) else f"{layer.__module__}.{layer.__qualname__}"
+
+        def build():
+            layer_type = getattr(layers, layer) if isinstance(layer, str) else layer
+            return layer_type(**kwargs)
+
+        spec = (name, repr(sorted(kwargs.items(), key=lambda item: item[0])))
+        return LayerResult.lazy(spec, build, *args)
+
+
+    @property
+    def layer_name(self) -> str | None:
+        '''
+        Название слоя из keras.layers, либо None, если логика ноды не создана через LayerNode.layer.
+        '''
+        return getattr(self.logic, "layer_name", None)
+
+
+    def compile(self, kwargs: dict = None) -> bool:
+        status = super().compile(kwargs)
+        if status: self.OUTPUT.owner = self
+        return status
@@ -1,7 +1,8 @@
-import keras.metrics
-
 from Src.Nodes import DataNode
-from Src.Utils import Backfield
+from Src.Utils import Backfield, LazyModule
+
+
+keras = LazyModule("keras")
 
 
 
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+import threading
+from typing import Callable
+
+from Src.Logging import Logger_factory
+from Src.Utils import LazyModule
+
+
+keras = LazyModule("keras")
+
+
+
+class ModelCache:
+    '''
+    Кэш собранных моделей одной ноды CompileNode по структурному хэшу (LayerResult.structure)
+    и параметрам компиляции. Если структура не изменилась, возвращается уже собранная
+    (и, возможно, обученная) модель, а слои не строятся заново.
+
+    При промахе перед сборкой новой модели сбрасывается сессия Keras (keras.backend.clear_session),
+    чтобы счётчики имён слоёв и состояние графа не росли от сборки к сборке. Вместе с моделью
+    хранятся её слои по хэшам LayerResult.signatures, чтобы новая модель могла забрать веса
+    неизменившихся слоёв у последней собранной.
+    Сборка всех моделей идёт под общей блокировкой, потому что сессия Keras общая.
+
+    Attributes:
+        capacity: int - сколько последних моделей хранится
+        hits: int - колличество попаданий
+        misses: int - колличество промахов
+    '''
+    CAPACITY = 2
+    lock = threading.Lock()
+    capacity: int
+    hits: int
+    misses: int
+    __models: "OrderedDict[str, tuple[keras.models.Model, dict[str, list[keras.layers.Layer]]]]"
+
+
+    def __init__(self, capacity: int = CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.__models = OrderedDict()
+
+
+    def __len__(self) -> int:
+        return len(self.__models)
+
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__models
+
+
+    def get(self, key: str) -> "keras.models.Model | None":
+        if key not in self.__models: return None
+        self.__models.move_to_end(key)
+        return self.__models[key][0]
+
+
+    def layers(self) -> "dict[str, list[keras.layers.Layer]]":
+        '''
+        Слои последней использованной модели по хэшам LayerResult.signatures.
+        '''
+        if not self.__models: return {}
+        return next(reversed(self.__models.values()))[1]
+
+
+    def get_or_build(self, key: str, build: Callable) -> "keras.models.Model":
+        '''
+        Модель из кэша, либо собранная build.
+
+        Args:
+            key: str - структурный хэш модели
+            build: Callable - сборка модели при промахе. Получает слои последней модели (см. layers),
+                возвращает модель и её слои по хэшам
+
+        Returns:
+            keras.models.Model - модель
+        '''
+        model = self.get(key)
+        if model is not None:
+            self.hits += 1
+            return model
+
+        with ModelCache.lock:
+            self.misses += 1
+            previous = self.layers()
+            # Первая сборка ничего не заменяет, сбрасывать сессию незачем
+            if self.__models: self.clear_session()
+            model, layers = build(previous)
+
+        self.__models[key] = (model, layers)
+        while len(self.__models) > self.capacity:
+            self.__models.popitem(last=False)
+
+        return model
+
+
+    def clear(self):
+        self.__models.clear()
+
+
+    @staticmethod
+    def clear_session():
+        try:
+            keras.backend.clear_session()
+        except Exception as ex:
+            # Сессию нельзя сбросить, пока в другом потоке строится граф TensorFlow, модель всё равно соберётся
+            log_factory = Logger_factory.from_instance()
+            if log_factory: log_factory("nodes").warning("Не удалось сбросить сессию Keras: %s", ex)
@@ -1,15 +1,17 @@
-import keras
-
 from Src.Nodes import DataNode
+from Src.Utils import LazyModule
+
+
+keras = LazyModule("keras")
 
 
 
 # TODO: Переписать на SelfNode
 class PredictNode(DataNode):
     color = (34, 255, 255, 255)
-    logic: keras.models.Model.predict
+    logic: "keras.models.Model.predict"
 
 
     @staticmethod
-    def predict(model: keras.models.Model, **kwargs):
+    def predict(model: "keras.models.Model", **kwargs):
         return model.predict(**kwargs, verbose=False)
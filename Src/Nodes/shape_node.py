@@ -4,6 +4,7 @@ from abc import abstractmethod
 import numpy as np
 
 from Src.Utils import Backfield
+from Src.Data import ArrayCache
 from Src.Nodes import DataNode
 
 
@@ -11,11 +12,21 @@ from Src.Nodes import DataNode
 class ShapeNode(DataNode):
     '''
     Нода, которая содержит в себе данные. (файлы или табличные)
+    Прочитанные данные сохраняются в ArrayCache и при повторной компиляции открываются с диска.
+
+    Attributes:
+        cache: ArrayCache | None - кэш прочитанных данных, None отключает кэширование
     '''
     shape: tuple[int] = Backfield()
     color = (0, 191, 191, 255)
     OUTPUT: np.ndarray
-    
+    cache: ArrayCache | None = ArrayCache()
+
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.cache is not None: self.logic = self.cache.cached(self.logic)
+
 
     @staticmethod
     @abstractmethod
@@ -23,6 +34,37 @@ class ShapeNode(DataNode):
         pass
 
 
+    @staticmethod
+    def estimate_shape(*args, **kwargs) -> tuple | None:
+        '''
+        Размерность данных, которые вернёт open_data с теми же аргументами, без чтения самих данных.
+        None - размерность заранее неизвестна.
+        '''
+        return None
+
+
+    def infer_shape(self, kwargs: dict) -> tuple | None:
+        '''
+        Размерность данных ноды до компиляции: из ArrayCache, если данные уже читались
+        с этими параметрами, иначе по estimate_shape.
+
+        Args:
+            kwargs: dict - аргументы open_data, как их передаст compile
+
+        Returns:
+            tuple | None - размерность, либо None, если её нельзя узнать без чтения данных
+        '''
+        if self.cache is not None:
+            array = self.cache.lookup(getattr(self.logic, "__wrapped__", self.logic), **kwargs)
+            if array is not None: return array.shape
+
+        try:
+            return self.estimate_shape(**kwargs)
+        except Exception:
+            # Ошибку в параметрах покажет сама компиляция ноды
+            return None
+
+
     def compile(self):
         status = super().compile()
         if not status or len(self.OUTPUT.shape) < 2: return False
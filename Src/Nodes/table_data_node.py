@@ -1,6 +1,7 @@
 import numpy as np
 
 from Src.Nodes import ShapeNode
+from Src.Data import TableLoader
 
 
 
@@ -9,8 +10,24 @@ class TableDataNode(ShapeNode):
 
 
     @staticmethod
-    def open_data(files: dict, *args, **kwargs):
+    def open_data(files: str, delimiter: str = ",", skip_header: bool = False, skip_footer: bool = False,
+                  dtype: str = "float64"):
+        '''
+        Прочитать таблицу. Файл разбирается блоками в нескольких потоках через TableLoader,
+        результат совпадает с np.genfromtxt(..., ndmin=2).
+        '''
         if not files: 
             raise AttributeError("Вы не выбрали данные, которые нужно открыть!")
         
-        return np.genfromtxt(files, *args, **kwargs, ndmin=2)
\ No newline at end of file
+        return TableLoader(delimiter, skip_header, skip_footer, dtype).load(files)
+
+
+    @staticmethod
+    def estimate_shape(files: str = None, delimiter: str = ",", skip_header: bool = False, 
+                       skip_footer: bool = False, dtype: str = "float64") -> tuple[None, int] | None:
+        '''
+        Колличество столбцов таблицы по первой строке данных (TableLoader.shape). Чтобы узнать колличество
+        строк, нужно прочитать весь файл, поэтому оно известно только после чтения (из ArrayCache).
+        '''
+        if not files: return None
+        return TableLoader(delimiter, skip_header, skip_footer, dtype).shape(files)
\ No newline at end of file
@@ -0,0 +1,112 @@
+import threading
+import time
+from typing import Callable
+
+import keras
+
+
+
+class TrainingProgress(keras.callbacks.Callback):
+    '''
+    Keras callback, который передаёт прогресс обучения в ноду и позволяет
+    поставить обучение на паузу или отменить его из интерфейса.
+
+    Attributes:
+        progress: float - доля пройденных батчей (от 0 до 1)
+        eta: float - оценка оставшегося времени в секундах
+        history: list[dict[str, float]] - метрики после каждой эпохи
+        cancelled: bool - обучение было отменено
+    '''
+    UPDATE_INTERVAL = 0.1
+    progress: float
+    eta: float
+    history: list[dict[str, float]]
+    cancelled: bool
+
+
+    def __init__(self, on_update: Callable = lambda progress: None):
+        '''
+        Args:
+            on_update: Callable - вызывается с этим объектом не чаще, чем раз в UPDATE_INTERVAL секунд
+        '''
+        super().__init__()
+        self.on_update = on_update
+        self.__resume = threading.Event()
+        self.__resume.set()
+        self.cancelled = False
+        self.reset()
+
+
+    def reset(self):
+        '''
+        Сбросить прогресс. Отмена не сбрасывается: её могли нажать ещё до начала обучения,
+        флаг снимает FitNode перед новым обучением.
+        '''
+        self.progress = 0.0
+        self.eta = None
+        self.epoch = 0
+        self.logs = {}
+        self.history = []
+        self.__start = time.perf_counter()
+        self.__last_update = 0.0
+
+
+    @property
+    def paused(self) -> bool:
+        return not self.__resume.is_set()
+
+
+    def pause(self):
+        self.__resume.clear()
+
+
+    def resume(self):
+        self.__resume.set()
+
+
+    def cancel(self):
+        self.cancelled = True
+        if self.model is not None: self.model.stop_training = True
+        self.__resume.set()
+
+
+    def on_train_begin(self, logs=None):
+        self.reset()
+        self.__update(force=True)
+
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.epoch = epoch
+
+
+    def on_train_batch_end(self, batch, logs=None):
+        epochs = self.params.get('epochs') or 1
+        steps = self.params.get('steps') or batch + 1
+
+        self.progress = min((self.epoch * steps + batch + 1) / (epochs * steps), 1.0)
+        elapsed = time.perf_counter() - self.__start
+        self.eta = elapsed * (1 - self.progress) / self.progress
+        self.logs = {key: float(value) for key, value in (logs or {}).items()}
+        self.__update()
+
+        # Пауза держит поток обучения, пока её не снимут или не отменят обучение
+        self.__resume.wait()
+        if self.cancelled: self.model.stop_training = True
+
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.history.append({key: float(value) for key, value in (logs or {}).items()})
+        self.__update(force=True)
+
+
+    def on_train_end(self, logs=None):
+        if not self.cancelled: self.progress = 1.0
+        self.eta = 0.0
+        self.__update(force=True)
+
+
+    def __update(self, force: bool = False):
+        now = time.perf_counter()
+        if not force and now - self.__last_update < self.UPDATE_INTERVAL: return
+        self.__last_update = now
+        self.on_update(self)
@@ -1,6 +1,12 @@
-import keras
+import numpy as np
 
 from Src.Nodes import AbstractNode
+from Src.Data import DataWriter
+from Src.Logging import Logger_factory
+from Src.Utils import LazyModule
+
+
+keras = LazyModule("keras")
 
 
 
@@ -9,7 +15,7 @@ class UtilsNode(AbstractNode):
 
 
     @staticmethod
-    def to_json(model: keras.models.Model, filename: str):
+    def to_json(model: "keras.models.Model", filename: str):
         json_string = model.to_json()
 
         try:
@@ -17,4 +23,30 @@ class UtilsNode(AbstractNode):
                 f.write(json_string)
         except Exception as ex:
             raise Exception(f"Непредвиденная ошибка с записью в файл: {ex}")
-        
\ No newline at end of file
+
+
+    @staticmethod
+    def save_data(X: np.ndarray, fname: str, delimiter: str = ",", compressed: bool = False,
+                  background: bool = False):
+        '''
+        Сохранить данные (например, результат Predict). Формат выбирается по расширению файла:
+        .npy, .npz или текстовый csv.
+
+        Args:
+            X: np.ndarray - данные
+            fname: str - файл, в который сохранить данные
+            delimiter: str - разделитель столбцов для csv
+            compressed: bool - сжимать .npz
+            background: bool - писать файл в фоне, не дожидаясь окончания записи
+        '''
+        writer = DataWriter(delimiter, compressed)
+        if not background: 
+            writer.write(X, fname)
+            return
+
+        logger = Logger_factory.from_instance()("nodes")
+        def done(future):
+            if future.exception(): logger.error(f"Не удалось сохранить данные в {fname}: {future.exception()}")
+            else: logger.info(f"Данные сохранены в {future.result()}")
+
+        writer.write_async(X, fname).add_done_callback(done)
@@ -1,2 +1,5 @@
 from Src.Utils.factory_method import factorymethod
-from Src.Utils.backfield import Backfield
\ No newline at end of file
+from Src.Utils.backfield import Backfield
+from Src.Utils.ordered_set import OrderedSet
+from Src.Utils.theme_registry import ThemeRegistry
+from Src.Utils.lazy_module import LazyModule, LazyFunction
\ No newline at end of file
@@ -0,0 +1,86 @@
+import importlib
+import sys
+from typing import Callable
+
+
+
+class LazyModule:
+    '''
+    Модуль, который импортируется только при первом обращении к его атрибуту.
+    Используется для keras: его импорт загружает TensorFlow и занимает несколько секунд,
+    а для показа редактора и списка нод он не нужен.
+
+    Attributes:
+        name: str - полное название модуля
+    '''
+    name: str
+
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+    @property
+    def module(self):
+        # import_module потокобезопасен, поэтому модуль можно импортировать в фоне (см. NodeEditor.warm_up)
+        return importlib.import_module(self.name)
+
+
+    @property
+    def loaded(self) -> bool:
+        return self.name in sys.modules
+
+
+    def __getattr__(self, name: str):
+        # name ещё нет только в объекте без __init__ (copy, pickle)
+        if name == "name": raise AttributeError(name)
+        return getattr(self.module, name)
+
+
+    def __repr__(self) -> str:
+        return f"LazyModule({self.name}, loaded={self.loaded})"
+
+
+    def function(self, path: str) -> "LazyFunction":
+        '''
+        Функция модуля по пути через точку (например, "utils.to_categorical"),
+        которая ищется только при вызове.
+        '''
+        return LazyFunction(self, path)
+
+
+
+class LazyFunction:
+    '''
+    Функция из LazyModule. Её можно передать как logic в NodeAnnotation, не импортируя модуль.
+    '''
+    module: LazyModule
+    path: str
+
+
+    def __init__(self, module: LazyModule, path: str):
+        self.module = module
+        self.path = path
+
+
+    @property
+    def function(self) -> Callable:
+        function = self.module.module
+        for name in self.path.split("."):
+            function = getattr(function, name)
+
+        return function
+
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+
+    # Документацию (inspect.getdoc) берём у самой функции, модуль импортируется только в этот момент
+    @property
+    def __doc__(self) -> str | None:
+        return self.function.__doc__
+
+
+    def __repr__(self) -> str:
+        return f"LazyFunction({self.module.name}.{self.path})"
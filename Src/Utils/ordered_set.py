@@ -0,0 +1,61 @@
+from typing import Hashable, Iterable, Iterator
+
+
+
+class OrderedSet:
+    '''
+    Множество, сохраняющее порядок добавления элементов. Проверка вхождения,
+    добавление и удаление работают за O(1), но, как у списка, доступен последний
+    добавленный элемент и оператор +=.
+    '''
+    __items: dict[Hashable, None]
+
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        self.__items = dict.fromkeys(items)
+
+
+    def add(self, item: Hashable):
+        self.__items[item] = None
+
+
+    def append(self, item: Hashable):
+        self.add(item)
+
+
+    def discard(self, item: Hashable):
+        self.__items.pop(item, None)
+
+
+    def remove(self, item: Hashable):
+        del self.__items[item]
+
+
+    def clear(self):
+        self.__items.clear()
+
+
+    def __iadd__(self, items: Iterable[Hashable]) -> "OrderedSet":
+        for item in items: self.add(item)
+        return self
+
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.__items
+
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.__items)
+
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+
+    def __getitem__(self, index: int) -> Hashable:
+        if index == -1: return next(reversed(self.__items))
+        return list(self.__items)[index]
+
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.__items)})"
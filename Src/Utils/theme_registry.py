@@ -0,0 +1,95 @@
+import threading
+
+import dearpygui.dearpygui as dpg
+
+from Src.Enums import NodeState
+
+
+
+class ThemeRegistry:
+    '''
+    Общие темы нод и атрибутов. Тема создаётся один раз для каждого цвета и состояния,
+    все ноды одного типа ссылаются на один и тот же dpg.theme.
+    Темы ошибок создаются и из потоков сборки, поэтому элементы тем создаются с явным parent,
+    без общего стека контейнеров dpg.
+    '''
+    ERROR_COLOR = (175, 0, 0, 255)
+    OUTLINE_COLOR = (100, 100, 100, 255)
+    BORDER_COLOR = (78, 78, 78, 255)
+    __themes: dict[tuple, int | str] = {}
+    __lock = threading.Lock()
+
+
+    @staticmethod
+    def lighten(color: tuple[int, ...], factor: float) -> list[float]:
+        return [min(channel * factor, 255) for channel in color]
+
+
+    @classmethod
+    def node(cls, color: tuple[int, int, int, int], state: NodeState = NodeState.DEFAULT) -> int | str:
+        '''
+        Тема ноды с цветом заголовка color в состоянии state.
+        '''
+        return cls.__get(("node", tuple(color), state), lambda: cls.__build_node(color, state))
+
+
+    @classmethod
+    def port(cls, color: tuple[int, int, int, int]) -> int | str:
+        '''
+        Тема атрибута (пина и связей) цвета color.
+        '''
+        return cls.__get(("port", tuple(color)), lambda: cls.__build_port(color))
+
+
+    @classmethod
+    def clear(cls):
+        '''
+        Удалить все созданные темы.
+        '''
+        with cls.__lock:
+            for theme in cls.__themes.values():
+                if dpg.does_item_exist(theme): dpg.delete_item(theme)
+            cls.__themes.clear()
+
+
+    @classmethod
+    def __get(cls, key: tuple, build) -> int | str:
+        with cls.__lock:
+            theme = cls.__themes.get(key)
+            # После пересоздания контекста DearPyGUI старых тем уже нет
+            if theme is None or not dpg.does_item_exist(theme):
+                theme = cls.__themes[key] = build()
+
+            return theme
+
+
+    @classmethod
+    def __build_node(cls, color: tuple[int, int, int, int], state: NodeState) -> int | str:
+        outline = cls.ERROR_COLOR if state == NodeState.ERROR else cls.OUTLINE_COLOR
+        border = cls.ERROR_COLOR if state == NodeState.ERROR else cls.BORDER_COLOR
+
+        theme = dpg.add_theme()
+        node = dpg.add_theme_component(dpg.mvNode, parent=theme)
+        dpg.add_theme_color(dpg.mvNodeCol_TitleBar, color, category=dpg.mvThemeCat_Nodes, parent=node)
+        dpg.add_theme_color(dpg.mvNodeCol_TitleBarHovered, cls.lighten(color, 1.2),
+                            category=dpg.mvThemeCat_Nodes, parent=node)
+        dpg.add_theme_color(dpg.mvNodeCol_TitleBarSelected, cls.lighten(color, 1.25),
+                            category=dpg.mvThemeCat_Nodes, parent=node)
+        dpg.add_theme_color(dpg.mvNodeCol_NodeOutline, outline, category=dpg.mvThemeCat_Nodes, parent=node)
+
+        tooltip = dpg.add_theme_component(dpg.mvTooltip, parent=theme)
+        dpg.add_theme_color(dpg.mvThemeCol_Border, border, category=dpg.mvThemeCat_Core, parent=tooltip)
+
+        return theme
+
+
+    @classmethod
+    def __build_port(cls, color: tuple[int, int, int, int]) -> int | str:
+        theme = dpg.add_theme()
+        attribute = dpg.add_theme_component(dpg.mvNodeAttribute, parent=theme)
+        dpg.add_theme_color(dpg.mvNodeCol_Pin, color, category=dpg.mvThemeCat_Nodes, parent=attribute)
+        dpg.add_theme_color(dpg.mvNodeCol_PinHovered, cls.lighten(color, 1.2),
+                            category=dpg.mvThemeCat_Nodes, parent=attribute)
+        dpg.add_theme_color(dpg.mvNodeCol_Link, color, category=dpg.mvThemeCat_Nodes, parent=attribute)
+
+        return theme
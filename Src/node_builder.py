@@ -1,14 +1,16 @@
 from typing import Callable
-from itertools import chain
+import logging
 import traceback
 
 import dearpygui.dearpygui as dpg
-from keras import layers
 
 from Src.Enums.attr_type import AttrType
+from Src.Enums.executor_type import ExecutorType
 from Src.Logging import Logger_factory, Logger
 from Src.Nodes import AbstractNode, InputLayerNode, LayerNode
 from Src.Config.node_list import NodeAnnotation, Parameter, ANode, Single
+from Src.Config.node_index import NodeIndex
+from Src.Graph import Graph, Scheduler, NodeRecord, Preflight
 
 
 
@@ -19,27 +21,57 @@ class NodeBuilder:
     Attributes:
         factory: InputsFactory - фабрика конвертации аннотаций в инпуты
         layers_list: dict[str: AbstractNode] - список слоёв с параметрами, которые использовать в конструкторе
+        graph: Graph - граф, в котором регистрируются построенные ноды
+        scheduler: Scheduler - планировщик порядка компиляции графа
+        preflight: Preflight - проверка графа перед компиляцией
+        catalog: dict[str, NodeAnnotation] - все ноды, которые можно построить, по их названию
+        index: NodeIndex - поисковый индекс по нодам из списка слева
     '''
+    SEARCH_LIMIT = 30
     node_list: dict[str, dict[str, list[NodeAnnotation]]]
+    catalog: dict[str, NodeAnnotation]
+    index: NodeIndex
+    __list_handlers: str | int = None
+    __search_results: str | int = None
+    __tree: str | int = None
     delete_callback: Callable
     logger: Logger
+    graph: Graph
+    scheduler: Scheduler
+    preflight: Preflight
 
 
     def __init__(self, 
                  node_list: dict[str: AbstractNode],
-                 delete_callback: Callable):
+                 delete_callback: Callable,
+                 graph: Graph = None,
+                 executor: ExecutorType = ExecutorType.SERIAL,
+                 max_workers: int = None):
         '''
         Args:
             layers_list: dict[str: AbstractNode] - список слоёв с параметрами, которые использовать в конструкторе
+            graph: Graph - граф, в котором регистрировать ноды. Если не передан, создаётся новый.
+            executor: ExecutorType - режим компиляции независимых веток графа (последовательно или в потоках)
+            max_workers: int - колличество потоков для ExecutorType.THREAD
         '''
         self.logger = Logger_factory.from_instance()("nodes")
         self.delete_callback = delete_callback
         self.node_list = node_list
+        self.graph = graph if graph is not None else Graph()
+        self.scheduler = Scheduler(self.graph, executor, max_workers)
+        self.preflight = Preflight(self.graph)
+
+        input_layer = self.input_annotation()
+        self.catalog = {input_layer.label: input_layer}
+        self.catalog |= {node.label: node for anchor in node_list.values() 
+                         for nodes in anchor.values() for node in nodes}
+        self.index = NodeIndex(node_list)
 
 
     def build_list(self, parent: str | int) -> str | int:
         '''
-        Построить список (tree_node) из списка слоёв. Используется для панели слева в конструкторе.
+        Построить список (tree_node) из списка слоёв и строку поиска над ним. Используется для панели слева в конструкторе.
+        Содержимое раздела создаётся, только когда его впервые раскрывают.
 
         Args:
             parent: str | int - родительский элемент в котором создать список.
@@ -47,22 +79,73 @@ class NodeBuilder:
         Returns:
             str | int - индетификатор списка
         '''
-        with dpg.group(parent=parent) as list:
-            for anchor in self.node_list.keys():
-                with dpg.tree_node(label=anchor) as tree_anchor:
+        with dpg.item_handler_registry() as self.__list_handlers:
+            dpg.add_item_toggled_open_handler(callback=lambda _, tree_node: self.expand_list(tree_node))
 
-                    for subanchor in self.node_list[anchor].keys():
-                        with dpg.tree_node(label=subanchor) as tree_subanchor:
+        with dpg.group(parent=parent):
+            dpg.add_input_text(hint="Поиск", callback=lambda _, query: self.search_list(query))
+            self.__search_results = dpg.add_group(show=False)
 
-                            for node in self.node_list[anchor][subanchor]:
-                                btn = dpg.add_button(label=node.label, user_data=node)
-                                
-                                with dpg.drag_payload(parent=btn, drag_data=btn):
-                                    dpg.add_text(node.label)
+            with dpg.group() as list:
+                for anchor in self.node_list.keys():
+                    self.__add_section(anchor, (anchor,))
 
+        self.__tree = list
         return list
 
 
+    def expand_list(self, tree_node: str | int):
+        '''
+        Заполнить раскрытый раздел списка: раздел - подразделами, подраздел - кнопками нод.
+        '''
+        if dpg.get_item_children(tree_node, slot=1): return
+
+        path = dpg.get_item_user_data(tree_node)
+        with dpg.mutex():
+            if len(path) == 1:
+                for subanchor in self.node_list[path[0]].keys():
+                    self.__add_section(subanchor, path + (subanchor,), parent=tree_node)
+            else:
+                for node in self.node_list[path[0]][path[1]]:
+                    self.__add_button(node, tree_node)
+
+
+    def search_list(self, query: str) -> list[NodeAnnotation]:
+        '''
+        Показать вместо списка ноды, найденные по запросу. С пустым запросом снова показывается список.
+
+        Returns:
+            list[NodeAnnotation] - найденные ноды
+        '''
+        found = self.index.search(query, self.SEARCH_LIMIT)
+
+        with dpg.mutex():
+            dpg.delete_item(self.__search_results, children_only=True)
+            for node in found:
+                self.__add_button(node, self.__search_results)
+
+            dpg.configure_item(self.__search_results, show=bool(query.strip()))
+            dpg.configure_item(self.__tree, show=not query.strip())
+
+        return found
+
+
+    def __add_section(self, label: str, path: tuple[str, ...], **kwargs) -> str | int:
+        tree_node = dpg.add_tree_node(label=label, user_data=path, **kwargs)
+        dpg.bind_item_handler_registry(tree_node, self.__list_handlers)
+        return tree_node
+
+
+    @staticmethod
+    def __add_button(node: NodeAnnotation, parent: str | int) -> str | int:
+        btn = dpg.add_button(label=node.label, user_data=node, parent=parent)
+
+        with dpg.drag_payload(parent=btn, drag_data=btn):
+            dpg.add_text(node.label)
+
+        return btn
+
+
     def build_node(self, node_data: NodeAnnotation, parent: str | int) -> str | int:
         '''
         Построение dpg.node из класса AbstractNode. Используется, для создания новых нодов в редакторе. Ноды берутся из user_data в списке слева.
@@ -74,46 +157,169 @@ class NodeBuilder:
         Returns:
             str | int - индетификатор новой dpg.node.
         '''
-        node_id = dpg.generate_uuid()
-        node: AbstractNode = node_data.node_type(node_id, **node_data.kwargs)
+        node, ports = self.__build_items(node_data, parent=parent)
+        self.graph.add_node(node, ports)
+
+        return node.node_tag
+
+
+    def __build_items(self, node_data: NodeAnnotation, **kwargs) -> tuple[AbstractNode, dict[str | int, str]]:
+        '''
+        Создать элементы dpg.node с темой по умолчанию, но без регистрации в графе.
+
+        Args:
+            node_data: NodeAnnotation - нода, которую построить
+            **kwargs - передаются в dpg.node (parent, pos)
+
+        Returns:
+            tuple[AbstractNode, dict[str | int, str]] - нода и её атрибуты с названиями
+        '''
+        ports = {}
+
+        # Индетификатор выдаёт сам dpg.node: dpg.generate_uuid ищет свободный номер среди всех элементов
+        with dpg.node(label=node_data.label, **kwargs) as node_id:
+            node: AbstractNode = node_data.node_type(node_id, **node_data.kwargs)
+            dpg.set_item_user_data(node_id, node)
+            # Тема привязывается, пока нода в кэше поиска DearPyGUI, позже поиск идёт по всем элементам
+            node.default_theme()
 
-        with dpg.node(label=node_data.label, parent=parent, user_data=node, tag=node_id):
             if node_data.input:
-                node_data.input.build(label="INPUT", parent=node_id)
+                ports[node_data.input.build(label="INPUT", parent=node_id)] = "INPUT"
                 
-            with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Static):
+            with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Static) as docs:
                 with dpg.tree_node(label="Docs"):
                     dpg.add_text(node.docs)
+            ports[docs] = ""
 
             for label, attribute in node.annotations.items():
                 if label == 'INPUT': continue
-                self.logger.debug(f"Attribute label: {label}")
-                attr = attribute.build(label=label, parent=node_id)
+                self.logger.debug("Attribute label: %s", label)
+                # Изменение параметра делает ноду устаревшей, её нужно будет пересобрать
+                attr = attribute.build(label=label, parent=node_id, 
+                                       callback=lambda: self.graph.mark_dirty(node))
+                ports[attr] = label
 
-            with dpg.node_attribute(label="Delete", attribute_type=dpg.mvNode_Attr_Static):
+            with dpg.node_attribute(label="Delete", attribute_type=dpg.mvNode_Attr_Static) as delete:
                 dpg.add_button(label="Delete", callback=lambda: self.delete_callback(node_id))
+            ports[delete] = "Delete"
 
             if node_data.output:
-                node_data.output.build(label="OUTPUT", parent=node_id)
+                ports[node_data.output.build(label="OUTPUT", parent=node_id)] = "OUTPUT"
 
-        node.default_theme()
+        return node, ports
 
-        return node_id
-    
 
-    def build_input(self, parent: str | int) -> str | int:
+    def build_graph(self, nodes: list[NodeRecord], links: list[list[int | str]], 
+                    parent: str | int) -> list[str | int]:
         '''
-        Особенный метод, реализующий построение слоя входа.
+        Построить сразу много нод и связей между ними. Все ноды создаются внутри одного 
+        dpg.push_container_stack и регистрируются в графе одним вызовом.
 
         Args:
-            parent: str | int - родительский элемент в котором построить нод. Чаще всего node_editor.
-            shape: tuple[int] - форма данных, передаётся в входной слой.
+            nodes: list[NodeRecord] - ноды: название в каталоге, позиция и значения параметров
+            links: list[list[int | str]] - связи [номер ноды, атрибут, номер ноды, атрибут]
+            parent: str | int - родитель, внутри которого создать ноды. Чаще всего это dpg.node_editor.
 
         Returns:
-            str | int - индетификатор новой ноды
+            list[str | int] - индетификаторы новых dpg.node в порядке nodes
+        '''
+        self.check_catalog(nodes)
+        built: dict[AbstractNode, dict[str | int, str]] = {}
+
+        dpg.push_container_stack(parent)
+        try:
+            for record in nodes:
+                node, ports = self.__build_items(self.catalog[record.label], pos=record.position)
+                built[node] = ports
+                self.set_parameters(node, {label: attr for attr, label in ports.items()}, record.parameters)
+        finally:
+            dpg.pop_container_stack()
+
+        self.graph.add_nodes(built)
+        ports = [{label: attr for attr, label in node_ports.items()} for node_ports in built.values()]
+
+        for node_out, label_out, node_in, label_in in links:
+            attr_out, attr_in = ports[node_out].get(label_out), ports[node_in].get(label_in)
+            if attr_out is None or attr_in is None:
+                self.logger.warning(f"Связь с несуществующим атрибутом - {label_out} -> {label_in}")
+                continue
+
+            if self.link(attr_out, attr_in, parent) is None: continue
+            # Сразу после связи атрибуты ещё в кэше поиска DearPyGUI
+            self.sync_attribute(attr_out)
+            self.sync_attribute(attr_in)
+
+        return [node.node_tag for node in built]
+
+
+    def check_catalog(self, nodes: list[NodeRecord]):
+        '''
+        Проверить, что все ноды есть в каталоге.
+        '''
+        unknown = {record.label for record in nodes} - self.catalog.keys()
+        if unknown: raise ValueError(f"Неизвестные ноды - {unknown}")
+
+
+    def set_parameters(self, node: AbstractNode, ports: dict[str, str | int], parameters: dict[str, object]):
+        '''
+        Установить значения параметров ноды из JSON значений (Annotation.load).
+
+        Args:
+            node: AbstractNode - нода
+            ports: dict[str, str | int] - атрибуты ноды по названиям
+            parameters: dict[str, object] - значения параметров по названиям
+        '''
+        for label, value in parameters.items():
+            parameter = node.annotations.get(label)
+            if value is None or label not in ports or not self.is_saved(parameter): continue
+
+            if not parameter.set_value(ports[label], parameter.hint.load(value)):
+                self.logger.warning(f"Не удалось установить параметр {label} = {value} у {node}")
+
+
+    @staticmethod
+    def is_saved(parameter: Parameter | None) -> bool:
+        '''
+        Сохраняются только значения, которые вводит пользователь. Связи сохраняются отдельно.
+        '''
+        return parameter is not None and parameter.attr_type == AttrType.INPUT and \
+            not (isinstance(parameter.hint, ANode) or parameter.hint is ANode)
+
+
+    def link(self, attr_out: str | int, attr_in: str | int, parent: str | int) -> str | int | None:
+        '''
+        Связать атрибуты в графе и в редакторе, если связь допустима. user_data атрибутов не меняется,
+        для этого нужно вызвать sync_attribute.
+
+        Returns:
+            str | int | None - индетификатор связи (dpg.node_link), либо None
+        '''
+        error = self.graph.check_link(attr_out, attr_in)
+        if error:
+            self.logger.warning(f"Некорректная попытка связывания узлов: {error}")
+            return None
+
+        link_id = dpg.add_node_link(attr_out, attr_in, parent=parent)
+        dpg.set_item_user_data(link_id, self.graph.link(attr_out, attr_in, link_id))
+
+        return link_id
+
+
+    def sync_attribute(self, attr: str | int):
+        '''
+        Отразить связи атрибута из графа в его user_data, по ним ANode получает значения.
+        '''
+        node = self.graph.node_of(attr)
+        dpg.set_item_user_data(attr, node.outgoing.get(attr) or node.incoming.get(attr) or [])
+    
+
+    @staticmethod
+    def input_annotation() -> NodeAnnotation:
+        '''
+        Описание слоя входа, его нет в списке слоёв, он всегда стоит в редакторе.
         '''
         # TODO: Сделать типизированную передачу у shape TableDataNode
-        layer = NodeAnnotation(
+        return NodeAnnotation(
             label="Input",
             node_type=InputLayerNode, 
             logic = InputLayerNode.create_input,
@@ -124,59 +330,111 @@ class NodeBuilder:
             output=LayerNode
             )
 
-        node_id = self.build_node(layer, parent=parent)
 
-        return node_id
-    
+    def build_input(self, parent: str | int) -> str | int:
+        '''
+        Особенный метод, реализующий построение слоя входа.
 
-    def compile_graph(self, start_nodes: list[AbstractNode]) -> set[AbstractNode]:
+        Args:
+            parent: str | int - родительский элемент в котором построить нод. Чаще всего node_editor.
+
+        Returns:
+            str | int - индетификатор новой ноды
         '''
-        Компиляция графа, от его концов. Работает через обход в ширину. Вызывает метод compile у нода, если все ноды, пришедшие к нему уже скомпилированы. Начинает с нодов, у которых нет входов.
+        return self.build_node(self.catalog["Input"], parent=parent)
+    
+
+    def compile_graph(self, start_nodes: list[AbstractNode], force: bool = False) -> list[AbstractNode]:
         '''
+        Компиляция графа, от его концов. Порядок строится топологической сортировкой (Scheduler), 
+        поэтому каждая нода компилируется ровно один раз и только после всех нод, пришедших к ней. 
+        Начинает с нодов, у которых нет входов.
+
+        Пересобираются только изменённые ноды (graph.dirty) и те, что от них зависят, 
+        остальные переиспользуют OUTPUT с прошлой компиляции.
 
-        visited = set()
-        queue = start_nodes[:]
+        До чтения данных весь граф проверяется (Preflight): ноды с ошибками в связях или размерностях
+        отмечаются ошибкой, а они и всё, что от них зависит, не собираются.
+
+        Args:
+            start_nodes: list[AbstractNode] - ноды, с которых начать компиляцию
+            force: bool - пересобрать все ноды, даже если они не изменились
+
+        Returns:
+            list[AbstractNode] - успешно скомпилированные ноды в порядке компиляции
+        '''
         self.logger.info("Началась сборка графа.")
-        status = True
 
-        while queue:
-            self.logger.debug(f"Текущая очередь - {queue}")
-            current_node = queue.pop(0)
-            self.logger.debug(f"Текущая нода - {current_node}")
+        if force: self.graph.mark_dirty(*self.graph)
 
-            if all([dpg.get_item_user_data(dpg.get_item_parent(value)) in visited \
-                for value in chain(*current_node.incoming.values())]):
-                self.logger.debug("Нода подошла.")
+        plan = self.scheduler.plan(start_nodes, dirty=self.graph.dirty)
+        self.logger.debug("Порядок сборки - %s", plan.order)
 
-                try:
-                    status = current_node.compile()
+        # Проверяются и ноды, которые не пересобираются, от них приходят размерности
+        preflight = self.preflight.check(self.scheduler.plan(start_nodes).order)
+        if preflight.errors:
+            for node, messages in preflight.errors.items():
+                node.raise_error("\n".join(messages), "Ошибка проверки графа")
 
-                except Exception as ex:
-                    self.raise_error(ex)
-                    status = False
+            broken = self.graph.downstream(preflight.failed)
+            plan.order = [node for node in plan.order if node not in broken]
+            self.graph.mark_dirty(*broken)
+            self.logger.warning("Узлы не будут собраны из-за ошибок проверки графа - %s", broken)
 
-                if not status: break
-                
-                self.logger.debug(f"resulted OUTPUT - {current_node.OUTPUT}")
+        # Пока нода не собрана успешно, она остаётся устаревшей
+        self.graph.mark_dirty(*plan.order)
+
+        for node in plan.cyclic:
+            node.raise_error("Узел находится в цикле, его невозможно собрать!", "Некорректный граф")
+        for node in plan.blocked:
+            node.raise_error("Узел ждёт узлы, которые не будут собраны!", "Некорректный граф")
+        if plan.unreachable:
+            self.logger.info("Узлы недостижимы от начальных и не будут собраны - %s", plan.unreachable)
+
+        report = self.scheduler.run(plan, self.compile_node)
+
+        if report.skipped:
+            self.logger.warning("Узлы пропущены из-за ошибок выше по графу - %s", report.skipped)
+
+        return report.executed
+
+
+    def compile_node(self, node: AbstractNode) -> bool:
+        '''
+        Компиляция одной ноды.
+
+        Returns:
+            bool - статус компиляции
+        '''
+        self.logger.debug("Текущая нода - %s", node)
+
+        # Отмечаем до компиляции, чтоб правки, сделанные во время сборки, не потерялись
+        self.graph.mark_clean(node)
+
+        try:
+            status = node.compile()
 
-                for attr_id in chain(*current_node.outgoing.values()):
-                    neightbor: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(attr_id))
-                    if neightbor not in queue:
-                        queue.append(neightbor)
+        except Exception as ex:
+            self.raise_error(ex)
+            status = False
 
-                visited.add(current_node)
+        if not status: self.graph.mark_dirty(node)
+        # OUTPUT перезапишется при следующей сборке, поэтому строку собираем сразу
+        elif self.logger.isEnabledFor(logging.DEBUG): self.logger.debug(f"resulted OUTPUT - {node.OUTPUT}")
 
-        return visited
+        return status
     
 
     def raise_error(self, error_message: str, error_message_type: str = "Неизвестная ошибка"):
-        with dpg.window(label="Непревиденная ошибка", modal=True, no_title_bar=True, \
-                        no_resize=True, no_move=True) as error_window:
-            dpg.add_text("Произошла непредвиденная ошибка, сообщите пожалуйста разработчикам.")
-            dpg.add_text(f"{error_message_type}:")
-            dpg.add_text(error_message)
-            dpg.add_text(traceback.format_exc())
-            dpg.add_button(label="Close", callback=lambda: dpg.configure_item(error_window, show=False))
+        # Вызывается и из потоков сборки, а стек контейнеров dpg общий, поэтому родитель указывается явно
+        error_window = dpg.add_window(label="Непревиденная ошибка", modal=True, no_title_bar=True,
+                                      no_resize=True, no_move=True)
+        dpg.add_text("Произошла непредвиденная ошибка, сообщите пожалуйста разработчикам.", parent=error_window)
+        dpg.add_text(f"{error_message_type}:", parent=error_window)
+        dpg.add_text(error_message, parent=error_window)
+        dpg.add_text(traceback.format_exc(), parent=error_window)
+        dpg.add_button(label="Close", parent=error_window,
+                       callback=lambda: dpg.configure_item(error_window, show=False))
 
         # TODO: Прикрепить модальное окно на середину при изменении размера
         dpg.set_item_pos(error_window, [
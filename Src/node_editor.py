@@ -1,14 +1,20 @@
 import json
+import logging
 from typing import get_args
 import sys
+import threading
+import time
 
 import dearpygui.dearpygui as dpg
 
-from Src.Nodes import AbstractNode, node_link
+from Src.Nodes import AbstractNode, CompileNode, node_link
 from Src.node_builder import NodeBuilder
 from Src.Logging import Logger_factory, Logger
 from Src.Config.node_list import node_list, NodeAnnotation
 from Src.Config.Annotations import ANode
+from Src.Graph import Graph, GraphFile, NodeRecord
+from Src.Utils import OrderedSet
+from Src.Enums import ExecutorType
 
 
 
@@ -18,12 +24,15 @@ class NodeEditor:
 
     Attributes:
         logger: Logger - логировщик
+        graph: Graph - граф, в котором отражаются ноды и связи редактора
     '''
     logger: Logger
     builder: NodeBuilder
+    graph: Graph
     __stage_tag: str | int
     __group_tag: str | int
-    __start_nodes: list[AbstractNode]
+    __start_nodes: OrderedSet
+    __compile_thread: threading.Thread | None
 
 
     def __init__(self, *args, **kwargs):
@@ -41,13 +50,24 @@ class NodeEditor:
             config = json.load(f)
 
         self.logger = Logger_factory.from_instance()("nodes", config)
-        self.builder = NodeBuilder(node_list, self.delete_node)
+        self.graph = Graph()
+        self.builder = NodeBuilder(node_list, self.delete_node, self.graph, ExecutorType.THREAD)
         self.__stage_tag = dpg.generate_uuid()
         self.__group_tag = dpg.generate_uuid()
-        self.__start_nodes = []
+        # Начальные ноды поддерживаются графом при добавлении и удалении связей
+        self.__start_nodes = self.graph.start_nodes
+        self.__compile_thread = None
 
         dpg.set_viewport_resize_callback(callback=self.on_viewport_resize_callback)
 
+        dialogs = {}
+        for action, callback in (("save", self.save), ("load", self.load)):
+            with dpg.file_dialog(directory_selector=False, show=False, modal=True, width=1400, height=800,
+                                 default_filename="graph", user_data=callback,
+                                 callback=lambda _, app_data, callback: callback(app_data['file_path_name'])) as dialog:
+                dpg.add_file_extension(".json")
+            dialogs[action] = dialog
+
         with dpg.stage(tag=self.__stage_tag):
             # Делим окно на 2, чтоб слева были блоки, а справа конструктор графа
             with dpg.group(horizontal=True, tag=self.__group_tag) as group:
@@ -61,15 +81,63 @@ class NodeEditor:
                     with dpg.node_editor(tag="node_editor", callback=self.link_callback, \
                                         delink_callback=self.delink_callback, *args, **kwargs):
 
-                        input_id = self.builder.build_input("node_editor")
-                        self.__start_nodes.append(dpg.get_item_user_data(input_id))
+                        self.builder.build_input("node_editor")
 
-                    dpg.add_button(label="Собрать модель", 
-                                   callback = lambda: self.builder.compile_graph(self.__start_nodes))
+                    with dpg.group(horizontal=True):
+                        dpg.add_button(label="Собрать модель", callback = lambda: self.compile())
+                        dpg.add_button(label="Сохранить граф", callback=lambda: dpg.show_item(dialogs["save"]))
+                        dpg.add_button(label="Открыть граф", callback=lambda: dpg.show_item(dialogs["load"]))
         
         self.on_viewport_resize_callback()
 
 
+    def compile(self, force: bool = False) -> threading.Thread:
+        '''
+        Запустить сборку графа в фоновом потоке, чтоб интерфейс не замирал во время обучения.
+
+        Args:
+            force: bool - пересобрать все ноды, даже если они не изменились
+
+        Returns:
+            threading.Thread - поток, в котором идёт сборка
+        '''
+        if self.__compile_thread and self.__compile_thread.is_alive():
+            self.logger.warning("Сборка графа уже идёт")
+            return self.__compile_thread
+
+        self.__compile_thread = threading.Thread(target=self.builder.compile_graph, 
+                                                 args=(self.__start_nodes, force), 
+                                                 name="compile_graph", daemon=True)
+        self.__compile_thread.start()
+
+        return self.__compile_thread
+
+
+    def warm_up(self) -> threading.Thread:
+        '''
+        Импортировать Keras и TensorFlow и собрать маленькую модель в фоновом потоке.
+        Вызывается после первого кадра, чтобы окно появилось, не дожидаясь TensorFlow,
+        а к первой сборке графа он уже был загружен.
+
+        Returns:
+            threading.Thread - поток, в котором идёт загрузка
+        '''
+        thread = threading.Thread(target=self.__warm_up, name="warm_up", daemon=True)
+        thread.start()
+        return thread
+
+
+    def __warm_up(self):
+        start = time.perf_counter()
+
+        try: CompileNode.warm_up()
+        except Exception as ex:
+            self.logger.warning(f"Не удалось заранее загрузить Keras: {ex}")
+            return
+
+        self.logger.info(f"Keras загружен за {time.perf_counter() - start:.1f} с")
+
+
     def on_viewport_resize_callback(self, **kwargs):
         '''
         Callback для изменения размера node_editor'a
@@ -86,7 +154,8 @@ class NodeEditor:
             sender: str | int - зачастую является окном редакторивания графа (dpg.node_editor)
             app_data: str | int - элемент, который перетащили.
         '''
-        self.logger.debug(f"На вход пришло {sender}, {app_data}, {dpg.get_item_user_data(app_data)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"На вход пришло {sender}, {app_data}, {dpg.get_item_user_data(app_data)}")
 
         # Реализовать создание нода, через обычные координаты мыши не получится
         # потому что координаты в node_editor отличаются от координат мыши
@@ -101,16 +170,13 @@ class NodeEditor:
         pos[0] = pos[0] - (ref_screen_pos[0] - NODE_PADDING[0]) + ref_grid_pos[0]
         pos[1] = pos[1] - (ref_screen_pos[1] - NODE_PADDING[1]) + ref_grid_pos[1]
 
-        self.logger.info(f"Узел поставлен на позиции - {pos}")
+        self.logger.info("Узел поставлен на позиции - %s", pos)
 
         node_data: NodeAnnotation = dpg.get_item_user_data(app_data)
         node_id = self.builder.build_node(node_data, parent="node_editor")
         dpg.set_item_pos(node_id, pos)
 
-        # Мы только создали узел и у него ещё нет связей
-        self.__start_nodes.append(dpg.get_item_user_data(node_id))
-
-        self.logger.debug(f"Start nodes: {self.__start_nodes}")
+        self.__log_start_nodes()
 
         return node_id
 
@@ -123,45 +189,22 @@ class NodeEditor:
             sender: int | str - зачастую является окном редакторивания графа (dpg.node_editor)
             app_data: tuple(str | int, str | int) - исходящие и приходящие атрибуты нодов.
         '''
-        self.logger.debug(f"На вход пришло {app_data}")
-
-        node_out: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(app_data[0]))
-        node_in: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(app_data[1]))
-
-        # Проверка при связывании, что правильные узлы связываются
-        accaptable: ANode = node_in.annotations[dpg.get_item_label(app_data[1])].hint
-        if not isinstance(node_out, accaptable.node_type):
-            self.logger.warning(f"Некорректная попытка связывания узлов: {node_out} -> {node_in}({dpg.get_item_label(app_data[1])}) должно быть {accaptable.node_type}")
-            return
-        # Проверка, что не больше одной связи, если нужно
-        if accaptable.single and dpg.get_item_user_data(app_data[1]):
-            self.logger.warning(f"Некорректная попытка связывания узлов: {node_out} -> {node_in}({dpg.get_item_label(app_data[1])}) связей не может быть больше 1!")
-            return
-
-        self.logger.debug(f"Node_out - {dpg.get_item_label(dpg.get_item_parent(app_data[0]))}")
+        self.logger.debug("На вход пришло %s", app_data)
+        attr_out, attr_in = app_data
 
-        link_id = dpg.add_node_link(app_data[0], app_data[1], parent=sender, user_data=node_link(app_data[0], app_data[1]))
+        # Проверка при связывании, что правильные узлы связываются и связей не больше одной, если нужно
+        link_id = self.builder.link(attr_out, attr_in, sender)
+        if link_id is None: return
 
-        self.logger.debug(f"Связи до: {node_out} {node_in}")
+        node_out = self.graph.node_of(attr_out)
+        node_in = self.graph.node_of(attr_in)
 
-        data_in: list | None = dpg.get_item_user_data(app_data[1])
-        if not data_in: data_in = []
-        data_in.append(app_data[0])
-        dpg.set_item_user_data(app_data[1], data_in)
+        self.builder.sync_attribute(attr_out)
+        self.builder.sync_attribute(attr_in)
 
-        data_out: list | None = dpg.get_item_user_data(app_data[0])
-        if not data_out: data_out = []
-        data_out.append(app_data[1])
-        dpg.set_item_user_data(app_data[0], data_out)
-
-        node_out.outgoing[app_data[0]] = data_out
-        node_in.incoming[app_data[1]] = data_in
-
-        if node_in in self.__start_nodes: self.__start_nodes.remove(node_in)
-
-        self.logger.debug(f"Связи после: {node_out} {node_in}")
-
-        self.logger.debug(f"Start nodes: {self.__start_nodes}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Связи после: {node_out} {node_in}")
+        self.__log_start_nodes()
 
         return link_id
 
@@ -174,7 +217,7 @@ class NodeEditor:
             sender: int | str - зачастую является окном редакторивания графа (dpg.node_editor)
             app_data: str | int - связь между нодами (dpg.add_node_link)
         '''
-        link: node_link = dpg.get_item_user_data(app_data)
+        link: node_link = self.graph.links[app_data]
 
         self.delink(link.outgoing, link.incoming)
 
@@ -182,24 +225,14 @@ class NodeEditor:
 
 
     def delink(self, attr_outgoing: str | int, attr_incoming: str | int):
-        self.logger.debug(f"Связи до: {attr_outgoing} {attr_incoming}")
-
-        node_out: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(attr_outgoing))
-        node_in: AbstractNode = dpg.get_item_user_data(dpg.get_item_parent(attr_incoming))
-
-        node_out.outgoing[attr_outgoing].remove(attr_incoming)
-        node_in.incoming[attr_incoming].remove(attr_outgoing)
-
-        dpg.set_item_user_data(attr_outgoing, node_out.outgoing[attr_outgoing])
-        dpg.set_item_user_data(attr_incoming, node_in.incoming[attr_incoming])
-
-        if not node_out.outgoing[attr_outgoing]: del node_out.outgoing[attr_outgoing]
-        if not node_in.incoming[attr_incoming]: del node_in.incoming[attr_incoming]
+        self.logger.debug("Связи до: %s %s", attr_outgoing, attr_incoming)
 
-        if not node_in.incoming: self.__start_nodes.append(node_in)
+        self.graph.unlink(attr_outgoing, attr_incoming)
+        self.builder.sync_attribute(attr_outgoing)
+        self.builder.sync_attribute(attr_incoming)
 
-        self.logger.debug(f"Связи после: {attr_outgoing} {attr_incoming}")
-        self.logger.debug(f"Start nodes: {self.__start_nodes}")
+        self.logger.debug("Связи после: %s %s", attr_outgoing, attr_incoming)
+        self.__log_start_nodes()
 
 
     def delete_node(self, node_id: str | int):
@@ -209,32 +242,103 @@ class NodeEditor:
         Args:
             node_id: str | int - индетификатор нода, которого нужно удалить (dpg.node)
         '''
-        node: AbstractNode = dpg.get_item_user_data(node_id)
-        if len(dpg.get_item_children("node_editor", slot=1)) == 1 and \
-            dpg.get_item_children("node_editor", slot=1)[0] == node_id:
+        node: AbstractNode = self.graph.nodes[node_id]
+        if len(self.graph) == 1:
             node.raise_error("Нельзя удалять узел, когда он один на поле!", 
                              "Некорректное действие пользователя")
             return
-        
+
         # Удаляем связи с этим узлом
+        for link_id, link in self.graph.remove_node(node).items():
+            if dpg.does_item_exist(link_id): dpg.delete_item(link_id)
 
-        incoming = node.incoming.copy()
-        outgoing = node.outgoing.copy()
+            for attr in (link.outgoing, link.incoming):
+                if attr in self.graph.ports: self.builder.sync_attribute(attr)
 
-        for attr_in in incoming.keys():
-            for attr_out in incoming[attr_in]:
-                self.delink(attr_out, attr_in)
+        dpg.delete_item(node_id)
+        self.__release_events()
 
-        for attr_out in outgoing.keys():
-            for attr_in in outgoing[attr_out]:
-                self.delink(attr_out, attr_in)
-        
-        if node in self.__start_nodes: self.__start_nodes.remove(node)
+        self.__log_start_nodes()
 
-        del node
-        dpg.delete_item(node_id)
 
-        self.logger.debug(f"Start nodes: {self.__start_nodes}")
+    def __release_events(self):
+        # События элементов удалённых нод больше не вызовутся, отписываем их обработчики
+        from Src.Events.event_manager import Event_manager
+        Event_manager.collect()
+
+
+    def __log_start_nodes(self):
+        # Набор начальных нод меняется дальше, поэтому строку собираем сразу, но только если она попадёт в лог
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Start nodes: {self.__start_nodes}")
+
+
+    def clear(self):
+        '''
+        Удалить все ноды и связи из редактора.
+        '''
+        for node in list(self.graph):
+            for link_id in self.graph.remove_node(node):
+                if dpg.does_item_exist(link_id): dpg.delete_item(link_id)
+
+            dpg.delete_item(node.node_tag)
+
+        self.__release_events()
+
+
+    def save(self, path: str):
+        '''
+        Сохранить граф редактора в JSON: ноды по названию в каталоге, значения параметров, 
+        позиции нод и связи между атрибутами.
+
+        Args:
+            path: str - файл, в который сохранить граф
+        '''
+        nodes = list(self.graph)
+        index = {node: number for number, node in enumerate(nodes)}
+        graph_file = GraphFile()
+
+        for node in nodes:
+            parameters = {}
+            for label, attr in self.graph.ports_of(node).items():
+                parameter = node.annotations.get(label)
+                if self.builder.is_saved(parameter):
+                    parameters[label] = parameter.hint.dump(parameter.get_value(attr))
+
+            graph_file.nodes.append(NodeRecord(dpg.get_item_label(node.node_tag), 
+                                               list(dpg.get_item_pos(node.node_tag)), parameters))
+
+        for link in self.graph.links.values():
+            port_out, port_in = self.graph.ports[link.outgoing], self.graph.ports[link.incoming]
+            graph_file.links.append([index[port_out.node], port_out.label, index[port_in.node], port_in.label])
+
+        graph_file.save(path)
+        self.logger.info(f"Граф сохранён в {path}")
+
+
+    def load(self, path: str) -> list[str | int]:
+        '''
+        Открыть граф из JSON вместо текущего. Ноды и связи создаются одним проходом 
+        NodeBuilder.build_graph, а не повторением drop_callback и link_callback.
+
+        Args:
+            path: str - файл с графом
+
+        Returns:
+            list[str | int] - индетификаторы созданных нод в порядке файла
+        '''
+        if self.__compile_thread and self.__compile_thread.is_alive():
+            self.logger.warning("Нельзя открыть граф, пока идёт сборка")
+            return []
+
+        graph_file = GraphFile.load(path)
+        self.builder.check_catalog(graph_file.nodes)
+
+        self.clear()
+        node_ids = self.builder.build_graph(graph_file.nodes, graph_file.links, "node_editor")
+
+        self.logger.info(f"Граф открыт из {path}: {len(node_ids)} узлов, {len(self.graph.links)} связей")
+        return node_ids
 
 
     def show(self, parent: str | int):
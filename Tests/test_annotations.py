@@ -27,6 +27,10 @@ class test_annotations(DPGUnitTest):
         assert 'k' not in kwargs
         assert len(kwargs.keys()) == 3
 
+        allowed = Annotation.allowed_kwargs(dpg.node_attribute)
+        assert allowed is Annotation.allowed_kwargs(dpg.node_attribute)
+        assert 'attribute_type' in allowed and 'return' not in allowed
+
 
     def test_ABoolean(self):
         checkbox_id = ABoolean.build(parent = self.parent)
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from Src.Data import ArrayCache
+
+
+
+class test_array_cache(unittest.TestCase):
+    '''
+    Проверка кэша прочитанных данных
+    '''
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.cache = ArrayCache(os.path.join(self.directory, "cache"))
+
+        self.file = os.path.join(self.directory, "data.csv")
+        with open(self.file, "w") as f:
+            f.write("1,2\n3,4\n")
+
+        self.calls = 0
+
+
+    def loader(self, files: str, delimiter: str = ","):
+        self.calls += 1
+        return np.genfromtxt(files, delimiter=delimiter, ndmin=2)
+
+
+    def test_reload(self):
+        load = self.cache.cached(self.loader)
+
+        first = load(files=self.file, delimiter=",")
+        second = load(files=self.file, delimiter=",")
+
+        assert self.calls == 1
+        assert isinstance(second, np.memmap) and not second.flags.writeable
+        assert np.array_equal(first, second)
+
+
+    def test_invalidate(self):
+        load = self.cache.cached(self.loader)
+        load(files=self.file)
+
+        # Другие параметры чтения - другой ключ
+        load(files=self.file, delimiter=";")
+        assert self.calls == 2
+
+        with open(self.file, "w") as f:
+            f.write("5,6\n")
+        os.utime(self.file, ns=(0, 0))
+
+        assert load(files=self.file).tolist() == [[5, 6]]
+        assert self.calls == 3
+        # Копия прошлой версии файла удалена, копия с другими параметрами осталась
+        assert len(os.listdir(self.cache.directory)) == 2
+
+
+    def test_missing_file(self):
+        load = self.cache.cached(self.loader)
+
+        with self.assertRaises(OSError):
+            load(files=os.path.join(self.directory, "missing.csv"))
+
+
+    def test_lookup(self):
+        assert self.cache.lookup(self.loader, self.file, delimiter=",") is None
+
+        self.cache.cached(self.loader)(files=self.file, delimiter=",")
+
+        assert self.cache.lookup(self.loader, self.file, delimiter=",").shape == (2, 2)
+        assert self.cache.lookup(self.loader, self.file, delimiter=";") is None
+        assert self.calls == 1
@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import unittest
+
+import benchmark
+
+
+
+class test_benchmark(unittest.TestCase):
+    '''
+    Проверка замера запуска
+    '''
+
+    def test_import_times(self):
+        stderr = "\n".join(["import time: self [us] | cumulative | imported package",
+                            "import time:       100 |        100 |     keras.src",
+                            "import time:       200 |        300 |   keras",
+                            "import time:        50 |        350 | Src.node_editor",
+                            "some other output"])
+
+        assert benchmark.import_times(stderr) == {"keras": 300e-6, "Src": 50e-6}
+
+
+    def test_main(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "startup.json")
+
+        benchmark.main(["--repeat", "1", "--no-viewport", "--no-compile", "--output", path])
+
+        with open(path) as file:
+            result = json.load(file)
+
+        run = result["runs"][0]
+        assert not run["errors"]
+        assert list(run["phases"]) == ["import", "create_context", "logger_factory", "node_editor",
+                                       "fonts", "window", "build_list"]
+        assert run["since_start"]["build_list"] >= run["phases"]["import"]
+        assert "dearpygui" in run["imports"]
+        assert result["summary"]["phases"].keys() == run["phases"].keys()
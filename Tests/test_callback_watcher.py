@@ -0,0 +1,82 @@
+import json
+
+import dearpygui.dearpygui as dpg
+
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_callback_watcher(DPGUnitTest):
+    '''
+    Проверка общего опроса DPGCallback
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+
+        from Src.Events.callbacks import DPGCallback
+        from Src.Events.callback_watcher import CallbackWatcher
+        cls.DPGCallback = DPGCallback
+        cls.CallbackWatcher = CallbackWatcher
+
+
+    def setUp(self):
+        self.CallbackWatcher._callbacks.clear()
+        self.CallbackWatcher.interval = 0.0
+
+
+    def watch(self, value: int = 0) -> tuple[int, list[int]]:
+        item = dpg.add_input_int(default_value=value, parent=self.parent)
+        calls = []
+        callback = self.DPGCallback(item)
+        callback.add_value_callback(lambda: calls.append(dpg.get_value(item)))
+        self.CallbackWatcher.register(callback)
+        return item, calls
+
+
+    def test_changes_only(self):
+        first, first_calls = self.watch()
+        second, second_calls = self.watch()
+
+        dpg.set_value(first, 5)
+        assert self.CallbackWatcher.poll() == 2
+        self.CallbackWatcher.poll()
+
+        assert first_calls == [5]
+        assert second_calls == []
+
+
+    def test_deleted_item(self):
+        item, calls = self.watch()
+        dpg.delete_item(item)
+
+        assert self.CallbackWatcher.poll() == 0
+        assert self.CallbackWatcher._callbacks == []
+
+
+    def test_interval(self):
+        item, calls = self.watch()
+        self.CallbackWatcher.interval = 60.0
+        self.CallbackWatcher.poll(force=True)
+        dpg.set_value(item, 1)
+
+        assert self.CallbackWatcher.poll() == 0
+        assert calls == []
+        self.CallbackWatcher.poll(force=True)
+        assert calls == [1]
+
+
+    def test_attach(self):
+        self.CallbackWatcher.attach(self.parent)
+        handlers = self.CallbackWatcher._handlers[self.parent]
+        self.CallbackWatcher.attach(self.parent)
+
+        assert self.CallbackWatcher._handlers[self.parent] == handlers
+        assert dpg.get_item_info(self.parent)["handlers"] == handlers
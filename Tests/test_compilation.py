@@ -41,7 +41,7 @@ class test_compilation(DPGUnitTest):
             "Compile": node_list["Training"]["General"][0],
             "Fit": node_list["Training"]["General"][1],
             "Predict": node_list["Training"]["General"][2],
-            "Save": node_list["Training"]["Utils"][2]
+            "Save": node_list["Training"]["Utils"][3]
         }
         get_attr = lambda attr_name, node_id: [attribute for attribute in dpg.get_item_children(node_id, slot=1) \
                                                for field in dpg.get_item_children(attribute, slot=1)\
@@ -91,6 +91,14 @@ class test_compilation(DPGUnitTest):
 
         assert all([dpg.get_item_user_data(node) in visited for node in nodes])
 
+        # Ничего не изменилось - пересобирать нечего
+        assert self.node_editor.builder.compile_graph(self.node_editor._NodeEditor__start_nodes) == []
+
+        # Пересобирается только изменённая нода и то, что от неё зависит
+        self.node_editor.graph.mark_dirty(dpg.get_item_user_data(dense))
+        recompiled = self.node_editor.builder.compile_graph(self.node_editor._NodeEditor__start_nodes)
+        assert [node.node_tag for node in recompiled] == [dense, compile, fit, predict, save]
+
         filepath: Path = Path(AString.get(dpg.get_item_children(get_attr("fname", save), slot=1)[0]))
         assert filepath.exists()
         filepath.unlink(missing_ok=True)
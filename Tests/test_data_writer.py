@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from Src.Data import DataWriter, NumberFormat, TableLoader
+
+
+
+def printf(value: float, precision: int) -> str:
+    '''
+    Запись числа через printf с отброшенными нулями в конце дробной части.
+    '''
+    mantissa, exponent = f"{value:.{precision - 1}e}".split("e")
+    return f"{mantissa.rstrip('0').rstrip('.')}e{exponent}"
+
+
+
+class test_data_writer(unittest.TestCase):
+    '''
+    Проверка записи данных в разные форматы
+    '''
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.data = np.random.default_rng(0).random((1000, 3))
+
+
+    def test_csv(self):
+        path = os.path.join(self.directory, "result.csv")
+
+        DataWriter(",", block_rows=64).write(self.data, path)
+
+        assert np.array_equal(TableLoader(",").load(path), self.data)
+        assert not [name for name in os.listdir(self.directory) if name.endswith(".tmp")]
+
+
+    def test_numpy(self):
+        npy = DataWriter().write(self.data, os.path.join(self.directory, "result.npy"))
+        npz = DataWriter(compressed=True).write(self.data, os.path.join(self.directory, "result.npz"))
+
+        assert np.array_equal(np.load(npy), self.data)
+        with np.load(npz) as archive:
+            assert np.array_equal(archive["data"], self.data)
+
+
+    def test_async(self):
+        path = os.path.join(self.directory, "result.txt")
+
+        future = DataWriter(" ").write_async(np.arange(4), path)
+
+        assert future.result() is not None
+        assert np.genfromtxt(path).tolist() == [0, 1, 2, 3]
+
+
+    def test_float32(self):
+        path = os.path.join(self.directory, "result.csv")
+        data = self.data.astype(np.float32)
+
+        DataWriter(",").write(data, path)
+
+        with open(path) as f:
+            assert f.readline() == ",".join(printf(value, 9) for value in data[0]) + "\n"
+        assert np.array_equal(TableLoader(",", dtype="float32").load(path), data)
+
+
+    def test_number_format(self):
+        bits = np.random.default_rng(0).integers(0, 2**63, 100000, dtype=np.uint64)
+        values = np.concatenate([bits.view(np.float64), [1e-300, 5e-324, 2.0**60 + 768, 1e23, 9999999999999999.0]])
+        values = values[np.isfinite(values) & (values != 0)]
+
+        cells = NumberFormat.cells(values)
+
+        assert [bytes(cell).replace(b"\0", b"").decode() for cell in cells] == \
+               [printf(value, 17) for value in values]
+        assert [bytes(cell).replace(b"\0", b"").decode() for cell in NumberFormat.cells(
+            np.array([0.0, -0.0, np.nan, np.inf, -np.inf, 917144.4375], dtype=np.float32))] == \
+               ["0", "-0", "nan", "inf", "-inf", "9.17144438e+05"]
+        assert [bytes(cell).replace(b"\0", b"").decode() for cell in NumberFormat.cells(
+            np.array([-2**63, 0, 2**63 - 1]))] == ["-9223372036854775808", "0", "9223372036854775807"]
+
+
+    def test_format(self):
+        path = os.path.join(self.directory, "result.csv")
+
+        DataWriter("; ", fmt="%.2f").write(np.array([[1, 2], [3, 4]]), path)
+        DataWriter(",").write(np.array([True, False]), path + "2")
+
+        with open(path) as f:
+            assert f.read() == "1.00; 2.00\n3.00; 4.00\n"
+        with open(path + "2") as f:
+            assert f.read() == "1\n0\n"
@@ -0,0 +1,101 @@
+import gc
+import json
+
+import dearpygui.dearpygui as dpg
+
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class Listener:
+    '''
+    Объект с методом-обработчиком события
+    '''
+
+    def __init__(self):
+        self.calls = []
+
+
+    def handle(self, *args):
+        self.calls.append(args)
+
+
+
+class test_event_manager(DPGUnitTest):
+    '''
+    Проверка шины событий
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+
+        from Src.Events.event_manager import Event_manager
+        cls.Event_manager = Event_manager
+
+
+    def setUp(self):
+        self.Event_manager.remove_custom_event()
+
+
+    def test_weak_method(self):
+        listener = Listener()
+        calls = []
+        self.Event_manager.add_custom_event("event", [listener.handle, lambda *args: calls.append(args)])
+        self.Event_manager.trigger_custom_event("event", 1)
+
+        del listener
+        gc.collect()
+        self.Event_manager.trigger_custom_event("event", 2)
+
+        assert calls == [(1,), (2,)]
+        assert len(self.Event_manager.get_events()["event"]) == 1
+
+
+    def test_remove_item(self):
+        item = dpg.add_input_int(parent=self.parent)
+        listener = Listener()
+        topic = self.Event_manager.topic(item, "value")
+        self.Event_manager.add_custom_event(topic, [listener.handle], item=item)
+        self.Event_manager.add_custom_event("other", [listener.handle])
+
+        dpg.delete_item(item)
+        self.Event_manager.collect()
+
+        assert topic not in self.Event_manager.get_events()
+        assert "other" in self.Event_manager.get_events()
+        assert self.Event_manager._items == {}
+
+
+    def test_deferred(self):
+        listener = Listener()
+        self.Event_manager.add_custom_event("event", [listener.handle])
+        self.Event_manager.post("event")
+        self.Event_manager.post("event")
+        self.Event_manager.post("event", 1)
+
+        assert listener.calls == []
+        assert self.Event_manager.flush() == 2
+        assert listener.calls == [(), (1,)]
+
+
+    def test_callback_cleanup(self):
+        from Src.Events.callbacks import DPGCallback
+
+        item = dpg.add_input_int(parent=self.parent)
+        listener = Listener()
+        callback = DPGCallback(item)
+        callback.add_value_callback(listener.handle)
+
+        dpg.set_value(item, 3)
+        callback.check()
+        callback.remove()
+
+        assert listener.calls == [()]
+        assert self.Event_manager.get_events() == {}
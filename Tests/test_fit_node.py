@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import keras
+
+from Src.Nodes.fit_node import TrainingProgress
+
+
+
+class test_fit_node(unittest.TestCase):
+    '''
+    Проверка отслеживания прогресса обучения
+    '''
+
+    def make_model(self) -> keras.models.Model:
+        inputs = keras.layers.Input(shape=(2,))
+        model = keras.models.Model(inputs, keras.layers.Dense(1)(inputs))
+        model.compile(optimizer="sgd", loss="mse")
+        return model
+
+
+    def test_progress(self):
+        updates = []
+        training = TrainingProgress(lambda progress: updates.append(progress.progress))
+
+        self.make_model().fit(np.ones((64, 2)), np.ones((64, 1)), epochs=3, batch_size=16, 
+                              callbacks=[training], verbose=False)
+
+        assert training.progress == 1.0
+        assert len(training.history) == 3
+        assert 'loss' in training.history[0]
+        assert updates and updates[-1] == 1.0
+
+
+    def test_cancel(self):
+        class CancelAfterEpoch(keras.callbacks.Callback):
+            def on_epoch_end(self, epoch, logs=None):
+                training.cancel()
+
+        training = TrainingProgress()
+
+        self.make_model().fit(np.ones((64, 2)), np.ones((64, 1)), epochs=10, batch_size=16, 
+                              callbacks=[training, CancelAfterEpoch()], verbose=False)
+
+        assert training.cancelled
+        assert len(training.history) == 1
+        assert training.progress < 1.0
+
+
+    def test_cancel_before_train(self):
+        training = TrainingProgress()
+        training.cancel()
+
+        self.make_model().fit(np.ones((64, 2)), np.ones((64, 1)), epochs=10, batch_size=16, 
+                              callbacks=[training], verbose=False)
+
+        assert training.cancelled
+        assert len(training.history) <= 1
+        assert training.progress < 1.0
@@ -0,0 +1,123 @@
+import json
+
+import dearpygui.dearpygui as dpg
+
+from Src.Graph import Graph
+from Src.Nodes import AbstractNode, LayerNode
+from Src.Config import Parameter
+from Src.Config.Annotations import ANode, Single
+from Src.Enums.attr_type import AttrType
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_graph(DPGUnitTest):
+    '''
+    Проверка графа нодов без отображения в DearPyGUI
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+
+
+    def make_node(self, graph: Graph, tag: int, node_type: type = AbstractNode,
+                  annotations: dict = None) -> AbstractNode:
+        node = node_type(tag, annotations or {}, lambda *args, **kwargs: None)
+        graph.add_node(node, {f"{tag}.{label}": label for label in ["OUTPUT", *(annotations or {})]})
+        return node
+
+
+    def test_link(self):
+        graph = Graph()
+        node1 = self.make_node(graph, 1)
+        node2 = self.make_node(graph, 2, annotations={"x": Parameter(AttrType.INPUT, ANode[object])})
+
+        assert list(graph.start_nodes) == [node1, node2]
+
+        link = graph.link("1.OUTPUT", "2.x", "link")
+
+        assert graph.links["link"] == link
+        assert node2 not in graph.start_nodes
+        assert list(graph.successors(node1)) == [node2]
+        assert list(graph.predecessors(node2)) == [node1]
+        assert node1.outgoing["1.OUTPUT"] == ["2.x"]
+        assert node2.incoming["2.x"] == ["1.OUTPUT"]
+
+        graph.unlink("1.OUTPUT", "2.x")
+
+        assert node2 in graph.start_nodes
+        assert "link" not in graph.links
+        assert "1.OUTPUT" not in node1.outgoing
+        assert "2.x" not in node2.incoming
+
+
+    def test_multiple_links(self):
+        graph = Graph()
+        node1 = self.make_node(graph, 1)
+        node2 = self.make_node(graph, 2, annotations={"x": Parameter(AttrType.INPUT, ANode[object]),
+                                                      "y": Parameter(AttrType.INPUT, ANode[object])})
+
+        graph.link("1.OUTPUT", "2.x")
+        graph.link("1.OUTPUT", "2.y")
+        assert graph.in_degree(node2) == 1
+
+        graph.unlink("1.OUTPUT", "2.x")
+        assert node2 not in graph.start_nodes
+
+        graph.unlink("1.OUTPUT", "2.y")
+        assert node2 in graph.start_nodes
+
+
+    def test_check_link(self):
+        graph = Graph()
+        self.make_node(graph, 1)
+        self.make_node(graph, 2, LayerNode)
+        self.make_node(graph, 3, annotations={"x": Parameter(AttrType.INPUT, ANode[Single[LayerNode]])})
+
+        assert graph.check_link("1.OUTPUT", "3.x") is not None
+        assert graph.check_link("2.OUTPUT", "3.x") is None
+
+        graph.link("2.OUTPUT", "3.x")
+        assert graph.check_link("2.OUTPUT", "3.x") is not None
+
+
+    def test_remove_node(self):
+        graph = Graph()
+        node1 = self.make_node(graph, 1)
+        node2 = self.make_node(graph, 2, annotations={"x": Parameter(AttrType.INPUT, ANode[object])})
+        graph.link("1.OUTPUT", "2.x", "link")
+
+        removed = graph.remove_node(node1)
+
+        assert list(removed) == ["link"]
+        assert node1 not in graph
+        assert "1.OUTPUT" not in graph.ports
+        assert list(graph.start_nodes) == [node2]
+        assert not node2.incoming
+
+
+    def test_dirty(self):
+        graph = Graph()
+        node1 = self.make_node(graph, 1)
+        node2 = self.make_node(graph, 2, annotations={"x": Parameter(AttrType.INPUT, ANode[object])})
+        node3 = self.make_node(graph, 3, annotations={"x": Parameter(AttrType.INPUT, ANode[object])})
+
+        assert graph.dirty == {node1, node2, node3}
+
+        graph.link("1.OUTPUT", "2.x")
+        graph.link("2.OUTPUT", "3.x")
+        graph.mark_clean(node1, node2, node3)
+
+        graph.mark_dirty(node2)
+        assert graph.downstream(graph.dirty) == {node2, node3}
+
+        graph.mark_clean(node2)
+        graph.unlink("2.OUTPUT", "3.x")
+        assert graph.dirty == {node3}
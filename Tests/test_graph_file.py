@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+
+import dearpygui.dearpygui as dpg
+
+from Src.node_editor import NodeEditor
+from Src.Graph import GraphFile
+from Src.Config.Annotations import AString, AEnum, ABoolean
+from Src.Enums import Delimiters
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_graph_file(DPGUnitTest):
+    '''
+    Проверка сохранения и открытия графа редактора
+    '''
+    node_editor: NodeEditor
+
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+        cls.node_editor = NodeEditor()
+
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "graph.json")
+
+
+    def get_field(self, node_id: str | int, label: str) -> str | int:
+        attr = self.node_editor.graph.ports_of(self.node_editor.graph.nodes[node_id])[label]
+        return dpg.get_item_children(attr, slot=1)[0]
+
+
+    def test_save_load(self):
+        editor = self.node_editor
+        editor.clear()
+
+        input = editor.builder.build_input("node_editor")
+        data = editor.builder.build_node(editor.builder.catalog["Tables data"], "node_editor")
+        dense = editor.builder.build_node(editor.builder.catalog["Dense"], "node_editor")
+        dpg.set_item_pos(dense, [300, 40])
+
+        AString.set(self.get_field(data, "files"), "./Tests/X.txt")
+        AEnum[Delimiters].set(self.get_field(data, "delimiter"), Delimiters.SEMICOLON)
+        ABoolean.set(self.get_field(data, "skip_header"), True)
+
+        ports = lambda node_id: editor.graph.ports_of(editor.graph.nodes[node_id])
+        editor.link_callback("node_editor", (ports(data)["shape"], ports(input)["shape"]))
+        editor.link_callback("node_editor", (ports(input)["OUTPUT"], ports(dense)["INPUT"]))
+
+        editor.save(self.path)
+        graph_file = GraphFile.load(self.path)
+
+        assert graph_file.version == GraphFile.VERSION
+        assert [node.label for node in graph_file.nodes] == ["Input", "Tables data", "Dense"]
+        assert graph_file.nodes[1].parameters["files"] == "./Tests/X.txt"
+        assert sorted(graph_file.links) == sorted([[1, "shape", 0, "shape"], [0, "OUTPUT", 2, "INPUT"]])
+
+        node_ids = editor.load(self.path)
+
+        assert len(editor.graph) == 3 and len(editor.graph.links) == 2
+        assert [dpg.get_item_label(node_id) for node_id in node_ids] == ["Input", "Tables data", "Dense"]
+        assert dpg.get_item_pos(node_ids[2]) == [300, 40]
+        assert AString.get(self.get_field(node_ids[1], "files")) == "./Tests/X.txt"
+        assert dpg.get_value(self.get_field(node_ids[1], "delimiter")) == ";"
+        assert ABoolean.get(self.get_field(node_ids[1], "skip_header"))
+        assert list(editor.graph.start_nodes) == [editor.graph.nodes[node_ids[1]]]
+
+        # Связи отражены в user_data атрибутов, через них ANode получает значения
+        input_shape = ports(node_ids[0])["shape"]
+        assert dpg.get_item_user_data(input_shape) == [ports(node_ids[1])["shape"]]
+
+
+    def test_version(self):
+        with open(self.path, "w") as f:
+            json.dump({"version": GraphFile.VERSION + 1, "nodes": [], "links": []}, f)
+
+        with self.assertRaises(ValueError):
+            self.node_editor.load(self.path)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+from Src.Data import ImageLoader, ImageShardCache
+
+
+
+class test_image_cache(unittest.TestCase):
+    '''
+    Проверка кэша декодированных изображений
+    '''
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        for number in range(5):
+            Image.new("L", (4, 4), number * 10).save(os.path.join(self.directory, f"{number}.png"))
+
+        self.cache = ImageShardCache(os.path.join(self.directory, "cache"))
+        self.cache.SHARD_SIZE = 2
+        self.files = ImageLoader.files(self.directory)
+        self.loader = ImageLoader(color_mode="grayscale")
+
+
+    def test_shards(self):
+        shards = self.cache.open(self.loader, self.files)
+
+        assert shards.shape == (5, 4, 4, 1)
+        assert len(os.listdir(shards.directory)) == 4
+        assert shards.take([4, 0, 3])[:, 0, 0, 0].tolist() == [40, 0, 30]
+        assert np.array_equal(shards.take(range(5)), self.loader.load(self.files))
+
+
+    def test_reuse(self):
+        first = self.cache.open(self.loader, self.files)
+        second = self.cache.open(self.loader, self.files)
+
+        assert first.directory == second.directory
+
+        os.utime(self.files[0], ns=(0, 0))
+        assert self.cache.open(self.loader, self.files).directory != first.directory
+
+
+    def test_stream(self):
+        shards = self.cache.open(self.loader, self.files)
+
+        x = self.loader.stream(self.files, batch_size=3, shards=shards)[1]
+
+        assert x.dtype == np.float32
+        assert x[:, 0, 0, 0].tolist() == [30, 40]
+
+
+    def test_node(self):
+        from Src.Data import ImageStream
+        from Src.Nodes import ImageDataNode
+
+        # Набор из шардов не собирается в память целиком, даже без stream
+        with mock.patch.object(ImageDataNode, "shard_cache", self.cache):
+            x = ImageDataNode.open_data(directory=self.directory, color_mode="grayscale", cache=True, batch_size=2)
+
+        assert isinstance(x, ImageStream) and x.shards is not None
+        assert len(x) == 3 and x[2][:, 0, 0, 0].tolist() == [40]
+
+
+    def test_parallel_write(self):
+        with ThreadPoolExecutor(4) as pool:
+            directories = {shards.directory for shards in pool.map(lambda _: self.cache.open(self.loader, self.files), range(4))}
+
+        assert len(directories) == 1
+        assert not [name for name in os.listdir(self.cache.directory) if name.endswith(".tmp")]
+
+
+    def test_failed_write(self):
+        with open(os.path.join(self.directory, "broken.png"), "wb") as f:
+            f.write(b"not an image")
+
+        with self.assertRaises(Exception):
+            self.cache.open(ImageLoader((4, 4), "grayscale"), ImageLoader.files(self.directory))
+
+        assert os.listdir(self.cache.directory) == []
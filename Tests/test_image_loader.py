@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from Src.Data import ImageLoader
+
+
+
+class test_image_loader(unittest.TestCase):
+    '''
+    Проверка чтения изображений в нескольких потоках
+    '''
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        for label, color in (("cats", 50), ("dogs", 200)):
+            os.mkdir(os.path.join(self.directory, label))
+            for number in range(3):
+                image = Image.new("RGB", (8 + number, 6), (color, color, color))
+                image.save(os.path.join(self.directory, label, f"{number}.png"))
+
+
+    def test_files(self):
+        assert len(ImageLoader.files(self.directory)) == 6
+        assert len(ImageLoader.files(os.path.join(self.directory, "cats", "*.png"))) == 3
+
+
+    def test_load(self):
+        files = ImageLoader.files(self.directory)
+
+        images = ImageLoader((4, 5), "grayscale", max_workers=2).load(files)
+
+        assert images.shape == (6, 4, 5, 1)
+        assert images.dtype == np.uint8
+        assert (images[:3] == 50).all() and (images[3:] == 200).all()
+
+
+    def test_labels(self):
+        labels, classes = ImageLoader.labels(ImageLoader.files(self.directory))
+
+        assert classes == ["cats", "dogs"]
+        assert labels.tolist() == [0, 0, 0, 1, 1, 1]
+
+
+    def test_stream(self):
+        files = ImageLoader.files(self.directory)
+        labels, _ = ImageLoader.labels(files)
+
+        stream = ImageLoader((4, 4)).stream(files, labels, batch_size=4)
+
+        assert len(stream) == 2
+        assert stream.shape == (6, 4, 4, 3)
+        x, y = stream[1]
+        assert x.shape == (2, 4, 4, 3)
+        assert y.tolist() == [1, 1]
+
+
+    def test_fit(self):
+        import keras
+        from Src.Nodes import FitNode, ImageDataNode
+
+        # Изображения без stream остаются в uint8 и всё равно подходят для обучения
+        x = ImageDataNode.open_data(directory=self.directory, size=(4, 4))
+        y = ImageLoader.labels(ImageLoader.files(self.directory))[0].astype(np.float32).reshape(-1, 1)
+
+        inputs = keras.Input((4, 4, 3))
+        model = keras.Model(inputs, keras.layers.Dense(1)(keras.layers.Flatten()(inputs)))
+        model.compile(optimizer="sgd", loss="mse")
+
+        assert x.dtype == np.uint8
+        assert FitNode.fit(model, x=x, y=y, epochs=1, batch_size=2) is model
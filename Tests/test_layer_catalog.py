@@ -0,0 +1,68 @@
+import json
+import tempfile
+import unittest
+
+import keras
+
+from Src.Config.layer_catalog import LayerCatalog
+from Src.Config.Annotations import AInteger, AFloat, AEnum, ASequence
+from Src.Enums import Padding
+from Src.Nodes import LayerResult
+
+
+
+class test_layer_catalog(unittest.TestCase):
+    '''
+    Проверка каталога слоёв Keras
+    '''
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.catalog = LayerCatalog(directory.name)
+
+
+    def test_introspect(self):
+        metadata = {layer["name"]: layer for layer in LayerCatalog.introspect()}
+        conv = {parameter["name"]: parameter for parameter in metadata["Conv2D"]["parameters"]}
+
+        assert metadata["Conv2D"]["section"] == "Convolutional"
+        assert conv["filters"] == {"name": "filters", "default": None, "kind": "int"}
+        assert conv["strides"]["kind"] == "sequence" and conv["strides"]["items"] == ["int", "int"]
+        assert conv["padding"]["kind"] == "enum"
+        # Псевдонимы, ячейки и обёртки не являются отдельными нодами
+        assert "AvgPool2D" not in metadata and "LSTMCell" not in metadata and "Bidirectional" not in metadata
+
+
+    def test_node_list(self):
+        sections = self.catalog.node_list(exclude={"Dense"})
+        nodes = {node.label: node for nodes in sections.values() for node in nodes}
+
+        assert "Dense" not in nodes and "Dropout" in nodes
+        assert nodes["Dropout"].annotations["rate"].hint is AFloat
+        assert nodes["Conv2D"].annotations["filters"].hint is AInteger
+        assert isinstance(nodes["Conv2D"].annotations["padding"].hint, AEnum)
+        assert nodes["Conv2D"].annotations["padding"].default == Padding.valid
+        assert isinstance(nodes["MaxPooling2D"].annotations["pool_size"].hint, ASequence)
+
+        kwargs = {name: parameter.default for name, parameter in nodes["Conv2D"].annotations.items()
+                  if name != "INPUT"} | {"filters": 4, "kernel_size": 3}
+        kwargs["padding"] = kwargs["padding"].value
+        kwargs["activation"] = "linear"
+
+        result = nodes["Conv2D"].logic(LayerResult(keras.Input((8, 8, 1)), set()), **kwargs)
+        assert tuple(result.layer.shape) == (None, 6, 6, 4)
+
+
+    def test_disk_cache(self):
+        metadata = self.catalog.metadata()
+
+        assert self.catalog.path.exists()
+        with open(self.catalog.path) as file:
+            assert len(json.load(file)) == len(metadata)
+
+        # Следующие запуски читают каталог с диска, а не разбирают keras.layers
+        with open(self.catalog.path, "w") as file:
+            json.dump([{"name": "Dropout", "section": "Test", "docs": "", "parameters": []}], file)
+
+        assert list(LayerCatalog(self.catalog.directory).node_list()) == ["Test"]
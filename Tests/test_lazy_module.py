@@ -0,0 +1,52 @@
+import inspect
+import subprocess
+import sys
+import unittest
+
+from Src.Utils import LazyModule
+from Src.Config.layer_catalog import LayerCatalog
+
+
+
+class test_lazy_module(unittest.TestCase):
+    '''
+    Проверка отложенного импорта keras
+    '''
+
+    def test_lazy_module(self):
+        module = LazyModule("json")
+        dumps = module.function("dumps")
+
+        assert dumps([1]) == "[1]"
+        assert inspect.getdoc(dumps) == inspect.getdoc(module.dumps)
+        assert LazyModule("Src.__not_exists__").loaded is False
+
+
+    def test_startup(self):
+        # Каталог слоёв уже разобран, дальше редактор не должен импортировать keras
+        LayerCatalog().metadata()
+        code = "import sys, Src.node_editor; print('keras' in sys.modules, 'tensorflow' in sys.modules)"
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ["False", "False"]
+
+
+    def test_search(self):
+        # Пока keras не загружен, поиск не читает документацию его функций, после загрузки - ищет и по ней
+        LayerCatalog().metadata()
+        code = "import sys; from Src.Config import NodeIndex; from Src.Config.node_list import node_list; " \
+               "index = NodeIndex(node_list); print(len(index.search('class vector')), 'keras' in sys.modules); " \
+               "import keras; print(index.search('class vector')[0].label)"
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.splitlines() == ["0 False", "to categorical"]
+
+
+    def test_warm_up(self):
+        from Src.Nodes import CompileNode
+
+        model = CompileNode.warm_up()
+
+        assert model.compiled and "keras" in sys.modules
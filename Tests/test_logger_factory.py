@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from unittest import mock
+
+import dearpygui.dearpygui as dpg
+
+from Src.Logging import Logger_factory, LogConsole
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class Probe:
+    '''
+    Аргумент лога, который запоминает, в каком потоке его превратили в строку
+    '''
+
+    def __init__(self):
+        self.threads = []
+
+
+    def __str__(self):
+        self.threads.append(threading.current_thread())
+        return "probe"
+
+
+
+class test_logger_factory(DPGUnitTest):
+    '''
+    Проверка записи логов через фоновый поток
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            cls.config = json.load(f)
+
+        cls.log_factory = Logger_factory(cls.config)
+        cls.directory = tempfile.TemporaryDirectory()
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+
+    def file_config(self, name: str) -> dict:
+        return {"filename": os.path.join(self.directory.name, name), "level": logging.DEBUG,
+                "format": "%(levelname)s - %(message)s"}
+
+
+    def test_no_duplicate_handlers(self):
+        config = self.file_config("twice.log")
+        logger = self.log_factory("twice", config)
+        logger = self.log_factory("twice", config)
+        logger.warning("одна запись")
+        Logger_factory.flush()
+
+        assert len(logger.handlers) == 1
+        assert len(Logger_factory._dispatcher.handlers("twice")) == 1
+        with open(config["filename"], encoding="utf-8") as file:
+            assert file.read().splitlines() == ["WARNING - одна запись"]
+
+
+    def test_background_formatting(self):
+        config = self.file_config("background.log")
+        logger = self.log_factory("background", config)
+        probe = Probe()
+        logger.debug("значение - %s", probe)
+        Logger_factory.flush()
+
+        assert probe.threads and threading.current_thread() not in probe.threads
+        with open(config["filename"], encoding="utf-8") as file:
+            assert file.read().splitlines() == ["DEBUG - значение - probe"]
+
+
+    def test_disabled_level(self):
+        logger = self.log_factory("disabled", self.file_config("disabled.log") | {"level": logging.ERROR})
+        probe = Probe()
+        logger.debug("значение - %s", probe)
+        Logger_factory.flush()
+
+        assert probe.threads == []
+
+
+    def test_restart(self):
+        config = self.file_config("restart.log")
+        logger = self.log_factory("restart", config)
+        logger.warning("до остановки")
+
+        # Остановка при выходе уже зарегистрирована первым запуском и не повторяется
+        with mock.patch("atexit.register") as register:
+            for _ in range(3):
+                Logger_factory.stop()
+                Logger_factory.start()
+
+        logger.warning("после запуска")
+        Logger_factory.flush()
+
+        assert register.call_count == 0
+        assert Logger_factory._listener is not None
+        assert len(Logger_factory._dispatcher.handlers("restart")) == 1
+        with open(config["filename"], encoding="utf-8") as file:
+            assert file.read().splitlines() == ["WARNING - до остановки", "WARNING - после запуска"]
+
+
+    def test_console_capacity(self):
+        console = LogConsole(capacity=3)
+        with dpg.window() as window:
+            console.build(window)
+
+        logger = self.log_factory("console", self.file_config("console.log"))
+        Logger_factory._dispatcher.add_shared(console)
+        for index in range(10): logger.warning("запись %d", index)
+        Logger_factory.flush()
+        Logger_factory._dispatcher.remove_shared(console)
+
+        assert [text[-8:] for _, text in console.records()] == ["запись 7", "запись 8", "запись 9"]
+        assert console.update()
+        assert len(console.lines) == 3
+        assert [dpg.get_value(line) for line in console.lines] == [text for _, text in console.records()]
+        # Без новых записей строки не обновляются
+        assert not console.update()
+
+
+    def test_console_level_filter(self):
+        console = LogConsole(capacity=10)
+        with dpg.window() as window:
+            console.build(window)
+
+        for level in (logging.DEBUG, logging.INFO, logging.ERROR):
+            console.handle(logging.LogRecord("console", level, __file__, 0, "запись", (), None))
+
+        console.set_level_filter("INFO")
+        console.update()
+        shown = [line for line in console.lines if dpg.is_item_shown(line)]
+
+        assert [level for level, _ in console.records()] == [logging.INFO, logging.ERROR]
+        assert len(shown) == 2
@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+import keras
+
+from Src.Nodes import CompileNode, InputLayerNode, LayerNode, LayerResult, ModelCache
+
+
+
+class test_model_cache(unittest.TestCase):
+    '''
+    Проверка кэша собранных моделей по структуре слоёв
+    '''
+
+    def build_graph(self, units: int = 2) -> LayerResult:
+        inputs = InputLayerNode.create_input(shape=(3,))
+        hidden = LayerNode.compile_layer("Dense", inputs, units=4)
+        return LayerNode.compile_layer("Dense", hidden, units=units)
+
+
+    def test_structure(self):
+        assert LayerResult.structure(self.build_graph()) == LayerResult.structure(self.build_graph())
+        assert LayerResult.structure(self.build_graph()) != LayerResult.structure(self.build_graph(units=3))
+
+        first, second = InputLayerNode.create_input(shape=(3,)), InputLayerNode.create_input(shape=(3,))
+        two_inputs = LayerNode.compile_layer("Add", first, second)
+        one_input = LayerNode.compile_layer("Add", first, first)
+        assert LayerResult.structure(two_inputs) != LayerResult.structure(one_input)
+
+
+    def test_hit(self):
+        cache = ModelCache()
+        model = CompileNode.compile_model(self.build_graph(), cache=cache, optimizer="sgd", loss="mse")
+
+        output = self.build_graph()
+        same = CompileNode.compile_model(output, cache=cache, optimizer="sgd", loss="mse")
+
+        assert same is model
+        assert not output.built
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+    def test_miss(self):
+        cache = ModelCache()
+        model = CompileNode.compile_model(self.build_graph(), cache=cache, optimizer="sgd", loss="mse")
+        other = CompileNode.compile_model(self.build_graph(units=3), cache=cache, optimizer="sgd", loss="mse")
+        recompiled = CompileNode.compile_model(self.build_graph(units=3), cache=cache, optimizer="adam", loss="mse")
+
+        assert other is not model and recompiled is not other
+        assert other.output_shape == (None, 3)
+        assert len(cache) == cache.capacity
+        # Модель, собранная до сброса сессии, продолжает работать
+        assert model.predict(np.ones((1, 3)), verbose=False).shape == (1, 2)
+
+
+    def test_lazy_layers(self):
+        output = self.build_graph()
+
+        assert not output.built
+        assert tuple(output.layer.shape) == (None, 2)
+        assert len(output.inputs) == 1
+
+
+    def test_transfer_weights(self):
+        cache = ModelCache()
+        model = CompileNode.compile_model(self.build_graph(), cache=cache, optimizer="sgd", loss="mse")
+        model.fit(np.ones((8, 3)), np.ones((8, 2)), epochs=1, verbose=False)
+
+        other = CompileNode.compile_model(self.build_graph(units=3), cache=cache, 
+                                          freeze_transferred=True, optimizer="sgd", loss="mse")
+
+        hidden, new_hidden = model.layers[1], other.layers[1]
+        assert new_hidden is not hidden
+        assert all(np.array_equal(new, old) for new, old in zip(new_hidden.get_weights(), hidden.get_weights()))
+        assert not new_hidden.trainable and other.layers[2].trainable
+
+
+    def test_no_transfer(self):
+        cache = ModelCache()
+        model = CompileNode.compile_model(self.build_graph(), cache=cache, optimizer="sgd", loss="mse")
+        other = CompileNode.compile_model(self.build_graph(units=3), cache=cache, 
+                                          transfer_weights=False, optimizer="sgd", loss="mse")
+
+        assert not all(np.array_equal(new, old) for new, old in 
+                       zip(other.layers[1].get_weights(), model.layers[1].get_weights()))
+
+
+    def test_no_transfer_unchanged(self):
+        # Нода скрытого слоя не пересобиралась, её выход уже построен и обучен
+        inputs = InputLayerNode.create_input(shape=(3,))
+        hidden = LayerNode.compile_layer("Dense", inputs, units=4)
+        cache = ModelCache()
+        model = CompileNode.compile_model(LayerNode.compile_layer("Dense", hidden, units=2), cache=cache,
+                                          optimizer="sgd", loss="mse")
+        model.fit(np.ones((8, 3)), np.ones((8, 2)), epochs=1, verbose=False)
+
+        other = CompileNode.compile_model(LayerNode.compile_layer("Dense", hidden, units=3), cache=cache,
+                                          transfer_weights=False, optimizer="sgd", loss="mse")
+
+        assert other.layers[1] is not model.layers[1]
+        assert not any(np.array_equal(new, old) for new, old in 
+                       zip(other.layers[1].get_weights(), model.layers[1].get_weights()))
@@ -4,6 +4,8 @@ import dearpygui.dearpygui as dpg
 
 from Src.node_builder import NodeBuilder
 from Src.Config.node_annotation import NodeAnnotation
+from Src.Config.node_list import node_list
+from Src.Graph import NodeRecord
 from Src.Nodes import AbstractNode, InputLayerNode
 from Src.Logging.logger_factory import Logger_factory
 from Tests.DPG_test import DPGUnitTest
@@ -81,3 +83,55 @@ class test_NodeBuilder(DPGUnitTest):
 
         assert isinstance(node, InputLayerNode)
         assert dpg.get_item_label(node_id) == "Input"
+
+
+    def test_build_graph(self):
+        builder = NodeBuilder(node_list, lambda x:x)
+        nodes = [NodeRecord("Input"), NodeRecord("Dense", [200, 0], {"units": 8}), 
+                 NodeRecord("Dense", [400, 0], {"units": 2})]
+        links = [[0, "OUTPUT", 1, "INPUT"], [1, "OUTPUT", 2, "INPUT"], [2, "OUTPUT", 0, "missing"]]
+
+        with dpg.window() as id:
+            with dpg.node_editor() as editor_id:
+                node_ids = builder.build_graph(nodes, links, editor_id)
+
+        assert [dpg.get_item_label(node_id) for node_id in node_ids] == ["Input", "Dense", "Dense"]
+        assert dpg.get_item_pos(node_ids[2]) == [400, 0]
+        assert len(builder.graph) == 3 and len(builder.graph.links) == 2
+        assert list(builder.graph.start_nodes) == [builder.graph.nodes[node_ids[0]]]
+
+        units = builder.graph.ports_of(builder.graph.nodes[node_ids[1]])["units"]
+        assert dpg.get_value(dpg.get_item_children(units, slot=1)[0]) == 8
+
+        with self.assertRaises(ValueError):
+            builder.build_graph([NodeRecord("Unknown")], [], editor_id)
+
+
+    def test_search_list(self):
+        builder = NodeBuilder(node_list, lambda x:x)
+
+        assert builder.index.search("dense")[0].label == "Dense"
+        assert "Conv2D" in [node.label for node in builder.index.search("conv")]
+        assert "MaxPooling2D" in [node.label for node in builder.index.search("convolutional")]
+        assert builder.index.search("save js")[0].label == "Save model as JSON"
+        # Ничего не нашлось по префиксу - ищем буквы названия по порядку
+        assert builder.index.search("mxplng2d")[0].label == "MaxPooling2D"
+        assert builder.index.search("") == []
+
+        with dpg.window() as id:
+            list_id = builder.build_list(id)
+
+        anchors = dpg.get_item_children(list_id, slot=1)
+        assert len(anchors) == len(node_list)
+        assert not dpg.get_item_children(anchors[0], slot=1)
+
+        builder.expand_list(anchors[0])
+        subanchor = dpg.get_item_children(anchors[0], slot=1)[0]
+        builder.expand_list(subanchor)
+        buttons = dpg.get_item_children(subanchor, slot=1)
+        assert [dpg.get_item_label(button) for button in buttons] == ["Tables data", "Images data"]
+
+        found = builder.search_list("dense")
+        assert found and not dpg.is_item_shown(list_id)
+        builder.search_list("")
+        assert dpg.is_item_shown(list_id)
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+
+import dearpygui.dearpygui as dpg
+
+from Src.node_builder import NodeBuilder
+from Src.Config.node_list import node_list
+from Src.Graph import NodeRecord
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_preflight(DPGUnitTest):
+    '''
+    Проверка графа до чтения данных и создания слоёв
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+
+
+    def build(self, nodes: list[NodeRecord], links: list[list]) -> tuple[NodeBuilder, list]:
+        builder = NodeBuilder(node_list, lambda x:x)
+
+        with dpg.window():
+            with dpg.node_editor() as editor_id:
+                node_ids = builder.build_graph(nodes, links, editor_id)
+
+        return builder, [builder.graph.nodes[node_id] for node_id in node_ids]
+
+
+    def test_shapes(self):
+        table = {"files": "Tests/X.txt", "delimiter": ","}
+        builder, (data, input, conv, dense, flatten) = self.build(
+            [NodeRecord("Tables data", parameters=table), NodeRecord("Input"),
+             NodeRecord("Conv2D", parameters={"filters": 4, "kernel_size": 3, "strides": 1}),
+             NodeRecord("Dense", parameters={"units": 3}), NodeRecord("Flatten")],
+            [[0, "shape", 1, "shape"], [1, "OUTPUT", 2, "INPUT"], [1, "OUTPUT", 3, "INPUT"]]
+        )
+
+        report = builder.preflight.check(builder.scheduler.plan().order)
+
+        # Без чтения файла известны только столбцы таблицы
+        assert report.shapes[data][1:] == (2,)
+        assert report.shapes[input] == (None, 2)
+        assert report.shapes[dense] == (None, 3)
+        # Conv2D не подходит таблица, а у Flatten нет входа
+        assert report.failed == {conv, flatten}
+        assert "не подключён" in report.errors[flatten][0]
+
+        compiled = builder.compile_graph(list(builder.graph.start_nodes))
+
+        assert data in compiled and dense in compiled
+        assert conv not in compiled and conv in builder.graph.dirty
+
+
+    def test_rows(self):
+        file, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(file, "w") as f:
+            f.write("0\n1\n1\n")
+        self.addCleanup(os.remove, path)
+
+        builder, (x, y, compile, fit) = self.build(
+            [NodeRecord("Tables data", parameters={"files": "Tests/X.txt", "delimiter": ","}),
+             NodeRecord("Tables data", parameters={"files": path, "delimiter": ","}),
+             NodeRecord("Compile model"), NodeRecord("Fit model", parameters={"epochs": 1})],
+            [[0, "OUTPUT", 3, "x"], [1, "OUTPUT", 3, "y"], [2, "OUTPUT", 3, "INPUT"]]
+        )
+
+        # Новая таблица ещё не прочитана, колличество её строк неизвестно и не проверяется
+        report = builder.preflight.check(builder.scheduler.plan().order)
+        assert y not in report.rows and list(report.errors) == [compile]
+
+        builder.compile_graph(list(builder.graph.start_nodes))
+        report = builder.preflight.check(builder.scheduler.plan().order)
+
+        assert report.rows == {x: 10000, y: 3}
+        assert list(report.errors) == [compile, fit]
+        assert "(10000)" in report.errors[fit][0] and "(3)" in report.errors[fit][0]
@@ -0,0 +1,122 @@
+import json
+import threading
+
+import dearpygui.dearpygui as dpg
+
+from Src.Graph import Graph, Scheduler
+from Src.Nodes import AbstractNode
+from Src.Config import Parameter
+from Src.Config.Annotations import ANode
+from Src.Enums.attr_type import AttrType
+from Src.Enums import ExecutorType
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_scheduler(DPGUnitTest):
+    '''
+    Проверка топологического планировщика компиляции графа
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+
+
+    def make_graph(self, count: int, links: list[tuple[int, int]]) -> tuple[Graph, list[AbstractNode]]:
+        graph = Graph()
+        nodes = []
+        for tag in range(count):
+            node = AbstractNode(tag, {"x": Parameter(AttrType.INPUT, ANode[object])}, lambda x: x)
+            graph.add_node(node, {f"{tag}.OUTPUT": "OUTPUT", f"{tag}.x": "x"})
+            nodes.append(node)
+
+        for node_out, node_in in links:
+            graph.link(f"{node_out}.OUTPUT", f"{node_in}.x")
+
+        return graph, nodes
+
+
+    def test_order(self):
+        graph, nodes = self.make_graph(5, [(0, 2), (1, 2), (2, 3), (0, 3), (3, 4)])
+
+        plan = Scheduler(graph).plan()
+
+        assert len(plan.order) == 5
+        position = {node: index for index, node in enumerate(plan.order)}
+        assert position[nodes[0]] < position[nodes[2]] < position[nodes[3]] < position[nodes[4]]
+        assert position[nodes[1]] < position[nodes[2]]
+        assert not plan.cyclic and not plan.blocked and not plan.unreachable
+
+
+    def test_cycle(self):
+        graph, nodes = self.make_graph(5, [(0, 1), (1, 2), (2, 1), (2, 3), (4, 4)])
+
+        plan = Scheduler(graph).plan()
+
+        assert plan.order == [nodes[0]]
+        assert plan.cyclic == {nodes[1], nodes[2]}
+        assert plan.blocked == {nodes[3]}
+        assert plan.unreachable == {nodes[4]}
+
+
+    def test_unreachable(self):
+        graph, nodes = self.make_graph(4, [(0, 1), (2, 3)])
+
+        plan = Scheduler(graph).plan([nodes[0]])
+
+        assert plan.order == [nodes[0], nodes[1]]
+        assert plan.unreachable == {nodes[2], nodes[3]}
+
+
+    def test_run(self):
+        graph, nodes = self.make_graph(4, [(0, 1), (1, 2)])
+        scheduler = Scheduler(graph)
+
+        report = scheduler.run(scheduler.plan(), lambda node: node is not nodes[1])
+
+        assert report.failed == [nodes[1]]
+        assert report.skipped == [nodes[2]]
+        assert set(report.executed) == {nodes[0], nodes[3]}
+
+
+    def test_dirty(self):
+        graph, nodes = self.make_graph(4, [(0, 1), (1, 2), (0, 3)])
+
+        plan = Scheduler(graph).plan(dirty=[nodes[1]])
+
+        assert plan.order == [nodes[1], nodes[2]]
+
+
+    def test_run_parallel(self):
+        graph, nodes = self.make_graph(5, [(0, 2), (1, 2), (2, 3)])
+        scheduler = Scheduler(graph, ExecutorType.THREAD, max_workers=2)
+        plan = scheduler.plan()
+
+        # Две независимые ноды должны выполняться одновременно, иначе барьер не пройти
+        barrier = threading.Barrier(2, timeout=5)
+        def execute(node: AbstractNode) -> bool:
+            if node in (nodes[0], nodes[1]): barrier.wait()
+            return node is not nodes[4]
+
+        report = scheduler.run(plan, execute)
+
+        assert report.executed == [node for node in plan.order if node is not nodes[4]]
+        assert report.failed == [nodes[4]]
+
+
+    def test_run_parallel_skipped(self):
+        graph, nodes = self.make_graph(4, [(0, 1), (1, 2), (0, 3)])
+        scheduler = Scheduler(graph, ExecutorType.THREAD, max_workers=4)
+
+        report = scheduler.run(scheduler.plan(), lambda node: node is not nodes[1])
+
+        assert report.failed == [nodes[1]]
+        assert report.skipped == [nodes[2]]
+        assert report.executed == [nodes[0], nodes[3]]
@@ -0,0 +1,49 @@
+import unittest
+
+from Src.Graph.shape_rules import ShapeRules, ShapeError
+
+
+
+class test_shape_rules(unittest.TestCase):
+    '''
+    Проверка вывода размерностей слоёв без keras
+    '''
+
+    def test_dense_conv(self):
+        assert ShapeRules.infer("Dense", [(None, 4)], {"units": 8}) == (None, 8)
+
+        kwargs = {"filters": 16, "kernel_size": 3, "strides": 2, "padding": "valid"}
+        assert ShapeRules.infer("Conv2D", [(None, 28, 28, 1)], kwargs) == (None, 13, 13, 16)
+        assert ShapeRules.infer("Conv2D", [(None, 28, 28, 1)], kwargs | {"padding": "same"}) == (None, 14, 14, 16)
+        assert ShapeRules.infer("MaxPooling2D", [(None, 13, 13, 16)], {"pool_size": [2, 2]}) == (None, 6, 6, 16)
+        assert ShapeRules.infer("Flatten", [(None, 6, 6, 16)], {}) == (None, 576)
+
+        # Таблица из одного признака не подходит свёртке
+        with self.assertRaises(ShapeError):
+            ShapeRules.infer("Conv2D", [(None, 4)], kwargs)
+
+        with self.assertRaises(ShapeError):
+            ShapeRules.infer("Conv2D", [(None, 2, 2, 1)], kwargs)
+
+
+    def test_merge(self):
+        assert ShapeRules.infer("Concatenate", [(None, 4), (None, 3)], {}) == (None, 7)
+        assert ShapeRules.infer("Add", [(None, 4), (None, 1)], {}) == (None, 4)
+
+        with self.assertRaises(ShapeError):
+            ShapeRules.infer("Concatenate", [(None, 4, 2), (None, 3, 3)], {})
+
+        with self.assertRaises(ShapeError):
+            ShapeRules.infer("Add", [(None, 4), (None, 3)], {})
+
+        with self.assertRaises(ShapeError):
+            ShapeRules.infer("Dense", [(None, 4), (None, 3)], {"units": 2})
+
+
+    def test_unknown(self):
+        # Неизвестный слой, неизвестный вход и некорректные параметры не являются ошибкой проверки
+        assert ShapeRules.infer("Conv2DTranspose", [(None, 4, 4, 1)], {}) is None
+        assert ShapeRules.infer("Dense", [None], {"units": 2}) is None
+        assert ShapeRules.infer("Dense", [(None, 4)], {"units": 0}) is None
+        assert ShapeRules.infer("Conv2D", [(None, 8, 8, 1)], {"filters": 2, "kernel_size": 3, "strides": 0}) is None
+        assert ShapeRules.infer("LSTM", [(None, 5, 3)], {"units": 4, "return_sequences": True}) == (None, 5, 4)
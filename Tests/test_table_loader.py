@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+
+from Src.Data import TableLoader
+
+
+
+class test_table_loader(unittest.TestCase):
+    '''
+    Проверка чтения таблиц блоками в нескольких потоках
+    '''
+
+    def write(self, text: str) -> str:
+        file, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(file, "w") as f:
+            f.write(text)
+
+        self.addCleanup(os.remove, path)
+        return path
+
+
+    def test_same_as_genfromtxt(self):
+        expected = np.genfromtxt("Tests/X.txt", delimiter=",", ndmin=2)
+
+        # Маленькие блоки, чтобы файл разбирался несколькими потоками
+        result = TableLoader(",", block_size=1024, max_workers=4).load("Tests/X.txt")
+
+        assert result.shape == expected.shape
+        assert np.array_equal(result, expected)
+
+
+    def test_header_footer(self):
+        path = self.write("x,y\n1,2\n3,\n\n5,6\n7,8\ntotal\n\n")
+
+        result = TableLoader(",", skip_header=True, skip_footer=True, block_size=8).load(path)
+        expected = np.genfromtxt(path, delimiter=",", skip_header=True, skip_footer=True, ndmin=2)
+
+        assert np.array_equal(result, expected, equal_nan=True)
+
+
+    def test_dtype(self):
+        path = self.write("1 2  3\n4\t5 6\n")
+
+        result = TableLoader(" ", dtype="float32").load(path)
+
+        assert result.dtype == np.float32
+        assert result.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+    def test_uneven_rows(self):
+        # Значений столько же, сколько в таблице 3x3, но строки разной длины
+        for delimiter in (",", " "):
+            path = self.write(f"1{delimiter}2{delimiter}3\n4{delimiter}5\n6{delimiter}7{delimiter}8{delimiter}9\n")
+
+            with self.assertRaises(ValueError):
+                np.genfromtxt(path, delimiter=delimiter.strip() or None, ndmin=2)
+            with self.assertRaises(ValueError):
+                TableLoader(delimiter).load(path)
+
+
+    def test_single_column(self):
+        path = self.write("1\n2\n3")
+
+        assert TableLoader(",").load(path).shape == (3, 1)
+
+
+    def test_shape(self):
+        path = self.write("x,y,z\n# comment\n1,2,3\n\n4,5,6\n7,8,9\ntotal\n")
+
+        loader = TableLoader(",", skip_header=True, skip_footer=True, block_size=8)
+
+        assert loader.shape(path) == (None, loader.load(path).shape[1]) == (None, 3)
+        assert TableLoader(" ").shape("Tests/y.txt") == (None, 1)
+
+
+    def test_warnings_scope(self):
+        path = self.write("1,2\n3,x\n" * 100)
+        filters = list(warnings.filters)
+
+        result = TableLoader(",", block_size=16, max_workers=4).load(path)
+
+        assert np.isnan(result[1, 1])
+        assert warnings.filters == filters
+        with self.assertWarns(DeprecationWarning):
+            np.fromstring("1,x", dtype=float, sep=",")
@@ -0,0 +1,85 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import dearpygui.dearpygui as dpg
+
+from Src.Enums import NodeState
+from Src.Nodes import AbstractNode
+from Src.Utils import ThemeRegistry
+from Src.Logging.logger_factory import Logger_factory
+from Tests.DPG_test import DPGUnitTest
+
+
+
+class test_theme_registry(DPGUnitTest):
+    '''
+    Проверка общих тем нод
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        dpg.create_viewport(title='Custom Title')
+        with open("Tests/logger_config.json") as f:
+            config = json.load(f)
+
+        log_factory = Logger_factory(config)
+        cls.editor = dpg.add_node_editor(parent=cls.parent)
+
+
+    def build_node(self) -> AbstractNode:
+        node_id = dpg.add_node(label="Example", parent=self.editor)
+        return AbstractNode(node_id, {}, lambda: None, "docs")
+
+
+    def test_shared(self):
+        first, second = self.build_node(), self.build_node()
+        first.default_theme()
+        second.default_theme()
+
+        assert dpg.get_item_theme(first.node_tag) == dpg.get_item_theme(second.node_tag)
+        assert ThemeRegistry.node(first.color) != ThemeRegistry.node(first.color, NodeState.ERROR)
+        assert ThemeRegistry.port((1, 2, 3, 255)) == ThemeRegistry.port((1, 2, 3, 255))
+
+
+    def test_no_leak(self):
+        node = self.build_node()
+        node.raise_error("error")
+        node.default_theme()
+        items = len(dpg.get_all_items())
+
+        for _ in range(10):
+            node.raise_error("error")
+            node.raise_error("error")
+            node.default_theme()
+
+        assert len(dpg.get_all_items()) == items
+        assert dpg.get_item_theme(node.node_tag) == ThemeRegistry.node(node.color)
+
+
+    def test_parallel_errors(self):
+        # Ноды собираются в пуле потоков, ошибки разных нод не должны попадать друг в друга
+        nodes = [self.build_node() for _ in range(4)]
+
+        def raise_errors(number: int):
+            for _ in range(1000): nodes[number].raise_error(f"node {number}", "error")
+
+        # Потоки переключаются как можно чаще, чтобы вызовы dpg разных нод перемешались
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(len(nodes)) as pool:
+                list(pool.map(raise_errors, range(len(nodes))))
+        finally:
+            sys.setswitchinterval(interval)
+
+        for number, node in enumerate(nodes):
+            attr = dpg.get_item_parent(node._error_id)
+            # Подсказка создаётся рядом с элементом, к которому она привязана
+            text, tooltip = dpg.get_item_children(attr, slot=1)
+
+            assert dpg.get_item_children(node.node_tag, slot=1) == [attr]
+            assert text == node._error_id
+            assert [dpg.get_value(text) for text in dpg.get_item_children(tooltip, slot=1)] == \
+                ["error:", f"node {number}"]
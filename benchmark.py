@@ -0,0 +1,235 @@
+'''
+Замер запуска приложения: время импортов по пакетам, время каждого этапа из main.py,
+время от старта процесса до первого кадра и время первой сборки графа.
+
+Каждый замер идёт в отдельном процессе (python -X importtime), чтобы импорты были холодными,
+результат печатается или сохраняется в JSON:
+
+    python benchmark.py --repeat 5 --output startup.json
+
+Без дисплея (или с --no-viewport) окно не показывается и первый кадр не замеряется.
+'''
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import version, PackageNotFoundError
+
+
+VERSION = 1
+PACKAGES = ("dearpygui", "keras", "tensorflow", "numpy")
+IMPORT_TOP = 15
+
+
+def report(phase: str, start: float, **extra):
+    '''
+    Напечатать замер этапа отдельной строкой, чтобы родительский процесс получил
+    уже сделанные замеры, даже если процесс упадёт на следующем этапе.
+    '''
+    print(json.dumps({"phase": phase, "seconds": time.perf_counter() - start, "at": time.time()} | extra),
+          flush=True)
+
+
+def run_phases(viewport: bool, compile: bool):
+    '''
+    Этапы запуска в том же порядке, что и в main.py. Выполняется в дочернем процессе.
+    '''
+    start = time.perf_counter()
+    import dearpygui.dearpygui as dpg
+    from Src.Logging import Logger_factory
+    from Src.node_editor import NodeEditor
+    report("import", start)
+
+    start = time.perf_counter()
+    dpg.create_context()
+    dpg.create_viewport(title='Benchmark')
+    report("create_context", start)
+
+    start = time.perf_counter()
+    with open("Src/Logging/logger_config.json") as f:
+        config = json.load(f)
+    log_factory = Logger_factory(config)
+    report("logger_factory", start)
+
+    start = time.perf_counter()
+    node_editor = NodeEditor(minimap=True, minimap_location=dpg.mvNodeMiniMap_Location_TopRight)
+    report("node_editor", start)
+
+    start = time.perf_counter()
+    with dpg.font_registry():
+        with dpg.font("notomono-regular.ttf", 18, default_font=True, tag="Default font"):
+            dpg.add_font_range_hint(dpg.mvFontRangeHint_Cyrillic)
+    dpg.bind_font("Default font")
+    report("fonts", start)
+
+    start = time.perf_counter()
+    with dpg.window(tag="Prime"):
+        node_editor.show("Prime")
+        log_factory.show("Prime")
+    report("window", start)
+
+    # Список нод строится внутри NodeEditor, поэтому отдельно строим его ещё раз в скрытом окне
+    start = time.perf_counter()
+    with dpg.window(show=False) as window:
+        node_editor.builder.build_list(window)
+    report("build_list", start)
+    dpg.delete_item(window)
+
+    if viewport:
+        start = time.perf_counter()
+        dpg.setup_dearpygui()
+        dpg.show_viewport(minimized=True)
+        dpg.set_primary_window("Prime", True)
+        report("setup", start)
+
+        start = time.perf_counter()
+        dpg.render_dearpygui_frame()
+        report("first_frame", start)
+
+    if compile:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            compiled = first_compile(node_editor, directory)
+            report("first_compile", start, compiled=compiled)
+
+    # Завершение (destroy_context, потоки TensorFlow) не замеряется и иногда падает вместе с TensorFlow,
+    # поэтому процесс сразу завершается, все замеры уже напечатаны
+    os._exit(0)
+
+
+def first_compile(node_editor, directory: str) -> int:
+    '''
+    Собрать небольшой граф (Tables data -> Input -> Dense -> Compile model) с холодным keras.
+
+    Returns:
+        int - колличество собранных нод
+    '''
+    from Src.Graph import GraphFile, NodeRecord
+
+    data = os.path.join(directory, "data.csv")
+    with open(data, "w") as file:
+        file.write("\n".join(",".join(str(row * column) for column in range(4)) for row in range(64)))
+
+    graph = os.path.join(directory, "graph.json")
+    GraphFile(nodes=[NodeRecord("Input"), NodeRecord("Tables data", parameters={"files": data}),
+                     NodeRecord("Dense", parameters={"units": 2}), NodeRecord("Compile model")],
+              links=[[1, "shape", 0, "shape"], [0, "OUTPUT", 2, "INPUT"], [2, "OUTPUT", 3, "INPUT"]]).save(graph)
+
+    node_editor.load(graph)
+    return len(node_editor.builder.compile_graph(list(node_editor.graph.start_nodes)))
+
+
+def import_times(stderr: str) -> dict[str, float]:
+    '''
+    Время импорта (в секундах) по пакетам верхнего уровня из вывода python -X importtime.
+    Складывается собственное время каждого модуля, поэтому keras, импортированный из Src,
+    попадает в keras, а не в Src.
+    '''
+    packages = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line: continue
+        own, _, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit(): continue
+
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(own)
+
+    return {package: microseconds / 1e6 for package, microseconds in
+            sorted(packages.items(), key=lambda item: -item[1])[:IMPORT_TOP]}
+
+
+def measure(viewport: bool, compile: bool) -> dict:
+    '''
+    Один замер в новом процессе.
+    '''
+    command = [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child"]
+    if not viewport: command.append("--no-viewport")
+    if not compile: command.append("--no-compile")
+
+    spawned = time.time()
+    result = subprocess.run(command, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    run = {"phases": {}, "since_start": {}, "imports": import_times(result.stderr), "errors": []}
+    for line in result.stdout.splitlines():
+        if not line.startswith("{"): continue
+        phase = json.loads(line)
+        run["phases"][phase["phase"]] = phase.pop("seconds")
+        run["since_start"][phase["phase"]] = phase.pop("at") - spawned
+        if phase.get("compiled") is not None: run["compiled"] = phase["compiled"]
+
+    if result.returncode != 0:
+        run["errors"].append(f"Процесс завершился с кодом {result.returncode}: {result.stderr.strip()[-500:]}")
+
+    return run
+
+
+def summary(runs: list[dict]) -> dict:
+    '''
+    Медианы по всем замерам.
+    '''
+    result = {}
+
+    for key in ("phases", "since_start", "imports"):
+        values = {}
+        for run in runs:
+            for name, seconds in run[key].items():
+                values.setdefault(name, []).append(seconds)
+        result[key] = {name: statistics.median(seconds) for name, seconds in values.items()}
+
+    return result
+
+
+def has_display() -> bool:
+    return sys.platform != "linux" or bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def package_versions() -> dict[str, str | None]:
+    versions = {}
+    for package in PACKAGES:
+        try: versions[package] = version(package)
+        except PackageNotFoundError: versions[package] = None
+
+    return versions
+
+
+def main(argv: list[str] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Замер запуска GraphNet")
+    parser.add_argument("--repeat", type=int, default=3, help="колличество замеров")
+    parser.add_argument("--output", help="файл для JSON, по умолчанию - вывод в консоль")
+    parser.add_argument("--no-viewport", action="store_true", help="не показывать окно и не замерять первый кадр")
+    parser.add_argument("--no-compile", action="store_true", help="не замерять первую сборку графа")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_phases(not args.no_viewport, not args.no_compile)
+        return {}
+
+    viewport = not args.no_viewport and has_display()
+    runs = [measure(viewport, not args.no_compile) for _ in range(args.repeat)]
+    result = {"version": VERSION,
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "packages": package_versions(),
+              "viewport": viewport,
+              "runs": runs,
+              "summary": summary(runs)}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, ensure_ascii=False, indent=4)
+    else:
+        print(json.dumps(result, ensure_ascii=False, indent=4))
+
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,8 @@ dpg.setup_dearpygui()
 dpg.show_viewport()
 dpg.set_primary_window("Prime", True)
 dpg.set_global_font_scale(1)
+# Keras загружается в фоне уже после того, как окно показано
+dpg.set_frame_callback(1, lambda: node_editor.warm_up())
 dpg.start_dearpygui()
 
 dpg.destroy_context()